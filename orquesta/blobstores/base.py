@@ -0,0 +1,241 @@
+# Copyright 2019 Extreme Networks, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+import abc
+import collections
+import hashlib
+import json
+import logging
+
+import six
+
+from orquesta import exceptions as exc
+from orquesta.utils import plugin as plugin_util
+
+
+LOG = logging.getLogger(__name__)
+
+DEFAULT_THRESHOLD = 65536
+
+# The key in the reference that replaces the value that is moved to the blob store.
+BLOB_REF_KEY = '__blob__'
+
+# The key in the wrapper of the user values that are dicts with the reserved keys. The values
+# are wrapped when written so the values are not taken as references when resolved.
+BLOB_ESCAPE_KEY = '__blob_value__'
+
+# The blob store is configured for the process. The values that are larger than the
+# threshold in bytes when encoded as JSON are moved to the blob store. If the blob store
+# is not configured, then the values are not moved.
+_BLOB_STORE = None
+_THRESHOLD = DEFAULT_THRESHOLD
+
+
+def get_blob_store_module(name):
+    return plugin_util.get_module('orquesta.blobstores', name)
+
+
+def get_blob_store_instance(name, *args, **kwargs):
+    return plugin_util.get_instance('orquesta.blobstores', name, *args, **kwargs)
+
+
+def set_blob_store(store, threshold=DEFAULT_THRESHOLD):
+    global _BLOB_STORE
+    global _THRESHOLD
+
+    if store is not None and not isinstance(store, BlobStore):
+        raise TypeError('The blob store is not type of BlobStore.')
+
+    if threshold < 0:
+        raise ValueError('The threshold of the blob store cannot be negative.')
+
+    _BLOB_STORE = store
+    _THRESHOLD = threshold
+
+
+def get_blob_store():
+    return _BLOB_STORE
+
+
+def get_threshold():
+    return _THRESHOLD
+
+
+class BlobRef(dict):
+    # The reference to the value in the blob store. The references and the escaped values
+    # are typed when created so the values are not escaped again when written again, such
+    # as the workflow inputs in the initial context. The values written by the conductor are
+    # escaped and so the dicts with the reserved keys that are restored from the serialized
+    # conductor are the references and the escaped values.
+    pass
+
+
+class EscapedValue(dict):
+    pass
+
+
+def is_ref(value):
+    return (type(value) is BlobRef or type(value) is dict) and BLOB_REF_KEY in value
+
+
+def is_escaped(value):
+    return (type(value) is EscapedValue or type(value) is dict) and BLOB_ESCAPE_KEY in value
+
+
+def _is_reserved(value):
+    return type(value) is dict and (BLOB_REF_KEY in value or BLOB_ESCAPE_KEY in value)
+
+
+def _needs_escape(value):
+    return _is_reserved(value) or (type(value) is list and any(_is_reserved(v) for v in value))
+
+
+def _needs_resolve(value):
+    if is_ref(value) or is_escaped(value):
+        return True
+
+    return type(value) is list and any(is_ref(v) or is_escaped(v) for v in value)
+
+
+def escape(value):
+    # Wrap the user values that are dicts with the reserved keys. The items of the lists are
+    # also wrapped since the lists of the results of the items of a with items task are
+    # resolved by item.
+    if _is_reserved(value):
+        return EscapedValue({BLOB_ESCAPE_KEY: value})
+
+    if type(value) is list and any(_is_reserved(v) for v in value):
+        return [EscapedValue({BLOB_ESCAPE_KEY: v}) if _is_reserved(v) else v for v in value]
+
+    return value
+
+
+def offload(value):
+    # Move the value to the blob store if the value is larger than the threshold and return
+    # the reference. The blobs are keyed by the hash of the content so the same value is
+    # stored once.
+    value = escape(value)
+
+    if _BLOB_STORE is None or value is None or isinstance(value, (bool, float)):
+        return value
+
+    if isinstance(value, six.integer_types):
+        return value
+
+    if isinstance(value, six.string_types) and len(value) * 6 < _THRESHOLD:
+        return value
+
+    if type(value) is BlobRef:
+        return value
+
+    data = json.dumps(value, sort_keys=True).encode('utf-8')
+
+    if len(data) < _THRESHOLD:
+        return value
+
+    key = hashlib.sha256(data).hexdigest()
+
+    if not _BLOB_STORE.has(key):
+        _BLOB_STORE.put(key, data)
+
+    return BlobRef({BLOB_REF_KEY: key, 'size': len(data)})
+
+
+def offload_values(values):
+    if not values:
+        return values
+
+    if _BLOB_STORE is None and not any(_needs_escape(v) for v in six.itervalues(values)):
+        return values
+
+    return {k: offload(v) for k, v in six.iteritems(values)}
+
+
+def resolve(value):
+    # The references are resolved when the values are accessed such as by the expressions.
+    # The list of the results of the items of a with items task is also resolved.
+    if is_ref(value):
+        if _BLOB_STORE is None:
+            raise exc.BlobStoreError('The blob store to resolve the reference is not set.')
+
+        # The value is escaped before it is moved to the blob store.
+        return resolve(json.loads(_BLOB_STORE.get(value[BLOB_REF_KEY]).decode('utf-8')))
+
+    if is_escaped(value):
+        return value[BLOB_ESCAPE_KEY]
+
+    if type(value) is list and any(is_ref(v) or is_escaped(v) for v in value):
+        return [resolve(v) for v in value]
+
+    return value
+
+
+def resolve_values(values):
+    if not values or not any(_needs_resolve(v) for v in six.itervalues(values)):
+        return values
+
+    return {k: resolve(v) for k, v in six.iteritems(values)}
+
+
+class ResolvingMapping(collections.Mapping):
+    # The values are resolved when accessed so the values in the blob store that are not
+    # accessed are not read. The resolved values are kept for the next access.
+
+    def __init__(self, values):
+        self._values = values
+        self._resolved = {}
+
+    def __getitem__(self, key):
+        if key not in self._resolved:
+            self._resolved[key] = resolve(self._values[key])
+
+        return self._resolved[key]
+
+    def __iter__(self):
+        return iter(self._values)
+
+    def __len__(self):
+        return len(self._values)
+
+    def __repr__(self):
+        return repr(dict(self))
+
+
+def get_resolving_mapping(values):
+    # The values are returned as is if there is nothing to resolve.
+    if not any(_needs_resolve(v) for v in six.itervalues(values)):
+        return values
+
+    return ResolvingMapping(values)
+
+
+@six.add_metaclass(abc.ABCMeta)
+class BlobStore(object):
+
+    @abc.abstractmethod
+    def put(self, key, data):
+        raise NotImplementedError()
+
+    @abc.abstractmethod
+    def get(self, key):
+        raise NotImplementedError()
+
+    @abc.abstractmethod
+    def has(self, key):
+        raise NotImplementedError()
+
+    @abc.abstractmethod
+    def delete(self, key):
+        raise NotImplementedError()
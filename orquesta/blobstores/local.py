@@ -0,0 +1,92 @@
+# Copyright 2019 Extreme Networks, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+import errno
+import logging
+import os
+import re
+import tempfile
+
+from orquesta.blobstores import base as blob_base
+from orquesta import exceptions as exc
+
+
+LOG = logging.getLogger(__name__)
+
+KEY_PATTERN = re.compile(r'^[0-9a-zA-Z_\-]+$')
+
+
+class LocalDirectoryBlobStore(blob_base.BlobStore):
+
+    def __init__(self, path):
+        if not path:
+            raise ValueError('The path of the blob store is not provided.')
+
+        self.path = os.path.abspath(path)
+
+        if not os.path.isdir(self.path):
+            os.makedirs(self.path)
+
+    def _get_blob_path(self, key):
+        if not key or not KEY_PATTERN.match(key):
+            raise ValueError('The blob key "%s" is not valid.' % key)
+
+        # The blobs are spread across subdirectories by the prefix of the key.
+        return os.path.join(self.path, key[:2], key)
+
+    def put(self, key, data):
+        blob_path = self._get_blob_path(key)
+        blob_dir = os.path.dirname(blob_path)
+
+        try:
+            os.makedirs(blob_dir)
+        except OSError as e:
+            if e.errno != errno.EEXIST:
+                raise
+
+        # The blob is written to a temporary file and then renamed so readers never see a
+        # partially written blob.
+        fd, tmp_path = tempfile.mkstemp(dir=blob_dir)
+
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                f.write(data)
+
+            os.rename(tmp_path, blob_path)
+        except Exception:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+
+            raise
+
+    def get(self, key):
+        try:
+            with open(self._get_blob_path(key), 'rb') as f:
+                return f.read()
+        except IOError as e:
+            if e.errno == errno.ENOENT:
+                raise exc.BlobNotFound(key)
+
+            raise
+
+    def has(self, key):
+        return os.path.isfile(self._get_blob_path(key))
+
+    def delete(self, key):
+        try:
+            os.remove(self._get_blob_path(key))
+        except OSError as e:
+            if e.errno != errno.ENOENT:
+                raise
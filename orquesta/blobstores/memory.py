@@ -0,0 +1,43 @@
+# Copyright 2019 Extreme Networks, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+import logging
+
+from orquesta.blobstores import base as blob_base
+from orquesta import exceptions as exc
+
+
+LOG = logging.getLogger(__name__)
+
+
+class MemoryBlobStore(blob_base.BlobStore):
+
+    def __init__(self):
+        self._blobs = {}
+
+    def put(self, key, data):
+        self._blobs[key] = bytes(data)
+
+    def get(self, key):
+        if key not in self._blobs:
+            raise exc.BlobNotFound(key)
+
+        return self._blobs[key]
+
+    def has(self, key):
+        return key in self._blobs
+
+    def delete(self, key):
+        self._blobs.pop(key, None)
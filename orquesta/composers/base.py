@@ -16,16 +16,36 @@ import abc
 import logging
 import six
 
+from orquesta.utils import cache as cache_util
 from orquesta.utils import plugin as plugin_util
 
 
 LOG = logging.getLogger(__name__)
 
+DEFAULT_GRAPH_CACHE_SIZE = 500
+
+# The composed graphs are shared by the conductors in the process. The graphs are keyed
+# by the composer and the fingerprint of the spec since the same spec always composes
+# into the same graph.
+_GRAPH_CACHE = cache_util.LRUCache(DEFAULT_GRAPH_CACHE_SIZE)
+
 
 def get_composer(catalog):
     return plugin_util.get_module('orquesta.composers', catalog)
 
 
+def get_graph_cache_stats():
+    return _GRAPH_CACHE.get_stats()
+
+
+def set_graph_cache_size(size):
+    _GRAPH_CACHE.resize(size)
+
+
+def clear_graph_cache():
+    _GRAPH_CACHE.clear()
+
+
 @six.add_metaclass(abc.ABCMeta)
 class WorkflowComposer(object):
     wf_spec_type = None
@@ -34,3 +54,15 @@ class WorkflowComposer(object):
     @abc.abstractmethod
     def compose(cls, spec):
         raise NotImplementedError()
+
+    @classmethod
+    def get_graph(cls, spec):
+        # Return the read only graph composed from the spec. The graph is composed only
+        # if there is no graph cached for the spec.
+        def compose(key):
+            wf_graph = cls.compose(spec)
+            wf_graph.set_read_only()
+
+            return wf_graph
+
+        return _GRAPH_CACHE.get((cls, spec.get_fingerprint()), compose)
@@ -12,12 +12,15 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import collections
 import copy
+import functools
 import logging
 import six
+import threading
 
-from six.moves import queue
 
+from orquesta.blobstores import base as blob_base
 from orquesta import constants
 from orquesta import events
 from orquesta import exceptions as exc
@@ -26,7 +29,9 @@ from orquesta import graphing
 from orquesta import machines
 from orquesta.specs import base as spec_base
 from orquesta.specs import loader as spec_loader
+from orquesta.specs import registry as spec_registry
 from orquesta import statuses
+from orquesta.utils import binary as binary_util
 from orquesta.utils import context as ctx_util
 from orquesta.utils import dictionary as dict_util
 from orquesta.utils import plugin as plugin_util
@@ -35,6 +40,138 @@ from orquesta.utils import plugin as plugin_util
 LOG = logging.getLogger(__name__)
 
 
+def synchronized(func):
+    # Hold the lock of the conductor, if enabled, for the duration of the call.
+    @functools.wraps(func)
+    def wrapper(self, *args, **kwargs):
+        if self._lock is None:
+            return func(self, *args, **kwargs)
+
+        with self._lock:
+            return func(self, *args, **kwargs)
+
+    return wrapper
+
+
+def _get_read_only_view(value):
+    if isinstance(value, dict):
+        return ReadOnlyMappingView(value)
+
+    if isinstance(value, list):
+        return ReadOnlySequenceView(value)
+
+    return value
+
+
+class ReadOnlyMappingView(collections.Mapping):
+    # The view wraps the underlying dict without copying it. Nested dicts and lists are
+    # wrapped on access so the underlying data cannot be modified thru the view. Since
+    # the view is read only, a deep copy of the view returns the view itself. Use the
+    # serialize method to get a copy of the underlying data as plain types.
+
+    def __init__(self, data):
+        self._data = data
+
+    def __getitem__(self, key):
+        return _get_read_only_view(self._data[key])
+
+    def __iter__(self):
+        return iter(self._data)
+
+    def __len__(self):
+        return len(self._data)
+
+    def __eq__(self, other):
+        if isinstance(other, ReadOnlyMappingView):
+            other = other.serialize()
+
+        return self.serialize() == other if isinstance(other, dict) else NotImplemented
+
+    def __ne__(self, other):
+        result = self.__eq__(other)
+
+        return result if result is NotImplemented else not result
+
+    __hash__ = None
+
+    def __copy__(self):
+        return self
+
+    def __deepcopy__(self, memo):
+        return self
+
+    def __repr__(self):
+        return repr(self._data)
+
+    def serialize(self):
+        return copy.deepcopy(self._data)
+
+
+class ReadOnlySequenceView(collections.Sequence):
+
+    def __init__(self, data):
+        self._data = data
+
+    def __getitem__(self, index):
+        return _get_read_only_view(self._data[index])
+
+    def __len__(self):
+        return len(self._data)
+
+    def __eq__(self, other):
+        if isinstance(other, ReadOnlySequenceView):
+            other = other.serialize()
+
+        return self.serialize() == other if isinstance(other, list) else NotImplemented
+
+    def __ne__(self, other):
+        result = self.__eq__(other)
+
+        return result if result is NotImplemented else not result
+
+    __hash__ = None
+
+    def __copy__(self):
+        return self
+
+    def __deepcopy__(self, memo):
+        return self
+
+    def __repr__(self):
+        return repr(self._data)
+
+    def serialize(self):
+        return copy.deepcopy(self._data)
+
+
+class WorkflowStateView(ReadOnlyMappingView):
+    # The view is used as the "__state" in the context for expression evaluation. The
+    # attributes of the workflow state are read on access so the view always reflects
+    # the current workflow state and there is no copy made when the view is created.
+    _keys = ['contexts', 'routes', 'sequence', 'staged', 'status', 'tasks']
+
+    def __init__(self, workflow_state):
+        self._workflow_state = workflow_state
+
+    def __getitem__(self, key):
+        if key not in self._keys:
+            raise KeyError(key)
+
+        return _get_read_only_view(getattr(self._workflow_state, key))
+
+    def __iter__(self):
+        return iter(self._keys)
+
+    def __len__(self):
+        return len(self._keys)
+
+    def __repr__(self):
+        return repr(self.serialize())
+
+    def serialize(self):
+        return self._workflow_state.serialize()
+
+
 class WorkflowState(object):
 
     def __init__(self, conductor=None):
@@ -46,34 +183,211 @@ class WorkflowState(object):
         self.status = statuses.UNSET
         self.tasks = dict()
 
-    def serialize(self):
-        return {
-            'contexts': copy.deepcopy(self.contexts),
-            'routes': copy.deepcopy(self.routes),
-            'sequence': copy.deepcopy(self.sequence),
-            'staged': copy.deepcopy(self.staged),
+        # The revisions are used to track which task state entries are updated since
+        # a checkpoint. The revisions are not serialized and only applicable for this
+        # instance of the workflow state.
+        self._revision = 0
+        self._task_state_revisions = dict()
+
+    @property
+    def contexts(self):
+        return self._contexts
+
+    @contexts.setter
+    def contexts(self, value):
+        # The contexts added through add_context are stored by content so the contexts
+        # share the values that are published more than once such as in cycles. The store
+        # is built from the contexts on the first context added after the list is replaced.
+        self._contexts = value
+        self._context_store = None
+
+    def add_context(self, ctx):
+        # The values that are larger than the threshold are moved to the blob store if
+        # configured and the context refers to the values in the blob store.
+        ctx = blob_base.offload_values(ctx)
+
+        if self._context_store is None:
+            self._context_store = ctx_util.ValueStore()
+
+            for i, existing_ctx in enumerate(self._contexts):
+                self._contexts[i] = self._context_store.intern(existing_ctx)
+
+        self._contexts.append(self._context_store.intern(ctx))
+
+        return len(self._contexts) - 1
+
+    @property
+    def sequence(self):
+        return self._sequence
+
+    @sequence.setter
+    def sequence(self, value):
+        # The number of task state entries for each status is tracked so checking whether
+        # there are tasks in certain statuses does not need to scan the sequence. The counts
+        # are maintained by set_task_status and rebuilt when the sequence is replaced.
+        self._sequence = value
+        self._task_status_counts = dict()
+
+        for task_state in self._sequence:
+            self._count_task_status(task_state.get('status'), 1)
+
+    def _count_task_status(self, status, increment):
+        if status is None:
+            return
+
+        self._task_status_counts[status] = self._task_status_counts.get(status, 0) + increment
+
+    def set_task_status(self, task_state, status):
+        self._count_task_status(task_state.get('status'), -1)
+        self._count_task_status(status, 1)
+        task_state['status'] = status
+
+    def get_task_status_count(self, statuses):
+        return sum([self._task_status_counts.get(s, 0) for s in statuses])
+
+    @property
+    def staged(self):
+        return self._staged
+
+    @staged.setter
+    def staged(self, value):
+        # The staged tasks are indexed by task id and route for lookup. The tasks that
+        # are ready are tracked separately with the order the tasks are staged so the
+        # list of staged tasks does not need to be scanned. The index is rebuilt when
+        # the list is replaced such as on deserialization.
+        self._staged = value
+        self._staged_idx = dict()
+        self._staged_items = dict()
+        self._staged_ready = dict()
+        self._staged_count = 0
+
+        for entry in self._staged:
+            self._index_staged_task(entry)
+
+    def _index_staged_task(self, entry):
+        staged_task_key = (entry['id'], entry['route'])
+
+        if staged_task_key in self._staged_idx:
+            return
+
+        self._staged_count += 1
+        self._staged_idx[staged_task_key] = (self._staged_count, entry)
+
+        if entry['ready'] is True:
+            self._staged_ready[staged_task_key] = self._staged_count
+
+    def serialize(self, deep_copy=True):
+        # If not deep copied, the data refers to the workflow state and must not be modified.
+        data = {
+            'contexts': self.contexts,
+            'routes': self.routes,
+            'sequence': self.sequence,
+            'staged': self.staged,
             'status': self.status,
-            'tasks': copy.deepcopy(self.tasks)
+            'tasks': self.tasks
         }
 
+        return copy.deepcopy(data) if deep_copy else data
+
     @classmethod
-    def deserialize(cls, data):
+    def deserialize(cls, data, deep_copy=True, revision=0):
+        # If not deep copied, the workflow state takes ownership of the data.
+        if deep_copy:
+            data = copy.deepcopy(data)
+
         instance = cls()
-        instance.contexts = copy.deepcopy(data.get('contexts', list()))
-        instance.routes = copy.deepcopy(data.get('routes', list()))
-        instance.sequence = copy.deepcopy(data.get('sequence', list()))
-        instance.staged = copy.deepcopy(data.get('staged', dict()))
+        instance._revision = revision
+        instance.contexts = data.get('contexts', list())
+        instance.routes = data.get('routes', list())
+        instance.sequence = data.get('sequence', list())
+        instance.staged = data.get('staged', list())
         instance.status = data.get('status', statuses.UNSET)
-        instance.tasks = copy.deepcopy(data.get('tasks', dict()))
+        instance.tasks = data.get('tasks', dict())
 
         return instance
 
+    @property
+    def revision(self):
+        return self._revision
+
+    def get_checkpoint(self):
+        return {
+            'contexts': len(self.contexts),
+            'routes': len(self.routes),
+            'sequence': len(self.sequence),
+            'revision': self._revision
+        }
+
+    def mark_task_state_updated(self, task_state_idx):
+        self._revision += 1
+        self._task_state_revisions[task_state_idx] = self._revision
+
+    def serialize_delta(self, since):
+        # The contexts, routes, and sequence are append only. Task state entries in the
+        # sequence that are updated since the checkpoint are included along with the new
+        # entries. The staged tasks are included as is because entries are modified and
+        # removed in place and the list is bounded by the number of tasks in progress.
+        seq_idxs = set(range(since['sequence'], len(self.sequence)))
+
+        seq_idxs.update([
+            idx for idx, revision in six.iteritems(self._task_state_revisions)
+            if revision > since['revision'] and idx < since['sequence']
+        ])
+
+        return {
+            'contexts': copy.deepcopy(self.contexts[since['contexts']:]),
+            'routes': copy.deepcopy(self.routes[since['routes']:]),
+            'sequence': [[idx, copy.deepcopy(self.sequence[idx])] for idx in sorted(seq_idxs)],
+            'staged': copy.deepcopy(self.staged),
+            'status': self.status
+        }
+
+    @staticmethod
+    def apply_delta(data, since, delta):
+        for key in ['contexts', 'routes', 'sequence']:
+            if len(data.get(key, list())) != since[key]:
+                raise exc.WorkflowDeltaError(
+                    'The number of entries in "%s" does not match the checkpoint.' % key
+                )
+
+        data.setdefault('contexts', list()).extend(copy.deepcopy(delta['contexts']))
+        data.setdefault('routes', list()).extend(copy.deepcopy(delta['routes']))
+        data['staged'] = copy.deepcopy(delta['staged'])
+        data['status'] = delta['status']
+
+        sequence = data.setdefault('sequence', list())
+        tasks = data.setdefault('tasks', dict())
+
+        for idx, task_state_entry in delta['sequence']:
+            if idx < len(sequence):
+                sequence[idx] = copy.deepcopy(task_state_entry)
+                continue
+
+            if idx != len(sequence):
+                raise exc.WorkflowDeltaError('The task state entry %s is out of order.' % idx)
+
+            # The task state pointer always refer to the latest entry for the task route.
+            sequence.append(copy.deepcopy(task_state_entry))
+            task_state_entry_id = constants.TASK_STATE_ROUTE_FORMAT % (
+                task_state_entry['id'],
+                str(task_state_entry['route'])
+            )
+            tasks[task_state_entry_id] = idx
+
+        return data
+
+    def get_view(self):
+        return WorkflowStateView(self)
+
     def get_task(self, task_id, task_route):
         return self.sequence[
             self.tasks[constants.TASK_STATE_ROUTE_FORMAT % (task_id, str(task_route))]
         ]
 
     def get_tasks_by_status(self, statuses):
+        if self.get_task_status_count(statuses) <= 0:
+            return []
+
         return [t for t in self.sequence if t['status'] in statuses]
 
     def get_terminal_tasks(self):
@@ -84,30 +398,32 @@ class WorkflowState(object):
 
     @property
     def has_active_tasks(self):
-        return len(self.get_tasks_by_status(statuses.ACTIVE_STATUSES)) > 0
+        return self.get_task_status_count(statuses.ACTIVE_STATUSES) > 0
 
     @property
     def has_pausing_tasks(self):
-        return len(self.get_tasks_by_status([statuses.PAUSING])) > 0
+        return self.get_task_status_count([statuses.PAUSING]) > 0
 
     @property
     def has_paused_tasks(self):
-        return len(self.get_tasks_by_status([statuses.PAUSED, statuses.PENDING])) > 0
+        return self.get_task_status_count([statuses.PAUSED, statuses.PENDING]) > 0
 
     @property
     def has_canceling_tasks(self):
-        return len(self.get_tasks_by_status([statuses.CANCELING])) > 0
+        return self.get_task_status_count([statuses.CANCELING]) > 0
 
     @property
     def has_canceled_tasks(self):
-        return len(self.get_tasks_by_status([statuses.CANCELED])) > 0
+        return self.get_task_status_count([statuses.CANCELED]) > 0
 
     def get_staged_tasks(self):
-        return list(filter(lambda x: x['ready'] is True, self.staged))
+        staged_task_keys = sorted(self._staged_ready, key=lambda x: self._staged_ready[x])
+
+        return [self._staged_idx[k][1] for k in staged_task_keys]
 
     @property
     def has_staged_tasks(self):
-        return len(self.get_staged_tasks()) > 0
+        return len(self._staged_ready) > 0
 
     def add_staged_task(self, task_id, route, ctxs=None, prev=None, ready=True):
         if not ctxs:
@@ -123,32 +439,133 @@ class WorkflowState(object):
             'ready': ready
         }
 
-        self.staged.append(entry)
+        self._staged.append(entry)
+        self._index_staged_task(entry)
 
         return entry
 
     def get_staged_task(self, task_id, route):
-        def query(x):
-            return x['id'] == task_id and x['route'] == route
+        staged_task = self._staged_idx.get((task_id, route))
 
-        staged_tasks = list(filter(query, self.staged))
+        return staged_task[1] if staged_task else None
 
-        return staged_tasks[0] if staged_tasks else None
+    def set_staged_task_ready(self, task_id, route, ready):
+        staged_task_key = (task_id, route)
+        order, staged_task = self._staged_idx[staged_task_key]
+        staged_task['ready'] = ready
+
+        if ready is True:
+            self._staged_ready[staged_task_key] = order
+        else:
+            self._staged_ready.pop(staged_task_key, None)
 
     def remove_staged_task(self, task_id, route):
         staged_task = self.get_staged_task(task_id, route)
 
         if staged_task:
-            any_items_running = [
-                item for item in staged_task.get('items', [])
-                if item['status'] in statuses.ACTIVE_STATUSES
-            ]
+            items_running = self.get_staged_task_items_count(
+                task_id,
+                route,
+                statuses.ACTIVE_STATUSES
+            )
+
+            if not items_running:
+                self._staged.remove(staged_task)
+                self._staged_idx.pop((task_id, route))
+                self._staged_items.pop((task_id, route), None)
+                self._staged_ready.pop((task_id, route), None)
+
+    def _get_staged_task_items_tracker(self, task_id, route):
+        staged_task = self.get_staged_task(task_id, route)
+
+        if not staged_task or 'items' not in staged_task:
+            return None
+
+        # The number of items for each status and the position of the first item that
+        # is not run are tracked for the items of the staged task so the list of items
+        # does not need to be scanned. The tracker is rebuilt if the list is replaced.
+        tracker = self._staged_items.get((task_id, route))
+
+        if tracker and tracker['items'] is staged_task['items']:
+            return tracker
+
+        tracker = {'items': staged_task['items'], 'counts': dict(), 'notrun': 0}
+
+        for item in tracker['items']:
+            status = item.get('status')
+            tracker['counts'][status] = tracker['counts'].get(status, 0) + 1
+
+        self._staged_items[(task_id, route)] = tracker
+
+        return tracker
+
+    def set_staged_task_items(self, task_id, route, count):
+        staged_task = self.get_staged_task(task_id, route)
+        staged_task['items'] = [{'status': statuses.UNSET} for i in range(0, count)]
+
+        return staged_task['items']
+
+    def update_staged_task_item(self, task_id, route, item_id, status, result=None):
+        tracker = self._get_staged_task_items_tracker(task_id, route)
+        old_status = tracker['items'][item_id].get('status')
+        tracker['items'][item_id] = {'status': status, 'result': blob_base.offload(result)}
+        tracker['counts'][old_status] = tracker['counts'].get(old_status, 0) - 1
+        tracker['counts'][status] = tracker['counts'].get(status, 0) + 1
+
+    def get_staged_task_items_count(self, task_id, route, statuses=None, exclude_item_id=None):
+        # If statuses is not given, then the number of all items is returned.
+        tracker = self._get_staged_task_items_tracker(task_id, route)
+
+        if not tracker:
+            return 0
+
+        if statuses is None:
+            count = len(tracker['items'])
+        else:
+            count = sum([tracker['counts'].get(s, 0) for s in statuses])
+
+        if (exclude_item_id is not None and
+                (statuses is None or tracker['items'][exclude_item_id]['status'] in statuses)):
+            count -= 1
+
+        return count
+
+    def get_staged_task_notrun_item_ids(self, task_id, route, limit=None):
+        tracker = self._get_staged_task_items_tracker(task_id, route)
 
-            if not any_items_running:
-                self.staged.remove(staged_task)
+        if not tracker:
+            return []
+
+        items = tracker['items']
+        item_ids = []
+
+        # The items are run in order so the position of the first item that is not
+        # run only moves forward. Items after the position may already be run.
+        while (tracker['notrun'] < len(items) and
+                items[tracker['notrun']]['status'] != statuses.UNSET):
+            tracker['notrun'] += 1
+
+        for i in range(tracker['notrun'], len(items)):
+            if limit is not None and len(item_ids) >= limit:
+                break
+
+            if items[i]['status'] == statuses.UNSET:
+                item_ids.append(i)
+
+        return item_ids
 
 
 class WorkflowConductor(object):
+    # The conductor is not safe to be changed by multiple threads at the same time. The
+    # workflow specs, graphs, and plugins are shared by the conductors in the process and
+    # are safe to be used from multiple threads. The application either applies the events
+    # of a conductor from one thread at a time, for example by routing the events of the
+    # workflow execution to the same worker, or enables the lock of the conductor so the
+    # calls to get the next tasks and tasks, update task states, request workflow status,
+    # get the workflow and task contexts and output, and serialize the conductor are
+    # serialized. The other public methods, such as the accessors of the log, errors,
+    # workflow state, and task state entries, are called by the synchronized methods and
+    # are not locked.
 
     def __init__(self, spec, context=None, inputs=None):
         if not spec or not isinstance(spec, spec_base.Spec):
@@ -159,12 +576,15 @@ class WorkflowConductor(object):
         self.spec_module = spec_loader.get_spec_module(self.catalog)
         self.composer = plugin_util.get_module('orquesta.composers', self.catalog)
 
+        self._checkpoint = None
         self._errors = []
         self._graph = None
-        self._inputs = inputs or {}
+        self._inputs = blob_base.offload_values(inputs) or {}
+        self._lock = None
         self._log = []
         self._outputs = None
         self._parent_ctx = context or {}
+        self._task_items = {}
         self._workflow_state = None
 
     def restore(self, graph, log=None, errors=None, state=None,
@@ -194,40 +614,141 @@ class WorkflowConductor(object):
         # identify if there are next tasks.
         self._workflow_state.conductor = self
 
-    def serialize(self):
-        return {
+        # Set the checkpoint for any subsequent delta serialization.
+        self._checkpoint = self.get_checkpoint()
+
+    def enable_lock(self):
+        # The lock is reentrant since the synchronized methods call each other.
+        if self._lock is None:
+            self._lock = threading.RLock()
+
+    def is_lock_enabled(self):
+        return self._lock is not None
+
+    @synchronized
+    def serialize(self, deep_copy=True):
+        data = {
             'spec': self.spec.serialize(),
             'graph': self.graph.serialize(),
-            'input': self.get_workflow_input(),
-            'context': self.get_workflow_parent_context(),
-            'state': self.workflow_state.serialize(),
-            'log': copy.deepcopy(self.log),
-            'errors': copy.deepcopy(self.errors),
+            'input': self._inputs,
+            'context': self._parent_ctx,
+            'state': self.workflow_state.serialize(deep_copy=False),
+            'log': self.log,
+            'errors': self.errors,
+            'output': self._outputs if self._outputs else None,
+            'checkpoint': self.get_checkpoint()
+        }
+
+        # If not deep copied, the data refers to the conductor and must not be modified.
+        if deep_copy:
+            for key in ['input', 'context', 'state', 'log', 'errors', 'output']:
+                data[key] = copy.deepcopy(data[key])
+
+        return data
+
+    @synchronized
+    def serialize_binary(self, compress=False):
+        # The data is encoded as is so the conductor does not need to be deep copied. The
+        # data refers to the conductor and so is encoded while the lock is held.
+        return binary_util.dumps(self.serialize(deep_copy=False), compress=compress)
+
+    def get_checkpoint(self):
+        checkpoint = self.workflow_state.get_checkpoint()
+        checkpoint['log'] = len(self.log)
+        checkpoint['errors'] = len(self.errors)
+
+        return checkpoint
+
+    @synchronized
+    def serialize_delta(self, since=None):
+        # The delta contains only the changes since the given checkpoint, such as the
+        # checkpoint of the serialized conductor, or, if not given, since the last time the
+        # conductor is restored or serialized as delta. The checkpoint only moves when the
+        # conductor is restored or serialized as delta.
+        since = since or self._checkpoint
+
+        if not since:
+            raise exc.WorkflowDeltaError('The checkpoint for the delta is not provided.')
+
+        checkpoint = self.get_checkpoint()
+
+        delta = {
+            'since': copy.deepcopy(since),
+            'checkpoint': checkpoint,
+            'state': self.workflow_state.serialize_delta(since),
+            'log': copy.deepcopy(self.log[since['log']:]),
+            'errors': copy.deepcopy(self.errors[since['errors']:]),
             'output': self.get_workflow_output()
         }
 
+        self._checkpoint = copy.deepcopy(checkpoint)
+
+        return delta
+
+    @classmethod
+    def apply_delta(cls, data, delta):
+        # Apply the delta to the serialized conductor in place. The deltas must be
+        # applied in the order they are serialized. The delta is rejected if the checkpoint
+        # of the serialized conductor is not the checkpoint the delta is serialized since.
+        since = delta['since']
+
+        if data.get('checkpoint') != since:
+            raise exc.WorkflowDeltaError(
+                'The checkpoint of the serialized conductor does not match the checkpoint '
+                'of the delta.'
+            )
+
+        for key in ['log', 'errors']:
+            if len(data.get(key) or []) != since[key]:
+                raise exc.WorkflowDeltaError(
+                    'The number of entries in "%s" does not match the checkpoint.' % key
+                )
+
+        WorkflowState.apply_delta(data['state'], since, delta['state'])
+
+        data['log'] = (data.get('log') or []) + copy.deepcopy(delta['log'])
+        data['errors'] = (data.get('errors') or []) + copy.deepcopy(delta['errors'])
+        data['output'] = copy.deepcopy(delta['output'])
+        data['checkpoint'] = copy.deepcopy(delta['checkpoint'])
+
+        return data
+
     @classmethod
-    def deserialize(cls, data):
-        spec_module = spec_loader.get_spec_module(data['spec']['catalog'])
-        spec = spec_module.WorkflowSpec.deserialize(data['spec'])
-
-        graph = graphing.WorkflowGraph.deserialize(data['graph'])
-        inputs = copy.deepcopy(data['input'])
-        context = copy.deepcopy(data['context'])
-        state = WorkflowState.deserialize(data['state'])
-        log = copy.deepcopy(data.get('log', []))
-        errors = copy.deepcopy(data['errors'])
-        outputs = copy.deepcopy(data['output'])
+    def deserialize(cls, data, deep_copy=True):
+        # If not deep copied, the conductor takes ownership of the data.
+        spec = spec_registry.deserialize(data['spec'])
+
+        graph = graphing.WorkflowGraph.deserialize(data['graph'], deep_copy=deep_copy)
+
+        # The revision of the workflow state is restored so the checkpoint of the restored
+        # conductor is the checkpoint of the serialized conductor.
+        revision = (data.get('checkpoint') or {}).get('revision', 0)
+        state = WorkflowState.deserialize(data['state'], deep_copy=deep_copy, revision=revision)
+        inputs = data['input']
+        context = data['context']
+        log = data.get('log', [])
+        errors = data['errors']
+        outputs = data['output']
+
+        if deep_copy:
+            inputs, context, log, errors, outputs = copy.deepcopy(
+                (inputs, context, log, errors, outputs)
+            )
 
         instance = cls(spec)
         instance.restore(graph, log, errors, state, inputs, outputs, context)
 
         return instance
 
+    @classmethod
+    def deserialize_binary(cls, data):
+        # The decoded data is not shared and so it is not deep copied again.
+        return cls.deserialize(binary_util.loads(data), deep_copy=False)
+
     @property
     def graph(self):
         if not self._graph:
-            self._graph = self.composer.compose(self.spec)
+            self._graph = self.composer.get_graph(self.spec)
 
         return self._graph
 
@@ -240,7 +761,7 @@ class WorkflowConductor(object):
             init_ctx = self.get_workflow_parent_context()
 
             # Render workflow inputs and merge into the initial context.
-            workflow_input = self.get_workflow_input()
+            workflow_input = copy.deepcopy(self._inputs)
             rendered_inputs, input_errors = self.spec.render_input(workflow_input, init_ctx)
             init_ctx = dict_util.merge_dicts(init_ctx, rendered_inputs, True)
 
@@ -258,7 +779,7 @@ class WorkflowConductor(object):
             # Proceed if there is no issue with rendering of inputs and vars.
             if self.get_workflow_status() not in statuses.ABENDED_STATUSES:
                 # Set the initial workflow context.
-                self._workflow_state.contexts.append(init_ctx)
+                self._workflow_state.add_context(init_ctx)
 
                 # Set the initial execution route.
                 self._workflow_state.routes.append([])
@@ -330,7 +851,7 @@ class WorkflowConductor(object):
         return copy.deepcopy(self._parent_ctx)
 
     def get_workflow_input(self):
-        return copy.deepcopy(self._inputs)
+        return blob_base.resolve_values(copy.deepcopy(self._inputs))
 
     def get_workflow_status(self):
         return self.workflow_state.status
@@ -341,6 +862,7 @@ class WorkflowConductor(object):
 
         self.workflow_state.status = value
 
+    @synchronized
     def request_workflow_status(self, status):
         # Record current workflow status.
         current_status = self.get_workflow_status()
@@ -351,6 +873,8 @@ class WorkflowConductor(object):
         # Push the event to all the active tasks. The event may trigger status changes to the task.
         for task_state in self.workflow_state.get_tasks_by_status(statuses.ACTIVE_STATUSES):
             machines.TaskStateMachine.process_event(self.workflow_state, task_state, wf_ex_event)
+            task_state_idx = self._get_task_state_idx(task_state['id'], task_state['route'])
+            self.workflow_state.mark_task_state_updated(task_state_idx)
 
         # Process the workflow status change event.
         machines.WorkflowStateMachine.process_event(self.workflow_state, wf_ex_event)
@@ -358,6 +882,9 @@ class WorkflowConductor(object):
         # Get workflow status after event is processed.
         updated_status = self.get_workflow_status()
 
+        # Remove the cached items of the tasks that are not going to be rendered.
+        self._evict_task_items()
+
         # Ignore if workflow hasn't changed from paused to pausing.
         if (status == statuses.PAUSED and
                 current_status == statuses.PAUSING and
@@ -374,47 +901,47 @@ class WorkflowConductor(object):
         if status != current_status and current_status == updated_status:
             raise exc.InvalidWorkflowStatusTransition(current_status, wf_ex_event.name)
 
+    @synchronized
     def get_workflow_initial_context(self):
-        return copy.deepcopy(self.workflow_state.contexts[0])
+        return blob_base.resolve_values(copy.deepcopy(self.workflow_state.contexts[0]))
 
+    @synchronized
     def get_workflow_terminal_context(self):
+        # The values in the contexts are shared by the contexts that published equal values
+        # and so a copy of the context is returned.
+        ctx = copy.deepcopy(self._get_workflow_terminal_context())
+
+        return blob_base.resolve_values(ctx)
+
+    def _get_workflow_terminal_context(self):
         if self.get_workflow_status() not in statuses.COMPLETED_STATUSES:
             raise exc.WorkflowContextError('Workflow is not in completed status.')
 
-        wf_term_ctx = {}
-
         term_tasks = self.workflow_state.get_terminal_tasks()
 
         if not term_tasks:
-            return wf_term_ctx
+            return {}
 
         first_term_task = term_tasks[0:1][0]
         other_term_tasks = term_tasks[1:]
 
-        wf_term_ctx = self.get_task_context(first_term_task['ctxs']['in'])
+        wf_term_ctx_layers = [self._get_task_context(first_term_task['ctxs']['in'])]
 
         for task in other_term_tasks:
             # Remove the initial context since the first task processed above already
             # inclulded that and we only want to apply the differences.
-            in_ctx_idxs = copy.deepcopy(task['ctxs']['in'])
-            in_ctx_idxs.remove(0)
+            in_ctx_idxs = [i for i in task['ctxs']['in'] if i != 0]
+            wf_term_ctx_layers.append(self._get_task_context(in_ctx_idxs))
 
-            wf_term_ctx = dict_util.merge_dicts(
-                wf_term_ctx,
-                self.get_task_context(in_ctx_idxs),
-                overwrite=True
-            )
-
-        return wf_term_ctx
+        return ctx_util.LayeredContext(wf_term_ctx_layers).flatten()
 
     def _render_workflow_outputs(self):
         wf_status = self.get_workflow_status()
 
         # Render workflow outputs if workflow is completed.
         if wf_status in statuses.COMPLETED_STATUSES and not self._outputs:
-            workflow_ctx = self.get_workflow_terminal_context()
-            state_ctx = {'__state': self.workflow_state.serialize()}
-            workflow_ctx = dict_util.merge_dicts(workflow_ctx, state_ctx, True)
+            workflow_ctx = self._get_workflow_terminal_context()
+            workflow_ctx['__state'] = self.workflow_state.get_view()
             outputs, errors = self.spec.render_output(workflow_ctx)
 
             # Persist outputs if it is not empty.
@@ -428,6 +955,7 @@ class WorkflowConductor(object):
                 if wf_status not in [statuses.EXPIRED, statuses.ABANDONED, statuses.CANCELED]:
                     self.request_workflow_status(statuses.FAILED)
 
+    @synchronized
     def get_workflow_output(self):
         return copy.deepcopy(self._outputs) if self._outputs else None
 
@@ -455,25 +983,60 @@ class WorkflowConductor(object):
 
         return (len(inbounds_satisfied) >= barrier)
 
+    @synchronized
     def get_task(self, task_id, route):
+        return self._get_task(task_id, route)
+
+    def _get_task(self, task_id, route, window=False):
         try:
-            task_ctx = self.get_task_initial_context(task_id, route)
+            task_ctx = self._get_task_initial_context(task_id, route)
         except ValueError:
-            task_ctx = self.get_workflow_initial_context()
+            task_ctx = copy.deepcopy(self.workflow_state.contexts[0])
 
-        state_ctx = {'__state': self.workflow_state.serialize()}
         current_task = {'id': task_id, 'route': route}
         task_ctx = ctx_util.set_current_task(task_ctx, current_task)
-        task_ctx = dict_util.merge_dicts(task_ctx, state_ctx, True)
-        task_spec = self.spec.tasks.get_task(task_id).copy()
-        task_spec, action_specs = task_spec.render(task_ctx)
+        task_ctx['__state'] = self.workflow_state.get_view()
+        task_spec = self.spec.tasks.get_task(task_id)
 
+        # For with items task, if the window is requested, then only the items that are
+        # not run and fit in the concurrency are rendered. Otherwise all items are rendered.
+        if task_spec.has_items():
+            items_spec = getattr(task_spec, 'with')
+            concurrency = getattr(items_spec, 'concurrency', None)
+            concurrency = expr_base.evaluate(concurrency, task_ctx)
+            items = self._get_task_items(task_id, route, task_spec, task_ctx)
+            item_ids = (
+                self._get_task_item_ids(task_id, route, items, concurrency)
+                if window else None
+            )
+
+            task_spec, action_specs = task_spec.render(task_ctx, items=items, item_ids=item_ids)
+
+            # Prepare the staged task to track the items execution status only after the
+            # items are rendered so a rendering error does not leave the items staged.
+            if window:
+                self._stage_task_items(task_id, route, items)
+        else:
+            task_spec, action_specs = task_spec.render(task_ctx)
+
+        # The task context is an overlay on the contexts in the workflow state. A copy of
+        # the context is returned with the task so changes do not alter the workflow state.
+        # The view of the workflow state is only for evaluating expressions and is not
+        # returned with the context since copying the workflow state on every task render
+        # grows with the size of the workflow state.
+        ctx = task_ctx.flatten()
+        ctx.pop('__state', None)
+        ctx = copy.deepcopy(ctx)
+
+        # The rendered action specs share the parts of the input without expressions with
+        # the workflow spec and may refer to the values in the workflow state. Each action
+        # spec is copied once here so the action specs of the items do not share values.
         task = {
             'id': task_id,
             'route': route,
-            'ctx': task_ctx,
+            'ctx': ctx,
             'spec': task_spec,
-            'actions': action_specs
+            'actions': [copy.deepcopy(action_spec) for action_spec in action_specs]
         }
 
         # If there is a task delay specified, evaluate the delay value.
@@ -490,42 +1053,76 @@ class WorkflowConductor(object):
 
         # Add items and related meta data to the task details.
         if task_spec.has_items():
-            items_spec = getattr(task_spec, 'with')
-            concurrency = getattr(items_spec, 'concurrency', None)
-            task['items_count'] = len(action_specs)
-            task['concurrency'] = expr_base.evaluate(concurrency, task_ctx)
+            task['items_count'] = len(items)
+            task['concurrency'] = concurrency
 
         return task
 
-    def _evaluate_task_actions(self, task):
-        task_id = task['id']
-        task_route = task['route']
+    def _get_task_items(self, task_id, route, task_spec, task_ctx):
+        # The items are evaluated once and cached by task and route for the contexts the
+        # task is staged with so the items are not evaluated again on every call.
+        staged_task = self.workflow_state.get_staged_task(task_id, route)
+        ctx_idxs = tuple(staged_task['ctxs']['in']) if staged_task else None
+        cached = self._task_items.get((task_id, route))
+
+        if cached is not None and ctx_idxs is not None and cached[0] == ctx_idxs:
+            return cached[1]
+
+        items = task_spec.get_items(task_ctx)
+
+        if ctx_idxs is not None:
+            self._task_items[(task_id, route)] = (ctx_idxs, items)
+
+        return items
+
+    def _evict_task_items(self):
+        # The cached items are kept only for the staged tasks that can still be rendered. If
+        # the workflow is completed, then only the remediation tasks can still be rendered.
+        wf_completed = self.get_workflow_status() in statuses.COMPLETED_STATUSES
+
+        for task_id, route in list(self._task_items.keys()):
+            staged_task = self.workflow_state.get_staged_task(task_id, route)
 
-        # Return task if it is not with items.
-        if not task['spec'].has_items():
-            return task
+            if not staged_task or (wf_completed and not staged_task.get('run_on_fail')):
+                self._task_items.pop((task_id, route))
 
+    def _stage_task_items(self, task_id, route, items):
+        staged_task = self.workflow_state.get_staged_task(task_id, route)
+
+        if staged_task and ('items' not in staged_task or not staged_task['items']):
+            self.workflow_state.set_staged_task_items(task_id, route, len(items))
+
+    def _get_task_item_ids(self, task_id, route, items, concurrency):
         # Fetch the task entry from staging.
-        staged_task = self.workflow_state.get_staged_task(task_id, task_route)
+        staged_task = self.workflow_state.get_staged_task(task_id, route)
 
-        # Prepare the staging task to track items execution status.
+        if not staged_task:
+            return None
+
+        # If the items are not staged yet, then none of the items is run. The items are
+        # staged after the items are rendered.
         if 'items' not in staged_task or not staged_task['items']:
-            staged_task['items'] = [{'status': statuses.UNSET}] * task['items_count']
+            item_ids = list(range(0, len(items)))
+            return item_ids if concurrency is None else item_ids[:max(concurrency, 0)]
 
-        # Trim the list of actions in the task per concurrency policy.
-        all_items = list(zip(task['actions'], staged_task['items']))
-        notrun_items = list(filter(lambda x: x[1]['status'] == statuses.UNSET, all_items))
-        active_items = list(filter(lambda x: x[1]['status'] in statuses.ACTIVE_STATUSES, all_items))
+        # Identify the items that are not run and trim the list per concurrency policy.
+        if concurrency is None:
+            return self.workflow_state.get_staged_task_notrun_item_ids(task_id, route)
 
-        if task['concurrency'] is not None:
-            availability = task['concurrency'] - len(active_items)
-            candidates = list(zip(*notrun_items[:availability]))
-            task['actions'] = list(candidates[0]) if candidates and availability > 0 else []
-        else:
-            candidates = list(zip(*notrun_items))
-            task['actions'] = list(candidates[0]) if candidates else []
+        availability = concurrency - self.workflow_state.get_staged_task_items_count(
+            task_id,
+            route,
+            statuses.ACTIVE_STATUSES
+        )
 
-        return task
+        if availability <= 0:
+            return []
+
+        return self.workflow_state.get_staged_task_notrun_item_ids(
+            task_id,
+            route,
+            limit=availability
+        )
 
     def has_next_tasks(self, task_id=None, route=None):
         if not task_id:
@@ -562,6 +1159,7 @@ class WorkflowConductor(object):
 
         return False
 
+    @synchronized
     def get_next_tasks(self):
         fail_on_task_rendering = False
         staged_tasks = self.workflow_state.get_staged_tasks()
@@ -582,8 +1180,7 @@ class WorkflowConductor(object):
         # error one at a time during runtime.
         for staged_task in remediation_tasks or staged_tasks:
             try:
-                next_task = self.get_task(staged_task['id'], staged_task['route'])
-                next_task = self._evaluate_task_actions(next_task)
+                next_task = self._get_task(staged_task['id'], staged_task['route'], window=True)
 
                 if 'actions' in next_task and len(next_task['actions']) > 0:
                     next_tasks.append(next_task)
@@ -592,6 +1189,7 @@ class WorkflowConductor(object):
             except Exception as e:
                 fail_on_task_rendering = True
                 self.log_error(e, task_id=staged_task['id'], route=staged_task['route'])
+                self._task_items.pop((staged_task['id'], staged_task['route']), None)
                 continue
 
         # Return nothing if there is error(s) on determining next tasks.
@@ -638,15 +1236,36 @@ class WorkflowConductor(object):
         return task_state_entry
 
     def update_task_state(self, task_id, route, event):
-        engine_event_queue = queue.Queue()
+        return self.update_task_states([(task_id, route, event)])[0]
+
+    @synchronized
+    def update_task_states(self, task_events):
+        task_events = list(task_events)
+
+        # Validate the events before any of the events is applied.
+        for task_id, route, event in task_events:
+            # Throw exception if not expected event type.
+            if not issubclass(type(event), events.ExecutionEvent):
+                raise TypeError('Event is not type of ExecutionEvent.')
+
+            # Throw exception if task does not exist in the workflow graph.
+            if not self.graph.has_task(task_id):
+                raise exc.InvalidTask(task_id)
+
+        # The events are applied in order, each the same as a call to update_task_state, so
+        # the result is the same as applying the events one at a time.
+        task_state_entries = [
+            self._update_task_state(task_id, route, event)
+            for task_id, route, event in task_events
+        ]
 
-        # Throw exception if not expected event type.
-        if not issubclass(type(event), events.ExecutionEvent):
-            raise TypeError('Event is not type of ExecutionEvent.')
+        # Remove the cached items of the tasks that are not going to be rendered.
+        self._evict_task_items()
 
-        # Throw exception if task does not exist in the workflow graph.
-        if not self.graph.has_task(task_id):
-            raise exc.InvalidTask(task_id)
+        return task_state_entries
+
+    def _update_task_state(self, task_id, route, event):
+        engine_events = []
 
         # Try to get the task metadata from staging or task state.
         staged_task = self.workflow_state.get_staged_task(task_id, route)
@@ -692,8 +1311,13 @@ class WorkflowConductor(object):
         # If action execution is for a task item, then store the execution status for the item.
         if (staged_task and event.status and event.context and
                 'item_id' in event.context and event.context['item_id'] is not None):
-            item_result = {'status': event.status, 'result': event.result}
-            staged_task['items'][event.context['item_id']] = item_result
+            self.workflow_state.update_staged_task_item(
+                task_id,
+                route,
+                event.context['item_id'],
+                event.status,
+                result=event.result
+            )
 
         # Log the error if it is a failed execution event.
         if event.status == statuses.FAILED:
@@ -714,21 +1338,21 @@ class WorkflowConductor(object):
             # Get task result.
             task_result = (
                 [item.get('result') for item in staged_task.get('items', [])]
-                if staged_task and task_spec.has_items() else event.result
+                if staged_task and task_spec.has_items() else blob_base.escape(event.result)
             )
 
-            # Remove remaining task from staging.
+            # Remove remaining task from staging and the cached items of the task.
             self.workflow_state.remove_staged_task(task_id, route)
+            self._task_items.pop((task_id, route), None)
 
             # Set current task in the context.
             in_ctx_idxs = task_state_entry['ctxs']['in']
-            in_ctx_val = self.get_task_context(in_ctx_idxs)
+            in_ctx_val = self._get_task_context(in_ctx_idxs)
             current_task = {'id': task_id, 'route': route, 'result': task_result}
             current_ctx = ctx_util.set_current_task(in_ctx_val, current_task)
 
             # Setup context for evaluating expressions in task transition criteria.
-            state_ctx = {'__state': self.workflow_state.serialize()}
-            current_ctx = dict_util.merge_dicts(current_ctx, state_ctx, True)
+            current_ctx['__state'] = self.workflow_state.get_view()
 
         # Evaluate task transitions if task is completed and status change is not processed.
         if new_task_status in statuses.COMPLETED_STATUSES and new_task_status != old_task_status:
@@ -770,7 +1394,7 @@ class WorkflowConductor(object):
                     out_ctx, new_ctx, errors = task_spec.finalize_context(
                         next_task_id,
                         task_transition,
-                        copy.deepcopy(current_ctx)
+                        current_ctx
                     )
 
                     if errors:
@@ -781,8 +1405,7 @@ class WorkflowConductor(object):
                     out_ctx_idxs = copy.deepcopy(task_state_entry['ctxs']['in'])
 
                     if new_ctx:
-                        self.workflow_state.contexts.append(new_ctx)
-                        new_ctx_idx = len(self.workflow_state.contexts) - 1
+                        new_ctx_idx = self.workflow_state.add_context(new_ctx)
 
                         # Add to the list of contexts for the next task in this transition.
                         out_ctx_idxs.append(new_ctx_idx)
@@ -828,15 +1451,16 @@ class WorkflowConductor(object):
 
                     # Check if inbound criteria are met. Must use the original route
                     # to identify the inbound task transitions.
-                    staged_next_task['ready'] = self._inbound_criteria_satisfied(
+                    self.workflow_state.set_staged_task_ready(
                         next_task_id,
-                        route
+                        next_task_route,
+                        self._inbound_criteria_satisfied(next_task_id, route)
                     )
 
                     # Put the next task in the engine event queue if it is an engine command.
                     if next_task_id in events.ENGINE_EVENT_MAP.keys():
                         queue_entry = (staged_next_task['id'], staged_next_task['route'])
-                        engine_event_queue.put(queue_entry)
+                        engine_events.append(queue_entry)
 
                         # Flag if there is at least one fail command in the task transition.
                         if not has_manual_fail:
@@ -865,16 +1489,19 @@ class WorkflowConductor(object):
         machines.WorkflowStateMachine.process_event(self.workflow_state, task_ex_event)
 
         # Process any engine commands in the queue.
-        while not engine_event_queue.empty():
-            next_task_id, next_task_route = engine_event_queue.get()
+        while engine_events:
+            next_task_id, next_task_route = engine_events.pop(0)
             engine_event = events.ENGINE_EVENT_MAP[next_task_id]
-            self.update_task_state(next_task_id, next_task_route, engine_event())
+            self._update_task_state(next_task_id, next_task_route, engine_event())
 
         # Render workflow output if workflow is completed.
         if self.get_workflow_status() in statuses.COMPLETED_STATUSES:
             task_state_entry['term'] = True
             self._render_workflow_outputs()
 
+        # Keep track of the task state entry that is updated for delta serialization.
+        self.workflow_state.mark_task_state_updated(task_state_idx)
+
         return task_state_entry
 
     def _evaluate_route(self, task_transition, prev_route):
@@ -904,27 +1531,37 @@ class WorkflowConductor(object):
 
         return len(self.workflow_state.routes) - 1
 
-    def get_task_context(self, ctx_idxs):
-        ctx = {}
+    def _get_task_context(self, ctx_idxs):
+        # The contexts are layered in the order of the indexes and resolved on access
+        # instead of being merged into a new dict.
+        return ctx_util.LayeredContext([self.workflow_state.contexts[i] for i in ctx_idxs])
 
-        for ctx_idx in ctx_idxs:
-            ctx = dict_util.merge_dicts(ctx, self.workflow_state.contexts[ctx_idx], overwrite=True)
+    @synchronized
+    def get_task_context(self, ctx_idxs):
+        ctx = copy.deepcopy(self._get_task_context(ctx_idxs).flatten())
 
-        return ctx
+        return blob_base.resolve_values(ctx)
 
-    def get_task_initial_context(self, task_id, route):
+    def _get_task_initial_context(self, task_id, route):
         staged_task = self.workflow_state.get_staged_task(task_id, route)
 
         if staged_task:
-            return self.get_task_context(staged_task['ctxs']['in'])
+            return self._get_task_context(staged_task['ctxs']['in'])
 
         task_state_entry = self.get_task_state_entry(task_id, route)
 
         if task_state_entry:
-            return self.get_task_context(task_state_entry['ctxs']['in'])
+            return self._get_task_context(task_state_entry['ctxs']['in'])
 
         raise ValueError('Unable to determine context for task "%s".' % task_id)
 
+    @synchronized
+    def get_task_initial_context(self, task_id, route):
+        ctx = copy.deepcopy(self._get_task_initial_context(task_id, route).flatten())
+
+        return blob_base.resolve_values(ctx)
+
+    @synchronized
     def get_task_transition_contexts(self, task_id, route):
         contexts = {}
 
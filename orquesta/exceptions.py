@@ -125,3 +125,27 @@ class WorkflowContextError(Exception):
 
 class WorkflowLogEntryError(Exception):
     pass
+
+
+class WorkflowDeltaError(Exception):
+    pass
+
+
+class WorkflowGraphReadOnlyError(Exception):
+
+    def __init__(self):
+        Exception.__init__(self, 'The workflow graph is read only.')
+
+
+class BinaryFormatError(Exception):
+    pass
+
+
+class BlobStoreError(Exception):
+    pass
+
+
+class BlobNotFound(BlobStoreError):
+
+    def __init__(self, key):
+        BlobStoreError.__init__(self, 'The blob "%s" does not exist.' % key)
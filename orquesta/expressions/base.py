@@ -17,9 +17,12 @@ import inspect
 import logging
 import re
 import six
+import threading
 
 from stevedore import extension
 
+from orquesta.blobstores import base as blob_base
+from orquesta.utils import cache as cache_util
 from orquesta.utils import expression as expr_util
 from orquesta.utils import plugin as plugin_util
 
@@ -27,18 +30,65 @@ from orquesta.utils import plugin as plugin_util
 LOG = logging.getLogger(__name__)
 
 _EXP_EVALUATORS = None
+_EXP_EVALUATORS_LOCK = threading.RLock()
 _EXP_EVALUATOR_NAMESPACE = 'orquesta.expressions.evaluators'
 
+DEFAULT_CACHE_SIZE = 1000
+DEFAULT_SCAN_CACHE_SIZE = 10000
+
+# Classification of the text by the expressions it contains.
+LITERAL = 'literal'
+EXPRESSION = 'expression'
+TEMPLATE = 'template'
+BLOCK = 'block'
+MIXED = 'mixed'
+
+
+class ExpressionCache(cache_util.LRUCache):
+
+    def __init__(self, size=DEFAULT_CACHE_SIZE):
+        super(ExpressionCache, self).__init__(size)
+
+
+_SCAN_CACHE = ExpressionCache(size=DEFAULT_SCAN_CACHE_SIZE)
+
+
+class ExpressionScan(object):
+
+    def __init__(self, kind, exprs=None, block_exprs=None):
+        self.kind = kind
+        self.exprs = exprs or []
+        self.block_exprs = block_exprs or []
+
 
 @six.add_metaclass(abc.ABCMeta)
 class Evaluator(object):
     _type = 'unspecified'
     _delimiter = None
+    _cache = None
 
     @classmethod
     def get_type(cls):
         return cls._type
 
+    @classmethod
+    def get_cache_stats(cls):
+        return cls._cache.get_stats() if cls._cache is not None else None
+
+    @classmethod
+    def set_cache_size(cls, size):
+        if cls._cache is not None:
+            cls._cache.resize(size)
+
+    @classmethod
+    def clear_cache(cls):
+        if cls._cache is not None:
+            cls._cache.clear()
+
+    @classmethod
+    def warm_cache(cls, text):
+        pass
+
     @classmethod
     def strip_delimiter(cls, expr):
         return expr.strip(cls._delimiter).strip()
@@ -47,9 +97,32 @@ class Evaluator(object):
     def get_statement_regex(cls):
         raise NotImplementedError()
 
+    @classmethod
+    def scan(cls, text):
+        exprs = re.findall(cls.get_statement_regex(), text)
+
+        if not exprs:
+            return None
+
+        kind = EXPRESSION if len(exprs) == 1 and exprs[0] == text else TEMPLATE
+
+        return ExpressionScan(kind, exprs=exprs)
+
+    @classmethod
+    def get_scan(cls, text):
+        # Use the scan cached by the facade if available. Text that is not cached, such as
+        # the result of an expression that is evaluated recursively, is scanned without
+        # being added to the cache so the cache is not filled with runtime values.
+        scans = _SCAN_CACHE.peek(text)
+
+        if scans is not None:
+            return scans.get(cls._type)
+
+        return cls.scan(text)
+
     @classmethod
     def has_expressions(cls, text):
-        raise NotImplementedError()
+        return cls.get_scan(text) is not None
 
     @classmethod
     @abc.abstractmethod
@@ -74,16 +147,24 @@ def get_evaluator(language):
 def get_evaluators():
     global _EXP_EVALUATORS
 
-    if _EXP_EVALUATORS is None:
-        _EXP_EVALUATORS = {}
+    if _EXP_EVALUATORS is not None:
+        return _EXP_EVALUATORS
+
+    # The evaluators are loaded once by the first thread that acquires the lock. The catalog
+    # is assigned after it is fully loaded so other threads do not get a partial catalog.
+    with _EXP_EVALUATORS_LOCK:
+        if _EXP_EVALUATORS is None:
+            evaluators = {}
 
-        mgr = extension.ExtensionManager(
-            namespace=_EXP_EVALUATOR_NAMESPACE,
-            invoke_on_load=False
-        )
+            mgr = extension.ExtensionManager(
+                namespace=_EXP_EVALUATOR_NAMESPACE,
+                invoke_on_load=False
+            )
 
-        for name in mgr.names():
-            _EXP_EVALUATORS[name] = get_evaluator(name)
+            for name in mgr.names():
+                evaluators[name] = get_evaluator(name)
+
+            _EXP_EVALUATORS = evaluators
 
     return _EXP_EVALUATORS
 
@@ -92,10 +173,49 @@ def get_statement_regexes():
     return {t: e.get_statement_regex() for t, e in six.iteritems(get_evaluators())}
 
 
-def has_expressions(text):
-    result = {t: e.has_expressions(text) for t, e in six.iteritems(get_evaluators())}
+def _scan(text):
+    scans = {}
+
+    for name, evaluator in six.iteritems(get_evaluators()):
+        result = evaluator.scan(text)
+
+        if result is not None:
+            scans[name] = result
+
+    return scans
+
 
-    return any(result.values())
+def scan(text, cache=False):
+    # The scans of the strings from the workflow spec are cached by the text when the spec
+    # is inspected or the expressions are compiled so the strings are only scanned once.
+    # Other strings, such as the workflow inputs and the results that are evaluated at
+    # runtime, can be large and are scanned without being added to the cache.
+    if cache:
+        return _SCAN_CACHE.get(text, _scan)
+
+    scans = _SCAN_CACHE.peek(text)
+
+    return scans if scans is not None else _scan(text)
+
+
+def classify(text):
+    scans = scan(text)
+
+    if not scans:
+        return LITERAL
+
+    if len(scans) > 1:
+        return MIXED
+
+    return list(scans.values())[0].kind
+
+
+def get_scan_cache_stats():
+    return _SCAN_CACHE.get_stats()
+
+
+def has_expressions(text):
+    return len(scan(text)) > 0
 
 
 def validate(statement):
@@ -111,9 +231,11 @@ def validate(statement):
             errors.extend(validate(item)['errors'])
 
     elif isinstance(statement, six.string_types):
+        scans = scan(statement, cache=True)
+
         evaluators = [
             evaluator for name, evaluator in six.iteritems(get_evaluators())
-            if evaluator.has_expressions(statement)
+            if name in scans
         ]
 
         if len(evaluators) == 1:
@@ -126,6 +248,14 @@ def validate(statement):
 
 
 def evaluate(statement, data=None):
+    # The references to the values in the blob store are returned as is and the escaped
+    # values remain escaped so the values are not escaped again when written.
+    if type(statement) is blob_base.BlobRef:
+        return statement
+
+    if type(statement) is blob_base.EscapedValue:
+        return blob_base.EscapedValue(evaluate(dict(statement), data=data))
+
     if isinstance(statement, dict):
         return {
             evaluate(k, data=data): evaluate(v, data=data)
@@ -136,9 +266,10 @@ def evaluate(statement, data=None):
         return [evaluate(item, data=data) for item in statement]
 
     elif isinstance(statement, six.string_types):
-        for name, evaluator in six.iteritems(get_evaluators()):
-            if evaluator.has_expressions(statement):
-                return evaluator.evaluate(statement, data=data)
+        scans = scan(statement)
+
+        if scans:
+            return _get_evaluator_for_scan(scans).evaluate(statement, data=data)
 
     return statement
 
@@ -157,7 +288,12 @@ def extract_vars(statement):
             variables.extend(extract_vars(item))
 
     elif isinstance(statement, six.string_types):
+        scans = scan(statement, cache=True)
+
         for name, evaluator in six.iteritems(get_evaluators()):
+            if name not in scans:
+                continue
+
             for var_ref in evaluator.extract_vars(statement):
                 for regex_var_extract in evaluator.get_var_extraction_regexes():
                     result = re.search(regex_var_extract, var_ref)
@@ -169,5 +305,102 @@ def extract_vars(statement):
     return sorted(list(set(variables)), key=lambda var: var[2])
 
 
+def _get_evaluator_for_scan(scans):
+    for name, evaluator in six.iteritems(get_evaluators()):
+        if name in scans:
+            return evaluator
+
+
+class EvaluationPlan(object):
+
+    def __init__(self, statement):
+        # Identify the parts of the statement with expressions ahead of evaluation and
+        # compile the expressions. Parts of the statement without expressions are returned
+        # as is on evaluation without being traversed and so they are shared with the
+        # statement and should not be modified. The conductor copies the rendered values
+        # once before they are returned.
+        self.statement = statement
+        self._plan = self._compile(statement)
+
+    @property
+    def has_expressions(self):
+        return self._plan is not None
+
+    @classmethod
+    def _compile(cls, statement):
+        if isinstance(statement, dict):
+            entries = [
+                (k, cls._compile(k), v, cls._compile(v))
+                for k, v in six.iteritems(statement)
+            ]
+
+            if all(kp is None and vp is None for k, kp, v, vp in entries):
+                return None
+
+            return ('dict', entries)
+
+        if isinstance(statement, list):
+            entries = [(item, cls._compile(item)) for item in statement]
+
+            if all(p is None for item, p in entries):
+                return None
+
+            return ('list', entries)
+
+        if isinstance(statement, six.string_types):
+            scans = scan(statement, cache=True)
+
+            if not scans:
+                return None
+
+            evaluator = _get_evaluator_for_scan(scans)
+            evaluator.warm_cache(statement)
+
+            return ('expression', evaluator)
+
+        return None
+
+    @classmethod
+    def _evaluate(cls, statement, plan, data):
+        if plan is None:
+            return statement
+
+        if plan[0] == 'dict':
+            return {
+                cls._evaluate(k, kp, data): cls._evaluate(v, vp, data)
+                for k, kp, v, vp in plan[1]
+            }
+
+        if plan[0] == 'list':
+            return [cls._evaluate(item, p, data) for item, p in plan[1]]
+
+        return plan[1].evaluate(statement, data=data)
+
+    def evaluate(self, data=None):
+        return self._evaluate(self.statement, self._plan, data)
+
+
+def warm_cache(statement):
+    if isinstance(statement, dict):
+        for k, v in six.iteritems(statement):
+            warm_cache(k)
+            warm_cache(v)
+
+    elif isinstance(statement, list):
+        for item in statement:
+            warm_cache(item)
+
+    elif isinstance(statement, six.string_types):
+        scans = scan(statement, cache=True)
+
+        for name, evaluator in six.iteritems(get_evaluators()):
+            if name in scans:
+                evaluator.warm_cache(statement)
+
+
+def get_cache_stats():
+    return {t: e.get_cache_stats() for t, e in six.iteritems(get_evaluators())}
+
+
 def func_has_ctx_arg(func):
     return 'context' in inspect.getargspec(func).args
@@ -12,24 +12,35 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import threading
+
 from stevedore import extension
 
 
 _EXP_FUNC_CATALOG = None
+_EXP_FUNC_CATALOG_LOCK = threading.RLock()
 
 
 def load():
     global _EXP_FUNC_CATALOG
 
-    if _EXP_FUNC_CATALOG is None:
-        _EXP_FUNC_CATALOG = {}
+    if _EXP_FUNC_CATALOG is not None:
+        return _EXP_FUNC_CATALOG
+
+    # The functions are loaded once by the first thread that acquires the lock. The catalog
+    # is assigned after it is fully loaded so other threads do not get a partial catalog.
+    with _EXP_FUNC_CATALOG_LOCK:
+        if _EXP_FUNC_CATALOG is None:
+            catalog = {}
+
+            mgr = extension.ExtensionManager(
+                namespace='orquesta.expressions.functions',
+                invoke_on_load=False
+            )
 
-        mgr = extension.ExtensionManager(
-            namespace='orquesta.expressions.functions',
-            invoke_on_load=False
-        )
+            for name in mgr.names():
+                catalog[name] = mgr[name].plugin
 
-        for name in mgr.names():
-            _EXP_FUNC_CATALOG[name] = mgr[name].plugin
+            _EXP_FUNC_CATALOG = catalog
 
     return _EXP_FUNC_CATALOG
@@ -15,6 +15,7 @@
 import json
 import six
 
+from orquesta.blobstores import base as blob_base
 from orquesta import exceptions as exc
 
 
@@ -47,6 +48,11 @@ def ctx_(context, key=None):
         if key in context['__vars'] and key.startswith('__'):
             raise exc.VariableInaccessibleError(key)
 
-        return context['__vars'][key]
+        return blob_base.resolve(context['__vars'][key])
     else:
-        return {k: v for k, v in six.iteritems(context['__vars']) if not k.startswith('__')}
+        # The references are resolved when the values are accessed.
+        return blob_base.get_resolving_mapping({
+            k: v
+            for k, v in six.iteritems(context['__vars'])
+            if not k.startswith('__')
+        })
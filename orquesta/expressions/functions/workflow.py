@@ -12,6 +12,7 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+from orquesta.blobstores import base as blob_base
 from orquesta import constants
 from orquesta import exceptions as exc
 from orquesta import statuses
@@ -103,7 +104,7 @@ def completed_(context):
 def result_(context):
     current_task = _get_current_task(context)
 
-    return current_task.get('result')
+    return blob_base.resolve(current_task.get('result'))
 
 
 def item_(context, key=None):
@@ -12,6 +12,7 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import collections
 import functools
 import inspect
 import logging
@@ -20,6 +21,7 @@ import six
 
 import jinja2
 
+from orquesta.blobstores import base as blob_base
 from orquesta import exceptions as exc
 from orquesta.expressions import base as expr_base
 from orquesta.expressions.functions import base as func_base
@@ -79,30 +81,94 @@ class JinjaEvaluator(expr_base.Evaluator):
 
     _custom_functions = register_functions(_jinja_env)
 
+    # Identify the custom functions that take the context as argument once so only those
+    # functions are bound to the context on each evaluation.
+    _ctx_functions = {
+        name: func for name, func in six.iteritems(_custom_functions)
+        if expr_base.func_has_ctx_arg(func)
+    }
+
+    _non_ctx_functions = {
+        name: func for name, func in six.iteritems(_custom_functions)
+        if not expr_base.func_has_ctx_arg(func)
+    }
+
+    # The compiled inline expressions and block templates are cached by the source text.
+    _cache = expr_base.ExpressionCache()
+
     @classmethod
     def contextualize(cls, data):
         ctx = {'__vars': data}
 
-        if isinstance(data, dict):
+        if isinstance(data, collections.Mapping):
             ctx['__state'] = ctx['__vars'].get('__state')
             ctx['__current_task'] = ctx['__vars'].get('__current_task')
             ctx['__current_item'] = ctx['__vars'].get('__current_item')
 
-        for name, func in six.iteritems(cls._custom_functions):
-            ctx[name] = functools.partial(func, ctx) if expr_base.func_has_ctx_arg(func) else func
+        ctx.update(cls._non_ctx_functions)
+
+        for name, func in six.iteritems(cls._ctx_functions):
+            ctx[name] = functools.partial(func, ctx)
 
         return ctx
 
+    @classmethod
+    def _compile_expression(cls, key):
+        return cls._jinja_env.compile_expression(key[1], undefined_to_none=False)
+
+    @classmethod
+    def _compile_template(cls, key):
+        return cls._jinja_env.from_string(key[1])
+
+    @classmethod
+    def compile(cls, expr):
+        return cls._cache.get(('expression', expr), cls._compile_expression)
+
+    @classmethod
+    def compile_template(cls, text):
+        return cls._cache.get(('template', text), cls._compile_template)
+
+    @classmethod
+    def warm_cache(cls, text):
+        # Compile the text the same way it is processed on evaluation where raw blocks
+        # are substituted and the whole text is compiled if there are block expressions.
+        for i, raw_block in enumerate(cls._regex_raw_block_parser.findall(text)):
+            text = text.replace(raw_block, '{%s}' % str(i))
+
+        scan = cls.get_scan(text)
+
+        if scan is None:
+            return
+
+        try:
+            if scan.kind == expr_base.BLOCK:
+                cls.compile_template(text)
+                return
+
+            for expr in scan.exprs:
+                cls.compile(cls.strip_delimiter(expr))
+        except jinja2.exceptions.TemplateError:
+            pass
+
     @classmethod
     def get_statement_regex(cls):
         return cls._regex_pattern
 
     @classmethod
-    def has_expressions(cls, text):
+    def scan(cls, text):
         exprs = cls._regex_parser.findall(text)
         block_exprs = cls._regex_block_parser.findall(text)
 
-        return exprs or block_exprs
+        if block_exprs:
+            kind = expr_base.BLOCK
+        elif not exprs:
+            return None
+        elif len(exprs) == 1 and exprs[0] == text:
+            kind = expr_base.EXPRESSION
+        else:
+            kind = expr_base.TEMPLATE
+
+        return expr_base.ExpressionScan(kind, exprs=exprs, block_exprs=block_exprs)
 
     @classmethod
     def get_var_extraction_regexes(cls):
@@ -122,19 +188,15 @@ class JinjaEvaluator(expr_base.Evaluator):
             errors.append(expr_util.format_error(cls._type, text, e))
 
         # Validate individual inline expressions.
-        for expr in cls._regex_parser.findall(text):
+        scan = cls.get_scan(text)
+
+        for expr in (scan.exprs if scan else []):
             # Skip expression if it has already been validated and erred.
             if list(filter(lambda x: x['expression'] == expr, errors)):
                 continue
 
             try:
-                parser = jinja2.parser.Parser(
-                    cls._jinja_env.overlay(),
-                    cls.strip_delimiter(expr),
-                    state='variable'
-                )
-
-                parser.parse_expression()
+                cls.compile(cls.strip_delimiter(expr))
             except jinja2.exceptions.TemplateError as e:
                 errors.append(expr_util.format_error(cls._type, expr, e))
 
@@ -142,16 +204,16 @@ class JinjaEvaluator(expr_base.Evaluator):
 
     @classmethod
     def _evaluate_and_expand(cls, text, data=None):
-        exprs = cls._regex_parser.findall(text)
-        block_exprs = cls._regex_block_parser.findall(text)
+        scan = cls.get_scan(text)
+        exprs = scan.exprs if scan else []
+        block_exprs = scan.block_exprs if scan else []
         ctx = cls.contextualize(data)
-        opts = {'undefined_to_none': False}
 
         try:
             # If there is a Jinja block expression in the text, then process the whole text.
             if block_exprs:
                 expr = text
-                output = cls._jinja_env.from_string(expr).render(ctx)
+                output = cls.compile_template(expr).render(ctx)
                 output = str_util.unicode(output)
 
                 # Traverse and evaulate again in case additional inline epxressions are
@@ -165,12 +227,15 @@ class JinjaEvaluator(expr_base.Evaluator):
                 # Evaluate inline jinja expressions first.
                 for expr in exprs:
                     stripped = cls.strip_delimiter(expr)
-                    compiled = cls._jinja_env.compile_expression(stripped, **opts)
-                    result = compiled(**ctx)
+                    result = cls.compile(stripped)(**ctx)
 
                     if inspect.isgenerator(result):
                         result = list(result)
 
+                    # The values in the mapping returned by ctx() are resolved when accessed.
+                    if isinstance(result, blob_base.ResolvingMapping):
+                        result = dict(result)
+
                     if isinstance(result, six.string_types):
                         result = cls._evaluate_and_expand(result, data)
 
@@ -198,11 +263,14 @@ class JinjaEvaluator(expr_base.Evaluator):
         if not isinstance(text, six.string_types):
             raise ValueError('Text to be evaluated is not typeof string.')
 
-        if data and not isinstance(data, dict):
+        if data and not isinstance(data, collections.Mapping):
             raise ValueError('Provided data is not typeof dict.')
 
-        # Remove raw blocks from the expression.
-        raw_blocks = cls._regex_raw_block_parser.findall(text)
+        # Remove raw blocks from the expression. Raw blocks are block expressions so
+        # only text with block expressions needs to be searched.
+        scan = cls.get_scan(text)
+        has_blocks = scan is not None and scan.kind == expr_base.BLOCK
+        raw_blocks = cls._regex_raw_block_parser.findall(text) if has_blocks else []
 
         for i in range(0, len(raw_blocks)):
             text = text.replace(raw_blocks[i], '{%s}' % str(i))
@@ -235,8 +303,9 @@ class JinjaEvaluator(expr_base.Evaluator):
             raise ValueError('Text to be evaluated is not typeof string.')
 
         variables = []
+        scan = cls.get_scan(text)
 
-        for expr in cls._regex_parser.findall(text):
+        for expr in (scan.exprs if scan else []):
             variables.extend(cls._regex_var_parser.findall(expr))
 
         return sorted(list(set(variables)))
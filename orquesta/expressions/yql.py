@@ -12,6 +12,7 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import collections
 import inspect
 import logging
 import re
@@ -68,6 +69,9 @@ class YAQLEvaluator(expr_base.Evaluator):
     _root_ctx = yaql.create_context()
     _custom_functions = register_functions(_root_ctx)
 
+    # The parsed expressions are cached by the expression text without the delimiter.
+    _cache = expr_base.ExpressionCache()
+
     @classmethod
     def contextualize(cls, data):
         ctx = cls._root_ctx.create_child_context()
@@ -79,14 +83,22 @@ class YAQLEvaluator(expr_base.Evaluator):
         return ctx
 
     @classmethod
-    def get_statement_regex(cls):
-        return cls._regex_pattern
+    def compile(cls, expr):
+        return cls._cache.get(expr, cls._engine)
 
     @classmethod
-    def has_expressions(cls, text):
-        exprs = cls._regex_parser.findall(text)
+    def warm_cache(cls, text):
+        scan = cls.get_scan(text)
+
+        for expr in (scan.exprs if scan else []):
+            try:
+                cls.compile(cls.strip_delimiter(expr))
+            except (yaql_exc.YaqlException, ValueError, TypeError):
+                continue
 
-        return exprs is not None and len(exprs) > 0
+    @classmethod
+    def get_statement_regex(cls):
+        return cls._regex_pattern
 
     @classmethod
     def get_var_extraction_regexes(cls):
@@ -98,10 +110,11 @@ class YAQLEvaluator(expr_base.Evaluator):
             raise ValueError('Text to be evaluated is not typeof string.')
 
         errors = []
+        scan = cls.get_scan(text)
 
-        for expr in cls._regex_parser.findall(text):
+        for expr in (scan.exprs if scan else []):
             try:
-                cls._engine(cls.strip_delimiter(expr))
+                cls.compile(cls.strip_delimiter(expr))
             except (yaql_exc.YaqlException, ValueError, TypeError) as e:
                 errors.append(expr_util.format_error(cls._type, expr, e))
 
@@ -112,17 +125,18 @@ class YAQLEvaluator(expr_base.Evaluator):
         if not isinstance(text, six.string_types):
             raise ValueError('Text to be evaluated is not typeof string.')
 
-        if data and not isinstance(data, dict):
+        if data and not isinstance(data, collections.Mapping):
             raise ValueError('Provided data is not typeof dict.')
 
         output = str_util.unicode(text)
-        exprs = cls._regex_parser.findall(text)
+        scan = cls.get_scan(text)
+        exprs = scan.exprs if scan else []
         ctx = cls.contextualize(data)
 
         try:
             for expr in exprs:
                 stripped = cls.strip_delimiter(expr)
-                result = cls._engine(stripped).evaluate(context=ctx)
+                result = cls.compile(stripped).evaluate(context=ctx)
 
                 if inspect.isgenerator(result):
                     result = list(result)
@@ -154,8 +168,9 @@ class YAQLEvaluator(expr_base.Evaluator):
             raise ValueError('Text to be evaluated is not typeof string.')
 
         variables = []
+        scan = cls.get_scan(text)
 
-        for expr in cls._regex_parser.findall(text):
+        for expr in (scan.exprs if scan else []):
             variables.extend(cls._regex_var_parser.findall(expr))
 
         return sorted(list(set(variables)))
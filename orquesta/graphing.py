@@ -37,6 +37,33 @@ class WorkflowGraph(object):
         # may be cycled and states overwritten.
         self._graph = graph if graph else nx.MultiDiGraph()
 
+        # The set of tasks that are members of cycles in the graph. The set is identified
+        # on first use and reset whenever tasks and transitions are added to the graph.
+        self._cycle_members = None
+
+        # The outbound and inbound transitions of tasks are cached on first use and reset
+        # whenever tasks and transitions are added or updated in the graph.
+        self._next_transitions = dict()
+        self._prev_transitions = dict()
+
+        # A read only graph such as the graph shared by conductors cannot be changed.
+        self._read_only = False
+
+    def set_read_only(self):
+        self._read_only = True
+
+    def is_read_only(self):
+        return self._read_only
+
+    def _check_read_only(self):
+        if self._read_only:
+            raise exc.WorkflowGraphReadOnlyError()
+
+    def _reset_cache(self):
+        self._cycle_members = None
+        self._next_transitions = dict()
+        self._prev_transitions = dict()
+
     def serialize(self):
         data = json_graph.adjacency_data(self._graph)
 
@@ -45,12 +72,23 @@ class WorkflowGraph(object):
             for outbounds in data['adjacency']
         ]
 
+        data['cycle_members'] = sorted(self.get_cycle_members())
+
         return data
 
     @classmethod
-    def deserialize(cls, data):
-        g = json_graph.adjacency_graph(copy.deepcopy(data), directed=True, multigraph=True)
-        return cls(graph=g)
+    def deserialize(cls, data, deep_copy=True):
+        # The attributes of the tasks and transitions refer to the data if not deep copied.
+        data = copy.deepcopy(data) if deep_copy else dict(data)
+        cycle_members = data.pop('cycle_members', None)
+        g = json_graph.adjacency_graph(data, directed=True, multigraph=True)
+        instance = cls(graph=g)
+
+        # Graphs serialized prior to tracking cycle members will identify them on first use.
+        if cycle_members is not None:
+            instance._cycle_members = set(cycle_members)
+
+        return instance
 
     @staticmethod
     def get_root_nodes(graph):
@@ -93,45 +131,45 @@ class WorkflowGraph(object):
         )
 
     def add_task(self, task_id, **kwargs):
+        self._check_read_only()
+
         if not self.has_task(task_id):
             self._graph.add_node(task_id, **kwargs)
+            self._reset_cache()
         else:
             self.update_task(task_id, **kwargs)
 
     def update_task(self, task_id, **kwargs):
+        self._check_read_only()
+
         if not self.has_task(task_id):
             raise exc.InvalidTask(task_id)
 
         for key, value in six.iteritems(kwargs):
             self._graph.node[task_id][key] = value
 
-    def has_transition(self, source, destination, **kwargs):
-        edges = filter(
-            lambda e: e[0] == source and e[1] == destination,
-            self._graph.edges(data=True, keys=True)
-        )
+    def _get_transitions(self, source, destination, key=None, **kwargs):
+        # Look up the transitions between the tasks from the adjacency of the source task
+        # instead of filtering all the transitions in the graph.
+        edges = [
+            (source, destination, k, d)
+            for k, d in six.iteritems(self._graph.get_edge_data(source, destination) or {})
+            if key is None or k == key
+        ]
 
         for attr, value in six.iteritems(kwargs):
-            edges = filter(lambda e: e[3].get(attr, None) == value, list(edges))
+            edges = [e for e in edges if e[3].get(attr, None) == value]
+
+        return edges
 
-        return list(edges)
+    def has_transition(self, source, destination, **kwargs):
+        return self._get_transitions(source, destination, **kwargs)
 
     def get_transition(self, source, destination, key=None, **kwargs):
         if key is not None:
-            edges = filter(
-                lambda e: e[0] == source and e[1] == destination and e[2] == key,
-                self._graph.edges(data=True, keys=True)
-            )
+            edges = self._get_transitions(source, destination, key=key)
         else:
-            edges = filter(
-                lambda e: e[0] == source and e[1] == destination,
-                self._graph.edges(data=True, keys=True)
-            )
-
-            for attr, value in six.iteritems(kwargs):
-                edges = filter(lambda e: e[3].get(attr, None) == value, list(edges))
-
-        edges = list(edges)
+            edges = self._get_transitions(source, destination, **kwargs)
 
         if len(edges) <= 0:
             raise exc.InvalidTaskTransition(source, destination)
@@ -145,6 +183,8 @@ class WorkflowGraph(object):
         return nx.get_edge_attributes(self._graph, attribute)
 
     def add_transition(self, source, destination, **kwargs):
+        self._check_read_only()
+
         if not self.has_task(source):
             self.add_task(source)
 
@@ -159,24 +199,35 @@ class WorkflowGraph(object):
                 attrs[attr] = value
 
         self._graph.add_edge(source, destination, **attrs)
+        self._reset_cache()
 
     def update_transition(self, source, destination, key, **kwargs):
+        self._check_read_only()
+
         seq = self.get_transition(source, destination, key=key)
 
         for attr, value in six.iteritems(kwargs):
             self._graph[source][destination][seq[2]][attr] = value
 
+        self._reset_cache()
+
     def get_next_transitions(self, task_id):
-        return sorted(
-            [e for e in self._graph.out_edges([task_id], data=True, keys=True)],
-            key=lambda x: x[1]
-        )
+        if task_id not in self._next_transitions:
+            self._next_transitions[task_id] = sorted(
+                [e for e in self._graph.out_edges([task_id], data=True, keys=True)],
+                key=lambda x: x[1]
+            )
+
+        return list(self._next_transitions[task_id])
 
     def get_prev_transitions(self, task_id):
-        return sorted(
-            [e for e in self._graph.in_edges([task_id], data=True, keys=True)],
-            key=lambda x: x[1]
-        )
+        if task_id not in self._prev_transitions:
+            self._prev_transitions[task_id] = sorted(
+                [e for e in self._graph.in_edges([task_id], data=True, keys=True)],
+                key=lambda x: x[1]
+            )
+
+        return list(self._prev_transitions[task_id])
 
     def set_barrier(self, task_id, value='*'):
         self.update_task(task_id, barrier=value)
@@ -195,8 +246,27 @@ class WorkflowGraph(object):
             for c in nx.simple_cycles(self._graph)
         ]
 
+    def get_cycle_members(self):
+        if self._cycle_members is not None:
+            return self._cycle_members
+
+        # A task is in a cycle if it belongs to a strongly connected component with other
+        # tasks or if it transitions to itself. Unlike enumerating the simple cycles, the
+        # strongly connected components are identified in linear time.
+        cycle_members = set()
+
+        for component in nx.strongly_connected_components(self._graph):
+            if len(component) > 1:
+                cycle_members.update(component)
+
+        cycle_members.update([n for n in self._graph.nodes() if self._graph.has_edge(n, n)])
+
+        self._cycle_members = cycle_members
+
+        return self._cycle_members
+
     def in_cycle(self, task_id):
-        return [c for c in nx.simple_cycles(self._graph) if task_id in c]
+        return task_id in self.get_cycle_members()
 
     def is_cycle_closed(self, cycle):
         # A cycle is closed, for a lack of better term, if there is no task
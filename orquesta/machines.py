@@ -12,7 +12,6 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-import copy
 import logging
 
 from orquesta import events
@@ -484,18 +483,21 @@ class TaskStateMachine(object):
 
         if (ac_ex_event.status in requirements and
                 ac_ex_event.context and 'item_id' in ac_ex_event.context):
-            # Make a copy of the items and remove current item under evaluation.
-            staged_task = workflow_state.get_staged_task(task_id, task_route)
-            items = copy.deepcopy(staged_task['items'])
-            del items[ac_ex_event.context['item_id']]
-            items_status = [item['status'] for item in items]
+            # Count the items by status excluding the current item under evaluation.
+            def count_items(item_statuses):
+                return workflow_state.get_staged_task_items_count(
+                    task_id,
+                    task_route,
+                    item_statuses,
+                    exclude_item_id=ac_ex_event.context['item_id']
+                )
 
             # Assess various situations.
-            active = list(filter(lambda x: x in statuses.ACTIVE_STATUSES, items_status))
-            incomplete = list(filter(lambda x: x not in statuses.COMPLETED_STATUSES, items_status))
-            paused = list(filter(lambda x: x in [statuses.PENDING, statuses.PAUSED], items_status))
-            canceled = list(filter(lambda x: x == statuses.CANCELED, items_status))
-            failed = list(filter(lambda x: x in statuses.ABENDED_STATUSES, items_status))
+            active = count_items(statuses.ACTIVE_STATUSES)
+            incomplete = count_items(None) - count_items(statuses.COMPLETED_STATUSES)
+            paused = count_items([statuses.PENDING, statuses.PAUSED])
+            canceled = count_items([statuses.CANCELED])
+            failed = count_items(statuses.ABENDED_STATUSES)
 
             # Attach info on whether task is still active or dormant.
             action_event += '_task_active' if active else '_task_dormant'
@@ -550,8 +552,12 @@ class TaskStateMachine(object):
 
         new_task_status = TASK_STATE_MACHINE_DATA[current_task_status][event_name]
 
-        # Assign new status to the task flow entry.
-        task_state['status'] = new_task_status
+        # Assign new status to the task flow entry. The workflow state tracks the number of
+        # tasks by status so the status is assigned via the workflow state if provided.
+        if workflow_state is None:
+            task_state['status'] = new_task_status
+        else:
+            workflow_state.set_task_status(task_state, new_task_status)
 
     @classmethod
     def add_context_to_workflow_event(cls, workflow_state, task_id, task_route, wf_ex_event):
@@ -560,9 +566,21 @@ class TaskStateMachine(object):
         staged_task = workflow_state.get_staged_task(task_id, task_route)
 
         if wf_ex_event.status in requirements and staged_task and 'items' in staged_task:
-            items_status = [item['status'] for item in staged_task['items']]
-            active = list(filter(lambda x: x in statuses.ACTIVE_STATUSES, items_status))
-            incomplete = list(filter(lambda x: x not in statuses.COMPLETED_STATUSES, items_status))
+            active = workflow_state.get_staged_task_items_count(
+                task_id,
+                task_route,
+                statuses.ACTIVE_STATUSES
+            )
+
+            incomplete = (
+                workflow_state.get_staged_task_items_count(task_id, task_route) -
+                workflow_state.get_staged_task_items_count(
+                    task_id,
+                    task_route,
+                    statuses.COMPLETED_STATUSES
+                )
+            )
+
             workflow_event += '_task_active' if active else '_task_dormant'
             workflow_event += '_items_incomplete' if incomplete else '_items_completed'
 
@@ -600,8 +618,12 @@ class TaskStateMachine(object):
 
         new_task_status = TASK_STATE_MACHINE_DATA[current_task_status][event_name]
 
-        # Assign new status to the task flow entry.
-        task_state['status'] = new_task_status
+        # Assign new status to the task flow entry. The workflow state tracks the number of
+        # tasks by status so the status is assigned via the workflow state if provided.
+        if workflow_state is None:
+            task_state['status'] = new_task_status
+        else:
+            workflow_state.set_task_status(task_state, new_task_status)
 
     @classmethod
     def process_event(cls, workflow_state, task_state, event):
@@ -13,12 +13,15 @@
 # limitations under the License.
 
 import collections
+import copy
+import hashlib
 import inspect
 import json
 import jsonschema
 import logging
 import re
 import six
+import threading
 import yaml
 
 from orquesta import exceptions as exc
@@ -32,11 +35,38 @@ from orquesta.utils import strings as str_util
 
 LOG = logging.getLogger(__name__)
 
+# The schemas, attribute maps, and schema validators are built once per spec class by the
+# first thread that acquires the lock. The lock is reentrant since building the schema of a
+# spec class builds the schemas of the nested spec classes.
+_SPEC_CLASS_CACHE_LOCK = threading.RLock()
+
 
 def isspec(value):
     return inspect.isclass(value) and issubclass(value, Spec)
 
 
+def get_fingerprint(data):
+    # The fingerprint is a stable hash of the serialized spec where the keys are sorted.
+    text = json.dumps(data, sort_keys=True, separators=(',', ':'), default=str)
+
+    return hashlib.sha256(text.encode('utf-8')).hexdigest()
+
+
+class SpecProperty(object):
+    # The descriptor maps the attribute on the spec class to the property in the spec
+    # dict. It is not a data descriptor so an attribute set on the spec instance, such
+    # as the child spec for the property, takes precedence.
+
+    def __init__(self, prop_name):
+        self.prop_name = prop_name
+
+    def __get__(self, instance, owner):
+        if instance is None:
+            return self
+
+        return instance.spec.get(self.prop_name)
+
+
 class Spec(object):
     _catalog = None
 
@@ -69,32 +99,103 @@ class Spec(object):
     # this case, the attribute does not physically exist on the class and so __getattr__
     # is called which it is overridden here to access the spec dict.
     def __getattr__(self, name):
+        attrs = type(self).__dict__.get('_attrs')
+
+        if attrs is None:
+            attrs = self._get_attrs()
+
+        # Resolve the spec property for the attribute once per class and attribute name.
+        try:
+            prop_name = attrs[name]
+        except KeyError:
+            prop_name = attrs[name] = self._resolve_attr(name)
+
+        if prop_name is not None:
+            return self.spec.get(prop_name)
+
+        # Use default for all other attributes.
+        return self.__getattribute__(name)
+
+    @classmethod
+    def _get_attrs(cls):
+        # Map the attribute names to the meta schema and schema properties ahead. The
+        # names of the attributes that are resolved later are added to the map. The map
+        # is kept on the class itself for lookup by __getattr__.
+        if '_attrs' in cls.__dict__:
+            return cls._attrs
+
+        with _SPEC_CLASS_CACHE_LOCK:
+            if '_attrs' not in cls.__dict__:
+                cls._build_attrs()
+
+        return cls._attrs
+
+    @classmethod
+    def _build_attrs(cls):
+        attrs = {}
+        meta_schema = cls._get_meta_schema()
+        schema = cls._get_schema(includes=None, resolve_specs=False)
+
+        prop_names = (
+            list(meta_schema.get('properties', {}).keys()) +
+            list(schema.get('properties', {}).keys())
+        )
+
+        for prop_name in prop_names:
+            for name in [prop_name, prop_name.replace('-', '_')]:
+                attrs[name] = cls._resolve_attr(name)
+
+                # Add a descriptor on the class for the attribute that is not defined
+                # so the spec property is accessed without going through __getattr__.
+                if not re.match(r'^[A-Za-z_]\w*$', name):
+                    continue
+
+                if not hasattr(cls, name) or isinstance(getattr(cls, name), SpecProperty):
+                    setattr(cls, name, SpecProperty(attrs[name]))
+
+        cls._attrs = attrs
+
+    @classmethod
+    def _get_attr_patterns(cls):
+        def build():
+            schema = cls._get_schema(includes=None, resolve_specs=False)
+            return [re.compile(p) for p in schema.get('patternProperties', {}).keys()]
+
+        return cls._get_cached_schema('attr_patterns', build)
+
+    @classmethod
+    def _resolve_attr(cls, name):
+        meta_schema = cls._get_meta_schema()
+        schema = cls._get_schema(includes=None, resolve_specs=False)
+
         # Retrieve from spec if attribute is a meta schema property.
-        if name in self._meta_schema.get('properties', {}):
-            return self.spec.get(name)
+        if name in meta_schema.get('properties', {}):
+            return name
 
-        if name.replace('_', '-') in self._meta_schema.get('properties', {}):
-            return self.spec.get(name.replace('_', '-'))
+        if name.replace('_', '-') in meta_schema.get('properties', {}):
+            return name.replace('_', '-')
 
         # Retrieve from spec if attribute is a schema property.
-        if name in self._schema.get('properties', {}):
-            return self.spec.get(name)
+        if name in schema.get('properties', {}):
+            return name
 
-        if name.replace('_', '-') in self._schema.get('properties', {}):
-            return self.spec.get(name.replace('_', '-'))
+        if name.replace('_', '-') in schema.get('properties', {}):
+            return name.replace('_', '-')
 
         # Retrieve from spec if attribute match a regex pattern in the schema.
-        for pattern in self._schema.get('patternProperties', {}).keys():
-            if re.match(pattern, name):
-                return self.spec.get(name)
+        for pattern in cls._get_attr_patterns():
+            if pattern.match(name):
+                return name
 
-        # Use default for all other attributes.
-        return self.__getattribute__(name)
+        return None
 
     def __init__(self, spec, name=None, member=False):
+        # Map the attributes of the class to the spec properties.
+        self._get_attrs()
+
         # Update the schema to include schema parts from parent classes.
-        self._schema = self.get_schema(includes=None, resolve_specs=False)
-        self._meta_schema = self.get_meta_schema()
+        self._schema = self._get_schema(includes=None, resolve_specs=False)
+        self._meta_schema = self._get_meta_schema()
 
         if not spec:
             raise ValueError('The spec cannot be type of None.')
@@ -113,10 +214,7 @@ class Spec(object):
 
         self.member = member
 
-        schema = (
-            self._schema if member else
-            schema_util.merge_schema(self.get_meta_schema(), self._schema)
-        )
+        schema = self._get_spec_schema(member=member)
 
         # Process attributes defined under properties in the schema.
         property_specs = {
@@ -141,9 +239,35 @@ class Spec(object):
                 if re.match(pattern, name) and value:
                     setattr(self, name, spec_cls(value, member=True))
 
+    def __setattr__(self, name, value):
+        # The attributes of a read only spec cannot be changed. Private attributes such as
+        # the caches of the spec are not restricted.
+        if not name.startswith('_') and self.__dict__.get('_read_only', False):
+            raise AttributeError('The attribute "%s" of the spec is read only.' % name)
+
+        super(Spec, self).__setattr__(name, value)
+
+    def set_read_only(self):
+        self._read_only = True
+
+    def is_read_only(self):
+        return self.__dict__.get('_read_only', False)
+
     def copy(self):
         return self.deserialize(self.serialize())
 
+    def get_fingerprint(self):
+        # The fingerprint is only kept for the read only spec which is not expected to change.
+        fingerprint = self.__dict__.get('_fingerprint')
+
+        if fingerprint is None:
+            fingerprint = get_fingerprint(self.serialize())
+
+            if self.is_read_only():
+                self._fingerprint = fingerprint
+
+        return fingerprint
+
     def serialize(self):
         value = {
             'catalog': self.get_catalog(),
@@ -169,6 +293,10 @@ class Spec(object):
 
         return cls(data['spec'], name=data.get('name'), member=data.get('member', False))
 
+    def warm_expression_cache(self):
+        # Compile the expressions in the spec ahead of evaluation.
+        expr_base.warm_cache(self.spec)
+
     @classmethod
     def get_catalog(cls):
         return cls._catalog
@@ -179,64 +307,121 @@ class Spec(object):
 
     @classmethod
     def get_schema_validator(cls):
-        if not cls._schema_validator:
-            cls._schema_validator = jsonschema.Draft4Validator(cls.get_schema())
+        # The validator is kept on the class itself and not inherited by the subclasses.
+        validator = cls.__dict__.get('_schema_validator')
 
-        return cls._schema_validator
+        if validator is None:
+            with _SPEC_CLASS_CACHE_LOCK:
+                validator = cls.__dict__.get('_schema_validator')
+
+                if validator is None:
+                    validator = jsonschema.Draft4Validator(cls.get_schema())
+                    cls._schema_validator = validator
+
+        return validator
 
     @classmethod
-    def get_meta_schema(cls):
-        meta_schema = {}
+    def _get_cached_schema(cls, key, build_func):
+        # The schemas are merged from the class hierarchy once per class and cached on the
+        # class itself and not inherited by the subclasses. The cached schemas are shared
+        # by all the instances of the class and must not be modified.
+        schema_cache = cls.__dict__.get('_schema_cache')
 
-        bases = [b for b in cls.__bases__ if issubclass(b, Spec)]
+        if schema_cache is not None and key in schema_cache:
+            return schema_cache[key]
 
-        for base_cls in bases:
-            parent_meta_schema = base_cls.get_meta_schema()
-            meta_schema = schema_util.merge_schema(meta_schema, parent_meta_schema)
+        with _SPEC_CLASS_CACHE_LOCK:
+            if '_schema_cache' not in cls.__dict__:
+                cls._schema_cache = {}
 
-        return schema_util.merge_schema(meta_schema, cls._meta_schema)
+            if key not in cls._schema_cache:
+                cls._schema_cache[key] = build_func()
+
+        return cls._schema_cache[key]
 
     @classmethod
-    def get_schema(cls, includes=['meta'], resolve_specs=True):
-        schema = {}
+    def _get_meta_schema(cls):
+        def build():
+            meta_schema = {}
 
-        bases = [b for b in cls.__bases__ if issubclass(b, Spec)]
+            bases = [b for b in cls.__bases__ if issubclass(b, Spec)]
 
-        for base_cls in bases:
-            parent_schema = base_cls.get_schema(includes=None)
-            schema = schema_util.merge_schema(schema, parent_schema)
+            for base_cls in bases:
+                parent_meta_schema = base_cls._get_meta_schema()
+                meta_schema = schema_util.merge_schema(meta_schema, parent_meta_schema)
 
-        schema = schema_util.merge_schema(schema, cls._schema)
+            return schema_util.merge_schema(meta_schema, cls._meta_schema)
 
-        if includes and 'meta' in includes:
-            meta_schema = cls.get_meta_schema()
-            schema = schema_util.merge_schema(schema, meta_schema)
+        return cls._get_cached_schema('meta', build)
 
-        if not resolve_specs:
-            return schema
+    @classmethod
+    def get_meta_schema(cls):
+        return copy.deepcopy(cls._get_meta_schema())
+
+    @classmethod
+    def _get_schema(cls, includes=['meta'], resolve_specs=True):
+        include_meta = bool(includes and 'meta' in includes)
+
+        def build():
+            schema = {}
+
+            bases = [b for b in cls.__bases__ if issubclass(b, Spec)]
 
-        # Resolve the schema for children specs under properties.
-        for k, v in six.iteritems(schema.get('properties', {})):
-            if inspect.isclass(v) and issubclass(v, Spec):
-                schema['properties'][k] = v.get_schema(includes=None)
+            for base_cls in bases:
+                parent_schema = base_cls._get_schema(includes=None)
+                schema = schema_util.merge_schema(schema, parent_schema)
 
-        # Resolve the schema for children specs under patternProperties.
-        for k, v in six.iteritems(schema.get('patternProperties', {})):
-            if inspect.isclass(v) and issubclass(v, Spec):
-                schema['patternProperties'][k] = v.get_schema(includes=None)
+            schema = schema_util.merge_schema(schema, cls._schema)
 
-        # Resolve the schema for children specs under items.
-        items_schema = schema.get('items', {})
+            if include_meta:
+                meta_schema = cls._get_meta_schema()
+                schema = schema_util.merge_schema(schema, meta_schema)
 
-        if (inspect.isclass(items_schema) and issubclass(items_schema, Spec)):
-            schema['items'] = items_schema.get_schema(includes=None)
-        elif isinstance(items_schema, dict):
-            for k, v in six.iteritems(items_schema.get('properties', {})):
+            if not resolve_specs:
+                return schema
+
+            # Resolve the schema for children specs under properties.
+            for k, v in six.iteritems(schema.get('properties', {})):
                 if inspect.isclass(v) and issubclass(v, Spec):
-                    schema_properties = schema['items']['properties']
-                    schema_properties[k] = v.get_schema(includes=None)
+                    schema['properties'][k] = v.get_schema(includes=None)
+
+            # Resolve the schema for children specs under patternProperties.
+            for k, v in six.iteritems(schema.get('patternProperties', {})):
+                if inspect.isclass(v) and issubclass(v, Spec):
+                    schema['patternProperties'][k] = v.get_schema(includes=None)
+
+            # Resolve the schema for children specs under items.
+            items_schema = schema.get('items', {})
+
+            if (inspect.isclass(items_schema) and issubclass(items_schema, Spec)):
+                schema['items'] = items_schema.get_schema(includes=None)
+            elif isinstance(items_schema, dict):
+                for k, v in six.iteritems(items_schema.get('properties', {})):
+                    if inspect.isclass(v) and issubclass(v, Spec):
+                        schema_properties = schema['items']['properties']
+                        schema_properties[k] = v.get_schema(includes=None)
+
+            return schema
 
-        return schema
+        return cls._get_cached_schema(('schema', include_meta, resolve_specs), build)
+
+    @classmethod
+    def get_schema(cls, includes=['meta'], resolve_specs=True):
+        # A copy of the cached schema is returned so the caller can modify the schema.
+        return copy.deepcopy(cls._get_schema(includes=includes, resolve_specs=resolve_specs))
+
+    @classmethod
+    def _get_spec_schema(cls, member=False):
+        # The schema used to construct the spec instance where the meta schema is
+        # included for the spec that is not a member of another spec.
+        def build():
+            schema = cls._get_schema(includes=None, resolve_specs=False)
+            return schema_util.merge_schema(cls._get_meta_schema(), schema)
+
+        if member:
+            return cls._get_schema(includes=None, resolve_specs=False)
+
+        return cls._get_cached_schema('spec', build)
 
     def get_spec_path(self, prop_name, parent=None):
         return (parent.get('spec_path') + '.' + prop_name).strip('.') if parent else prop_name
@@ -329,7 +514,7 @@ class Spec(object):
 
         errors = []
         properties = {}
-        schema = self.get_schema(includes=None)
+        schema = self._get_schema(includes=None)
 
         for prop_name, prop_type in six.iteritems(schema.get('properties', {})):
             properties[prop_name] = getattr(self, prop_name)
@@ -381,7 +566,7 @@ class Spec(object):
 
         errors = []
         properties = {}
-        schema = self.get_schema(includes=None)
+        schema = self._get_schema(includes=None)
 
         for prop_name, prop_type in six.iteritems(schema.get('properties', {})):
             properties[prop_name] = getattr(self, prop_name)
@@ -624,10 +809,7 @@ class SequenceSpec(Spec, collections.MutableSequence):
     def __init__(self, spec, name=None, member=False):
         super(SequenceSpec, self).__init__(spec, name=name, member=member)
 
-        schema = (
-            self._schema if member else
-            schema_util.merge_schema(self.get_meta_schema(), self._schema)
-        )
+        schema = self._get_spec_schema(member=member)
 
         if schema.get('type') != 'array':
             raise exc.SchemaDefinitionError('The schema for SequenceSpec must be type of array.')
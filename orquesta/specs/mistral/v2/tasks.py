@@ -23,7 +23,7 @@ from orquesta.expressions import base as expr_base
 from orquesta.specs.mistral.v2 import base as mistral_spec_base
 from orquesta.specs.mistral.v2 import policies as policy_models
 from orquesta.specs import types as spec_types
-from orquesta.utils import dictionary as dict_util
+from orquesta.utils import context as ctx_util
 
 
 LOG = logging.getLogger(__name__)
@@ -133,6 +133,12 @@ class TaskSpec(mistral_spec_base.Spec):
         'publish'
     ]
 
+    def __init__(self, *args, **kwargs):
+        super(TaskSpec, self).__init__(*args, **kwargs)
+
+        # The task spec is shared by the tasks that are rendered from it.
+        self.set_read_only()
+
     def has_items(self):
         return hasattr(self, 'with-items') and getattr(self, 'with-items', None) is not None
 
@@ -142,7 +148,10 @@ class TaskSpec(mistral_spec_base.Spec):
     def has_join(self):
         return hasattr(self, 'join') and self.join
 
-    def render(self, in_ctx):
+    def get_items(self, in_ctx):
+        raise NotImplementedError('Task with items is not implemented.')
+
+    def render(self, in_ctx, items=None, item_ids=None):
         action_specs = []
 
         if self.has_items():
@@ -176,7 +185,7 @@ class TaskSpec(mistral_spec_base.Spec):
         except exc.ExpressionEvaluationException as e:
             errors.append(str(e))
 
-        out_ctx = dict_util.merge_dicts(in_ctx, new_ctx, overwrite=True)
+        out_ctx = ctx_util.LayeredContext([in_ctx, new_ctx]).flatten()
 
         for key in list(out_ctx.keys()):
             if key.startswith('__'):
@@ -222,10 +231,35 @@ class TaskMappingSpec(mistral_spec_base.MappingSpec):
 
         return sorted(next_tasks, key=lambda x: x[0])
 
+    def _get_prev_tasks_map(self):
+        # The task transitions do not change after the spec is instantiated so the inbound
+        # transitions of all the tasks are identified once per spec instance.
+        prev_tasks_map = self.__dict__.get('_prev_tasks_map')
+
+        if prev_tasks_map is not None:
+            return prev_tasks_map
+
+        prev_tasks_map = {}
+
+        for name, task_spec in six.iteritems(self):
+            for next_task in self.get_next_tasks(name):
+                prev_task = (name, next_task[1], next_task[2])
+                prev_tasks_map.setdefault(next_task[0], []).append(prev_task)
+
+        for prev_tasks in prev_tasks_map.values():
+            prev_tasks.sort(key=lambda x: x[0])
+
+        self._prev_tasks_map = prev_tasks_map
+
+        return self._prev_tasks_map
+
     def get_prev_tasks(self, task_name, *args, **kwargs):
         prev_tasks = []
         conditions = kwargs.get('conditions')
 
+        if not conditions:
+            return list(self._get_prev_tasks_map().get(task_name, []))
+
         for name, task_spec in six.iteritems(self):
             for next_task in self.get_next_tasks(name, conditions=conditions):
                 if task_name == next_task[0]:
@@ -252,11 +286,20 @@ class TaskMappingSpec(mistral_spec_base.MappingSpec):
     def is_split_task(self, task_name):
         return (
             not self.is_join_task(task_name) and
-            len(self.get_prev_tasks(task_name)) > 1
+            len(self._get_prev_tasks_map().get(task_name, [])) > 1
         )
 
     def in_cycle(self, task_name):
-        traversed = []
+        # The result is kept per spec instance since the task transitions do not change.
+        in_cycle_map = self.__dict__.setdefault('_in_cycle_map', {})
+
+        if task_name not in in_cycle_map:
+            in_cycle_map[task_name] = self._in_cycle(task_name)
+
+        return in_cycle_map[task_name]
+
+    def _in_cycle(self, task_name):
+        traversed = set()
         q = queue.Queue()
 
         for task in self.get_next_tasks(task_name):
@@ -278,7 +321,7 @@ class TaskMappingSpec(mistral_spec_base.MappingSpec):
             for task in self.get_next_tasks(next_task_name):
                 q.put(task[0])
 
-            traversed.append(next_task_name)
+            traversed.add(next_task_name)
 
         return False
 
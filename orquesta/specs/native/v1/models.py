@@ -14,6 +14,7 @@
 
 import copy
 import logging
+import networkx as nx
 import six
 from six.moves import queue
 import yaml
@@ -24,7 +25,6 @@ from orquesta.expressions import base as expr_base
 from orquesta.specs.native.v1 import base as native_v1_specs
 from orquesta.specs import types as spec_types
 from orquesta.utils import context as ctx_util
-from orquesta.utils import dictionary as dict_util
 from orquesta.utils import parameters as args_util
 
 
@@ -162,6 +162,9 @@ class TaskSpec(native_v1_specs.Spec):
             self.action = action_spec[:action_spec.index(' ')]
             self.input = input_spec
 
+        # The task spec is shared by the tasks that are rendered from it.
+        self.set_read_only()
+
     def has_items(self):
         return hasattr(self, 'with') and getattr(self, 'with', None) is not None
 
@@ -171,46 +174,72 @@ class TaskSpec(native_v1_specs.Spec):
     def has_join(self):
         return hasattr(self, 'join') and self.join
 
-    def render(self, in_ctx):
+    def get_render_plans(self):
+        # The evaluation plans for the action and input are compiled on first render and
+        # reused for every item so the parts of the input without expressions are skipped.
+        if getattr(self, '_render_plans', None) is None:
+            self._render_plans = (
+                expr_base.EvaluationPlan(self.action),
+                expr_base.EvaluationPlan(getattr(self, 'input', {}))
+            )
+
+        return self._render_plans
+
+    def get_items(self, in_ctx):
+        items_spec = self.get_items_spec()
+
+        items_expr = (
+            items_spec.items.strip() if ' in ' not in items_spec.items
+            else items_spec.items[items_spec.items.index(' in ') + 4:].strip()
+        )
+
+        items = expr_base.evaluate(items_expr, in_ctx)
+
+        if not isinstance(items, list):
+            raise TypeError('The value of "%s" is not type of list.' % items_expr)
+
+        item_keys = (
+            None if ' in ' not in items_spec.items
+            else items_spec.items[:items_spec.items.index(' in ')].replace(' ', '').split(',')
+        )
+
+        if not item_keys:
+            return items
+
+        return [
+            dict(zip(item_keys, list(item))) if isinstance(item, (tuple, list))
+            else {item_keys[0]: item} if len(item_keys) == 1
+            else item
+            for item in items
+        ]
+
+    def render(self, in_ctx, items=None, item_ids=None):
         action_specs = []
+        action_plan, input_plan = self.get_render_plans()
 
         if not self.has_items():
             action_spec = {
-                'action': expr_base.evaluate(self.action, in_ctx),
-                'input': expr_base.evaluate(getattr(self, 'input', {}), in_ctx)
+                'action': action_plan.evaluate(in_ctx),
+                'input': input_plan.evaluate(in_ctx)
             }
 
             action_specs.append(action_spec)
         else:
-            items_spec = self.get_items_spec()
-
-            items_expr = (
-                items_spec.items.strip() if ' in ' not in items_spec.items
-                else items_spec.items[items_spec.items.index(' in ') + 4:].strip()
-            )
+            # The items can be evaluated ahead by the caller. If the list of item ids is
+            # given, then only the action specs for these items are rendered.
+            if items is None:
+                items = self.get_items(in_ctx)
 
-            items = expr_base.evaluate(items_expr, in_ctx)
+            if item_ids is None:
+                item_ids = range(0, len(items))
 
-            if not isinstance(items, list):
-                raise TypeError('The value of "%s" is not type of list.' % items_expr)
-
-            item_keys = (
-                None if ' in ' not in items_spec.items
-                else items_spec.items[:items_spec.items.index(' in ')].replace(' ', '').split(',')
-            )
-
-            for idict_util, item in enumerate(items):
-                if item_keys and (isinstance(item, tuple) or isinstance(item, list)):
-                    item = dict(zip(item_keys, list(item)))
-                elif item_keys and len(item_keys) == 1:
-                    item = {item_keys[0]: item}
-
-                item_ctx_value = ctx_util.set_current_item(in_ctx, item)
+            for item_id in item_ids:
+                item_ctx_value = ctx_util.set_current_item(in_ctx, items[item_id])
 
                 action_spec = {
-                    'action': expr_base.evaluate(self.action, item_ctx_value),
-                    'input': expr_base.evaluate(getattr(self, 'input', {}), item_ctx_value),
-                    'item_id': idict_util
+                    'action': action_plan.evaluate(item_ctx_value),
+                    'input': input_plan.evaluate(item_ctx_value),
+                    'item_id': item_id
                 }
 
                 action_specs.append(action_spec)
@@ -218,7 +247,7 @@ class TaskSpec(native_v1_specs.Spec):
         return self, action_specs
 
     def finalize_context(self, next_task_name, task_transition_meta, in_ctx):
-        rolling_ctx = copy.deepcopy(in_ctx)
+        rolling_ctx = ctx_util.ContextOverlay(in_ctx)
         new_ctx = {}
         errors = []
 
@@ -238,7 +267,7 @@ class TaskSpec(native_v1_specs.Spec):
                 except exc.ExpressionEvaluationException as e:
                     errors.append(e)
 
-        out_ctx = dict_util.merge_dicts(in_ctx, new_ctx, overwrite=True)
+        out_ctx = ctx_util.LayeredContext([in_ctx, new_ctx]).flatten()
 
         for key in list(out_ctx.keys()):
             if key.startswith('__'):
@@ -287,15 +316,30 @@ class TaskMappingSpec(native_v1_specs.MappingSpec):
 
         return sorted(next_tasks, key=lambda x: x[0])
 
-    def get_prev_tasks(self, task_name, *args, **kwargs):
-        prev_tasks = []
+    def _get_prev_tasks_map(self):
+        # The task transitions do not change after the spec is instantiated so the inbound
+        # transitions of all the tasks are identified once per spec instance.
+        prev_tasks_map = self.__dict__.get('_prev_tasks_map')
+
+        if prev_tasks_map is not None:
+            return prev_tasks_map
+
+        prev_tasks_map = {}
 
         for name, task_spec in six.iteritems(self):
             for next_task in self.get_next_tasks(name):
-                if task_name == next_task[0]:
-                    prev_tasks.append((name, next_task[1], next_task[2]))
+                prev_task = (name, next_task[1], next_task[2])
+                prev_tasks_map.setdefault(next_task[0], []).append(prev_task)
 
-        return sorted(prev_tasks, key=lambda x: x[0])
+        for prev_tasks in prev_tasks_map.values():
+            prev_tasks.sort(key=lambda x: x[0])
+
+        self._prev_tasks_map = prev_tasks_map
+
+        return self._prev_tasks_map
+
+    def get_prev_tasks(self, task_name, *args, **kwargs):
+        return list(self._get_prev_tasks_map().get(task_name, []))
 
     def get_start_tasks(self):
         start_tasks = [
@@ -314,42 +358,43 @@ class TaskMappingSpec(native_v1_specs.MappingSpec):
     def is_split_task(self, task_name):
         return (
             not self.is_join_task(task_name) and
-            len(self.get_prev_tasks(task_name)) > 1
+            len(self._get_prev_tasks_map().get(task_name, [])) > 1
         )
 
-    def in_cycle(self, task_name):
-        traversed = []
-        q = queue.Queue()
+    def _get_cycle_members(self):
+        cycle_members = self.__dict__.get('_cycle_members')
 
-        for task in self.get_next_tasks(task_name):
-            q.put(task[0])
+        if cycle_members is not None:
+            return cycle_members
 
-        while not q.empty():
-            next_task_name = q.get()
+        # A task is in a cycle if it belongs to a strongly connected component with other
+        # tasks or if it transitions to itself. The components are identified once per spec
+        # instance in linear time instead of traversing the transitions for each task.
+        graph = nx.DiGraph()
 
-            # If the next task matches the original task, then it's in a loop.
-            if next_task_name == task_name:
-                return True
+        for name, task_spec in six.iteritems(self):
+            graph.add_node(name)
 
-            # If the next task has already been traversed but didn't match the
-            # original task, then there's a loop but the original task is not
-            # in the loop.
-            if next_task_name in traversed:
-                continue
+            for next_task in self.get_next_tasks(name):
+                graph.add_edge(name, next_task[0])
 
-            for task in self.get_next_tasks(next_task_name):
-                q.put(task[0])
+        cycle_members = set()
 
-            traversed.append(next_task_name)
+        for component in nx.strongly_connected_components(graph):
+            if len(component) > 1:
+                cycle_members.update(component)
 
-        return False
+        cycle_members.update([n for n in graph.nodes() if graph.has_edge(n, n)])
 
-    def has_cycles(self):
-        for task_name, task_spec in six.iteritems(self):
-            if self.in_cycle(task_name):
-                return True
+        self._cycle_members = cycle_members
+
+        return self._cycle_members
 
-        return False
+    def in_cycle(self, task_name):
+        return task_name in self._get_cycle_members()
+
+    def has_cycles(self):
+        return len(self._get_cycle_members()) > 0
 
     def detect_reserved_names(self, parent=None):
         result = []
@@ -0,0 +1,57 @@
+# Copyright 2019 Extreme Networks, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import copy
+import logging
+
+from orquesta.specs import base as spec_base
+from orquesta.specs import loader as spec_loader
+from orquesta.utils import cache as cache_util
+
+
+LOG = logging.getLogger(__name__)
+
+DEFAULT_REGISTRY_SIZE = 500
+
+# The registry of workflow specs is shared by the conductors in the process. The specs
+# are keyed by the fingerprint of the serialized spec so the conductors of the same
+# workflow definition share the same read only spec instance.
+_REGISTRY = cache_util.LRUCache(DEFAULT_REGISTRY_SIZE)
+
+
+def deserialize(data):
+    def load(fingerprint):
+        spec_module = spec_loader.get_spec_module(data['catalog'])
+        spec = spec_module.WorkflowSpec.deserialize(copy.deepcopy(data))
+        spec.set_read_only()
+        spec._fingerprint = fingerprint
+
+        # Scan and compile the expressions in the spec once for the conductors that share it.
+        spec.warm_expression_cache()
+
+        return spec
+
+    return _REGISTRY.get(spec_base.get_fingerprint(data), load)
+
+
+def get_stats():
+    return _REGISTRY.get_stats()
+
+
+def set_size(size):
+    _REGISTRY.resize(size)
+
+
+def clear():
+    _REGISTRY.clear()
@@ -18,6 +18,7 @@ from hacking import core
 CODE = 'O102'
 
 REQS = {
+    'orquesta.blobstores.base': 'blob_base',
     'orquesta.composers.base': 'comp_base',
     'orquesta.conducting': None,
     'orquesta.constants': None,
@@ -38,11 +39,14 @@ REQS = {
     'orquesta.specs.native': 'native_specs',
     'orquesta.specs.native.v1': 'native_v1_specs',
     'orquesta.specs.native.v1.models': 'native_v1_models',
+    'orquesta.specs.registry': 'spec_registry',
     'orquesta.specs.types': 'spec_types',
     'orquesta.statuses': None,
     'orquesta.tests.fixtures.loader': 'fixture_loader',
     'orquesta.tests.unit.base': 'test_base',
     'orquesta.tests.unit.specs.base': 'test_specs',
+    'orquesta.utils.binary': 'binary_util',
+    'orquesta.utils.cache': 'cache_util',
     'orquesta.utils.context': 'ctx_util',
     'orquesta.utils.date': 'date_util',
     'orquesta.utils.dictionary': 'dict_util',
@@ -0,0 +1,226 @@
+# Copyright 2019 Extreme Networks, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+import json
+import mock
+import os
+import shutil
+import tempfile
+import unittest
+
+from orquesta.blobstores import base as blob_base
+from orquesta.blobstores import local as local_blobs
+from orquesta.blobstores import memory as memory_blobs
+from orquesta import exceptions as exc
+
+
+class BlobStoreTestMixin(object):
+
+    def test_put_and_get(self):
+        self.assertFalse(self.store.has('abc'))
+        self.store.put('abc', b'foobar')
+        self.assertTrue(self.store.has('abc'))
+        self.assertEqual(self.store.get('abc'), b'foobar')
+
+        self.store.put('abc', b'fubar')
+        self.assertEqual(self.store.get('abc'), b'fubar')
+
+    def test_get_nonexistent(self):
+        self.assertRaises(exc.BlobNotFound, self.store.get, 'xyz')
+
+    def test_delete(self):
+        self.store.put('abc', b'foobar')
+        self.store.delete('abc')
+        self.assertFalse(self.store.has('abc'))
+
+        # Deleting a nonexistent blob is ignored.
+        self.store.delete('abc')
+
+
+class MemoryBlobStoreTest(BlobStoreTestMixin, unittest.TestCase):
+
+    def setUp(self):
+        super(MemoryBlobStoreTest, self).setUp()
+        self.store = memory_blobs.MemoryBlobStore()
+
+    def test_get_plugin(self):
+        self.assertEqual(
+            blob_base.get_blob_store_module('memory'),
+            memory_blobs.MemoryBlobStore
+        )
+
+        self.assertIsInstance(
+            blob_base.get_blob_store_instance('memory'),
+            memory_blobs.MemoryBlobStore
+        )
+
+
+class LocalDirectoryBlobStoreTest(BlobStoreTestMixin, unittest.TestCase):
+
+    def setUp(self):
+        super(LocalDirectoryBlobStoreTest, self).setUp()
+        self.path = tempfile.mkdtemp()
+        self.store = local_blobs.LocalDirectoryBlobStore(os.path.join(self.path, 'blobs'))
+
+    def tearDown(self):
+        shutil.rmtree(self.path)
+        super(LocalDirectoryBlobStoreTest, self).tearDown()
+
+    def test_get_plugin(self):
+        self.assertEqual(
+            blob_base.get_blob_store_module('local'),
+            local_blobs.LocalDirectoryBlobStore
+        )
+
+        store = blob_base.get_blob_store_instance('local', self.path)
+        self.assertIsInstance(store, local_blobs.LocalDirectoryBlobStore)
+        self.assertEqual(store.path, self.path)
+
+    def test_blobs_persisted(self):
+        self.store.put('abc', b'foobar')
+
+        store = local_blobs.LocalDirectoryBlobStore(os.path.join(self.path, 'blobs'))
+        self.assertEqual(store.get('abc'), b'foobar')
+        self.assertTrue(os.path.isfile(os.path.join(self.path, 'blobs', 'ab', 'abc')))
+
+    def test_bad_key(self):
+        self.assertRaises(ValueError, self.store.put, '../abc', b'foobar')
+        self.assertRaises(ValueError, self.store.get, '')
+
+
+class BlobOffloadTest(unittest.TestCase):
+
+    def setUp(self):
+        super(BlobOffloadTest, self).setUp()
+        self.store = memory_blobs.MemoryBlobStore()
+        blob_base.set_blob_store(self.store, threshold=100)
+
+    def tearDown(self):
+        blob_base.set_blob_store(None)
+        super(BlobOffloadTest, self).tearDown()
+
+    def test_set_blob_store(self):
+        self.assertIs(blob_base.get_blob_store(), self.store)
+        self.assertEqual(blob_base.get_threshold(), 100)
+        self.assertRaises(TypeError, blob_base.set_blob_store, object())
+        self.assertRaises(ValueError, blob_base.set_blob_store, self.store, -1)
+
+    def test_offload_and_resolve(self):
+        value = {'data': 'x' * 200}
+        ref = blob_base.offload(value)
+
+        self.assertTrue(blob_base.is_ref(ref))
+        self.assertEqual(len(self.store._blobs), 1)
+        self.assertDictEqual(blob_base.resolve(ref), value)
+
+        # The same value is stored once.
+        self.assertDictEqual(blob_base.offload({'data': 'x' * 200}), ref)
+        self.assertEqual(len(self.store._blobs), 1)
+
+        # References are not offloaded again.
+        self.assertIs(blob_base.offload(ref), ref)
+
+    def test_offload_below_threshold(self):
+        for value in [None, True, 1, 1.5, 'abc', {'a': 'b'}, [1, 2, 3]]:
+            self.assertIs(blob_base.offload(value), value)
+
+        self.assertEqual(len(self.store._blobs), 0)
+
+    def test_offload_values(self):
+        values = {'a': 'abc', 'b': ['x' * 200]}
+        offloaded = blob_base.offload_values(values)
+
+        self.assertEqual(offloaded['a'], 'abc')
+        self.assertTrue(blob_base.is_ref(offloaded['b']))
+        self.assertListEqual(values['b'], ['x' * 200])
+        self.assertDictEqual(blob_base.resolve_values(offloaded), values)
+
+    def test_resolve_list_of_refs(self):
+        values = ['x' * 200, 'abc', None]
+        refs = [blob_base.offload(v) for v in values]
+
+        self.assertTrue(blob_base.is_ref(refs[0]))
+        self.assertListEqual(blob_base.resolve(refs), values)
+
+    def test_offload_without_blob_store(self):
+        ref = blob_base.offload('x' * 200)
+        blob_base.set_blob_store(None)
+
+        self.assertEqual(blob_base.offload('x' * 200), 'x' * 200)
+        self.assertRaises(exc.BlobStoreError, blob_base.resolve, ref)
+
+    def test_resolve_serialized_refs(self):
+        values = {'a': 'abc', 'b': ['x' * 200]}
+        offloaded = blob_base.offload_values(values)
+        offloaded['c'] = [blob_base.offload('x' * 200), 'abc']
+        offloaded = json.loads(json.dumps(offloaded))
+
+        self.assertTrue(blob_base.is_ref(offloaded['b']))
+        self.assertTrue(blob_base.is_ref(offloaded['c'][0]))
+
+        expected = {'a': 'abc', 'b': ['x' * 200], 'c': ['x' * 200, 'abc']}
+        self.assertDictEqual(blob_base.resolve_values(offloaded), expected)
+
+    def test_escape_user_values_with_reserved_keys(self):
+        values = {
+            'a': {blob_base.BLOB_REF_KEY: 'abc'},
+            'b': [{blob_base.BLOB_ESCAPE_KEY: 'abc'}, 'abc'],
+            'c': {blob_base.BLOB_REF_KEY: 'x' * 200},
+            'd': {'e': {blob_base.BLOB_REF_KEY: 'abc'}}
+        }
+
+        for store in [None, self.store]:
+            blob_base.set_blob_store(store, threshold=100)
+            offloaded = blob_base.offload_values(values)
+
+            # The user values are not taken as references.
+            self.assertFalse(blob_base.is_ref(offloaded['a']))
+            self.assertTrue(blob_base.is_escaped(offloaded['a']))
+            self.assertTrue(blob_base.is_escaped(offloaded['b'][0]))
+            self.assertIs(offloaded['d'], values['d'])
+            self.assertEqual(blob_base.is_ref(offloaded['c']), store is not None)
+
+            # The escaped values are not escaped again when written again.
+            self.assertDictEqual(blob_base.offload_values(offloaded), offloaded)
+            self.assertIs(blob_base.offload(offloaded['a']), offloaded['a'])
+
+            # The user values are restored when resolved including from the serialized values.
+            self.assertDictEqual(blob_base.resolve_values(offloaded), values)
+            serialized = json.loads(json.dumps(offloaded))
+            self.assertDictEqual(blob_base.resolve_values(serialized), values)
+
+    def test_resolving_mapping(self):
+        values = {'a': 'abc', 'b': blob_base.offload('x' * 200), 'c': blob_base.offload('y' * 200)}
+
+        # The values are returned as is if there is nothing to resolve.
+        unresolved = {'a': 'abc'}
+        self.assertIs(blob_base.get_resolving_mapping(unresolved), unresolved)
+
+        # The values are resolved when accessed.
+        with mock.patch.object(self.store, 'get', wraps=self.store.get) as mock_get:
+            mapping = blob_base.get_resolving_mapping(values)
+            self.assertIsInstance(mapping, blob_base.ResolvingMapping)
+            self.assertEqual(len(mapping), 3)
+            self.assertListEqual(sorted(mapping), ['a', 'b', 'c'])
+            mock_get.assert_not_called()
+
+            self.assertEqual(mapping['a'], 'abc')
+            self.assertEqual(mapping['b'], 'x' * 200)
+            self.assertEqual(mapping['b'], 'x' * 200)
+            self.assertEqual(mock_get.call_count, 1)
+
+            expected = {'a': 'abc', 'b': 'x' * 200, 'c': 'y' * 200}
+            self.assertDictEqual(dict(mapping), expected)
+            self.assertEqual(mock_get.call_count, 2)
@@ -12,6 +12,9 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import mock
+
+from orquesta.composers import base as comp_base
 from orquesta.composers import native as native_comp
 from orquesta.tests.unit.composition.native import base as native_comp_test_base
 from orquesta.utils import plugin as plugin_util
@@ -24,3 +27,45 @@ class WorkflowComposerTest(native_comp_test_base.OrchestraWorkflowComposerTest):
             plugin_util.get_module('orquesta.composers', self.spec_module_name),
             native_comp.WorkflowComposer
         )
+
+    def setUp(self):
+        super(WorkflowComposerTest, self).setUp()
+        comp_base.clear_graph_cache()
+
+    def tearDown(self):
+        comp_base.set_graph_cache_size(comp_base.DEFAULT_GRAPH_CACHE_SIZE)
+        comp_base.clear_graph_cache()
+        super(WorkflowComposerTest, self).tearDown()
+
+    def test_get_graph_cached(self):
+        with mock.patch.object(
+                native_comp.WorkflowComposer, 'compose',
+                wraps=native_comp.WorkflowComposer.compose) as mock_compose:
+            wf_graph1 = native_comp.WorkflowComposer.get_graph(self.get_wf_spec('sequential'))
+            wf_graph2 = native_comp.WorkflowComposer.get_graph(self.get_wf_spec('sequential'))
+
+        # The graph is composed once and shared read only by the specs of the same definition.
+        self.assertEqual(mock_compose.call_count, 1)
+        self.assertIs(wf_graph1, wf_graph2)
+        self.assertTrue(wf_graph1.is_read_only())
+
+        expected_stats = {
+            'size': comp_base.DEFAULT_GRAPH_CACHE_SIZE,
+            'count': 1,
+            'hits': 1,
+            'misses': 1,
+            'evictions': 0
+        }
+
+        self.assertDictEqual(comp_base.get_graph_cache_stats(), expected_stats)
+
+    def test_get_graph_cache_eviction(self):
+        comp_base.set_graph_cache_size(1)
+
+        wf_graph1 = native_comp.WorkflowComposer.get_graph(self.get_wf_spec('sequential'))
+        native_comp.WorkflowComposer.get_graph(self.get_wf_spec('parallel'))
+        wf_graph2 = native_comp.WorkflowComposer.get_graph(self.get_wf_spec('sequential'))
+
+        self.assertIsNot(wf_graph1, wf_graph2)
+        self.assert_graph_equal(wf_graph2, wf_graph1.serialize())
+        self.assertEqual(comp_base.get_graph_cache_stats()['evictions'], 2)
@@ -12,6 +12,9 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import copy
+import mock
+
 from orquesta import conducting
 from orquesta.specs import native as native_specs
 from orquesta import statuses
@@ -199,6 +202,130 @@ class WorkflowConductorTaskRenderingTest(test_base.WorkflowConductorTest):
 
         self.assert_task_list(conductor, conductor.get_next_tasks(), expected_tasks)
 
+    def test_rendering_isolated_from_workflow_state(self):
+        wf_def = """
+        version: 1.0
+
+        vars:
+          - x:
+              foo: bar
+          - xs:
+              - foo: bar
+
+        tasks:
+          task1:
+            action: core.echo
+            input:
+              x: '{{ ctx("x") }}'
+          task2:
+            with: <% ctx(xs) %>
+            action: core.echo
+            input:
+              x: <% item() %>
+        """
+
+        spec = native_specs.WorkflowSpec(wf_def)
+        self.assertDictEqual(spec.inspect(), {})
+
+        conductor = conducting.WorkflowConductor(spec)
+        conductor.request_workflow_status(statuses.RUNNING)
+        expected_contexts = copy.deepcopy(conductor.workflow_state.contexts)
+
+        # Change the rendered input and context of the next tasks.
+        for task in conductor.get_next_tasks():
+            task['actions'][0]['input']['x']['foo'] = 'fubar'
+            task['ctx']['x']['foo'] = 'fubar'
+            task['ctx']['xs'][0]['foo'] = 'fubar'
+
+        # Assert the workflow state and the rendered tasks are not changed.
+        self.assertListEqual(conductor.workflow_state.contexts, expected_contexts)
+
+        for task_id in ['task1', 'task2']:
+            task = conductor.get_task(task_id, 0)
+            self.assertDictEqual(task['actions'][0]['input'], {'x': {'foo': 'bar'}})
+
+    def test_rendering_isolated_from_workflow_spec(self):
+        wf_def = """
+        version: 1.0
+
+        input:
+          - message
+
+        tasks:
+          task1:
+            action: core.echo
+            input:
+              message: <% ctx().message %>
+              options:
+                retries: [1, 2]
+        """
+
+        spec = native_specs.WorkflowSpec(wf_def)
+        conductor = conducting.WorkflowConductor(spec, inputs={'message': 'foobar'})
+        conductor.request_workflow_status(statuses.RUNNING)
+        data = conductor.serialize()
+
+        # Change the literal parts of the rendered input.
+        task = conductor.get_next_tasks()[0]
+        task['actions'][0]['input']['options']['retries'].append(3)
+        task['actions'][0]['input']['options']['foo'] = 'bar'
+
+        # Render the task again from a new conductor that shares the spec.
+        conductor = conducting.WorkflowConductor.deserialize(data)
+        task = conductor.get_next_tasks()[0]
+        expected_input = {'message': 'foobar', 'options': {'retries': [1, 2]}}
+        self.assertDictEqual(task['actions'][0]['input'], expected_input)
+
+        # Assert the literal parts of the input are not changed in the spec.
+        task_spec = conductor.spec.tasks.get_task('task1')
+        self.assertDictEqual(task_spec.input['options'], {'retries': [1, 2]})
+
+    def test_rendering_items_isolated_from_workflow_spec(self):
+        wf_def = """
+        version: 1.0
+
+        tasks:
+          task1:
+            with: <% range(3) %>
+            action: core.echo
+            input:
+              message: <% item() %>
+              options:
+                retries: [1, 2]
+        """
+
+        spec = native_specs.WorkflowSpec(wf_def)
+        conductor = conducting.WorkflowConductor(spec)
+        conductor.request_workflow_status(statuses.RUNNING)
+        task_spec = conductor.spec.tasks.get_task('task1')
+        literal = task_spec.input['options']
+
+        # The literal parts of the input are copied once for each item.
+        memos = []
+        deepcopy = copy.deepcopy
+
+        def record_deepcopy(value, memo=None):
+            memo = {} if memo is None else memo
+            memos.append(memo)
+
+            return deepcopy(value, memo)
+
+        with mock.patch.object(copy, 'deepcopy', side_effect=record_deepcopy):
+            task = conductor.get_next_tasks()[0]
+
+        self.assertEqual(len([memo for memo in memos if id(literal) in memo]), 3)
+
+        actions = task['actions']
+        self.assertIsNot(actions[0]['input']['options'], literal)
+        self.assertIsNot(actions[0]['input']['options'], actions[1]['input']['options'])
+
+        # Change the literal parts of the rendered input of the first item.
+        actions[0]['input']['options']['retries'].append(3)
+
+        expected_input = {'message': 1, 'options': {'retries': [1, 2]}}
+        self.assertDictEqual(actions[1]['input'], expected_input)
+        self.assertDictEqual(literal, {'retries': [1, 2]})
+
     def test_task_delay_rendering(self):
         wf_def = """
         version: 1.0
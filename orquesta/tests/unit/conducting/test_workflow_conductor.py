@@ -117,6 +117,7 @@ class WorkflowConductorTest(test_base.WorkflowConductorTest):
         expected_data = {
             'spec': conductor.spec.serialize(),
             'graph': conductor.graph.serialize(),
+            'checkpoint': conductor.get_checkpoint(),
             'context': {},
             'input': {},
             'output': None,
@@ -158,6 +159,7 @@ class WorkflowConductorTest(test_base.WorkflowConductorTest):
         expected_data = {
             'spec': conductor.spec.serialize(),
             'graph': conductor.graph.serialize(),
+            'checkpoint': conductor.get_checkpoint(),
             'context': {},
             'input': inputs,
             'output': None,
@@ -201,6 +203,7 @@ class WorkflowConductorTest(test_base.WorkflowConductorTest):
         expected_data = {
             'spec': conductor.spec.serialize(),
             'graph': conductor.graph.serialize(),
+            'checkpoint': conductor.get_checkpoint(),
             'context': {},
             'input': inputs,
             'output': None,
@@ -245,6 +248,7 @@ class WorkflowConductorTest(test_base.WorkflowConductorTest):
         expected_data = {
             'spec': conductor.spec.serialize(),
             'graph': conductor.graph.serialize(),
+            'checkpoint': conductor.get_checkpoint(),
             'context': context,
             'input': inputs,
             'output': None,
@@ -291,6 +295,7 @@ class WorkflowConductorTest(test_base.WorkflowConductorTest):
         expected_data = {
             'spec': conductor.spec.serialize(),
             'graph': conductor.graph.serialize(),
+            'checkpoint': conductor.get_checkpoint(),
             'state': conductor.workflow_state.serialize(),
             'context': conductor.get_workflow_parent_context(),
             'input': conductor.get_workflow_input(),
@@ -312,6 +317,33 @@ class WorkflowConductorTest(test_base.WorkflowConductorTest):
         self.assertEqual(len(conductor.workflow_state.tasks), 5)
         self.assertEqual(len(conductor.workflow_state.sequence), 5)
 
+    def test_binary_serialization(self):
+        inputs = {'a': 123, 'b': True}
+        conductor = self._prep_conductor(inputs=inputs, status=statuses.RUNNING)
+
+        # Mock task flows.
+        for i in range(1, 6):
+            status_changes = [statuses.RUNNING, statuses.SUCCEEDED]
+            self.forward_task_statuses(conductor, 'task' + str(i), status_changes)
+
+        expected_data = conductor.serialize()
+
+        for compress in [False, True]:
+            data = conductor.serialize_binary(compress=compress)
+            self.assertIsInstance(data, bytes)
+
+            # Deserialize and check.
+            restored = conducting.WorkflowConductor.deserialize_binary(data)
+
+            self.assertDictEqual(restored.serialize(), expected_data)
+            self.assertEqual(restored.get_workflow_status(), statuses.SUCCEEDED)
+            self.assertEqual(len(restored.workflow_state.tasks), 5)
+            self.assertEqual(len(restored.workflow_state.sequence), 5)
+
+        # The conductor does not share the data with the serialized conductor.
+        expected_data['state']['sequence'][0]['status'] = statuses.FAILED
+        self.assertEqual(conductor.workflow_state.sequence[0]['status'], statuses.SUCCEEDED)
+
     def test_get_workflow_initial_context(self):
         conductor = self._prep_conductor()
         expected_init_ctx = {'a': None, 'b': False}
@@ -364,7 +396,6 @@ class WorkflowConductorTest(test_base.WorkflowConductorTest):
         task_name = 'task1'
         expected_ctx = dict_util.merge_dicts(copy.deepcopy(inputs), {'b': False})
         expected_ctx['__current_task'] = {'id': task_name, 'route': task_route}
-        expected_ctx['__state'] = conductor.workflow_state.serialize()
         task = conductor.get_task(task_name, task_route)
         self.assertEqual(task['id'], task_name)
         self.assertEqual(task['route'], task_route)
@@ -375,12 +406,20 @@ class WorkflowConductorTest(test_base.WorkflowConductorTest):
         task_name = 'task2'
         expected_ctx = dict_util.merge_dicts(copy.deepcopy(expected_ctx), {'c': 'xyz'})
         expected_ctx['__current_task'] = {'id': task_name, 'route': task_route}
-        expected_ctx['__state'] = conductor.workflow_state.serialize()
         task = conductor.get_task(task_name, task_route)
         self.assertEqual(task['id'], task_name)
         self.assertEqual(task['route'], task_route)
         self.assertDictEqual(task['ctx'], expected_ctx)
 
+    def test_get_task_spec_not_copied(self):
+        conductor = self._prep_conductor(inputs={'a': 123}, status=statuses.RUNNING)
+
+        # The read only task spec from the workflow spec is returned with the task.
+        task = conductor.get_task('task1', 0)
+        self.assertIs(task['spec'], conductor.spec.tasks.get_task('task1'))
+        self.assertTrue(task['spec'].is_read_only())
+        self.assertRaises(AttributeError, setattr, task['spec'], 'action', 'core.noop')
+
     def test_get_next_tasks(self):
         inputs = {'a': 123}
         conductor = self._prep_conductor(inputs=inputs, status=statuses.RUNNING)
@@ -841,6 +880,7 @@ class WorkflowConductorTest(test_base.WorkflowConductorTest):
         expected_data = {
             'spec': conductor.spec.serialize(),
             'graph': conductor.graph.serialize(),
+            'checkpoint': conductor.get_checkpoint(),
             'context': {},
             'input': inputs,
             'output': None,
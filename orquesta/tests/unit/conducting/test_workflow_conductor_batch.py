@@ -0,0 +1,268 @@
+# Copyright 2019 Extreme Networks, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+from orquesta import conducting
+from orquesta import events
+from orquesta import exceptions as exc
+from orquesta.specs import native as native_specs
+from orquesta import statuses
+from orquesta.tests.unit import base as test_base
+
+
+class WorkflowConductorBatchTest(test_base.WorkflowConductorTest):
+
+    def _get_task_events(self, next_tasks, get_status):
+        running_events = []
+        completed_events = []
+
+        # The actions of the next tasks are all running before any of the actions completes.
+        for task in next_tasks:
+            for action in task['actions']:
+                item_id = action.get('item_id')
+                ctx = {'item_id': item_id} if item_id is not None else None
+                status = get_status(task['id'], item_id)
+                result = action['input']
+
+                running_events.append(
+                    (task['id'], task['route'], events.ActionExecutionEvent(
+                        statuses.RUNNING, context=ctx))
+                )
+
+                completed_events.append(
+                    (task['id'], task['route'], events.ActionExecutionEvent(
+                        status, result=result, context=ctx))
+                )
+
+        return running_events + completed_events
+
+    def assert_batch_equals_sequential(self, wf_def, get_status=None, inputs=None):
+        if not get_status:
+            get_status = (lambda task_id, item_id: statuses.SUCCEEDED)
+
+        spec = native_specs.WorkflowSpec(wf_def)
+        self.assertDictEqual(spec.inspect(), {})
+
+        seq_conductor = conducting.WorkflowConductor(spec, inputs=inputs)
+        seq_conductor.request_workflow_status(statuses.RUNNING)
+        batch_conductor = conducting.WorkflowConductor(spec, inputs=inputs)
+        batch_conductor.request_workflow_status(statuses.RUNNING)
+
+        next_tasks = seq_conductor.get_next_tasks()
+
+        while next_tasks:
+            self.assertListEqual(batch_conductor.get_next_tasks(), next_tasks)
+
+            for task_id, route, event in self._get_task_events(next_tasks, get_status):
+                seq_conductor.update_task_state(task_id, route, event)
+
+            task_events = self._get_task_events(next_tasks, get_status)
+            task_state_entries = batch_conductor.update_task_states(task_events)
+            self.assertEqual(len(task_state_entries), len(task_events))
+
+            self.assertDictEqual(batch_conductor.serialize(), seq_conductor.serialize())
+
+            next_tasks = seq_conductor.get_next_tasks()
+
+        self.assertListEqual(batch_conductor.get_next_tasks(), [])
+
+        return batch_conductor
+
+    def test_with_items(self):
+        wf_def = """
+        version: 1.0
+
+        vars:
+          - xs:
+              - fee
+              - fi
+              - fo
+              - fum
+
+        tasks:
+          task1:
+            with:
+              items: <% ctx(xs) %>
+              concurrency: 2
+            action: core.echo message=<% item() %>
+            next:
+              - publish:
+                  - items: <% result() %>
+                do: task2
+          task2:
+            action: core.noop
+
+        output:
+          - items: <% ctx(items) %>
+        """
+
+        conductor = self.assert_batch_equals_sequential(wf_def)
+
+        self.assertEqual(conductor.get_workflow_status(), statuses.SUCCEEDED)
+
+        expected_output = {
+            'items': [
+                {'message': 'fee'},
+                {'message': 'fi'},
+                {'message': 'fo'},
+                {'message': 'fum'}
+            ]
+        }
+
+        self.assertDictEqual(conductor.get_workflow_output(), expected_output)
+
+    def test_with_items_failed(self):
+        wf_def = """
+        version: 1.0
+
+        vars:
+          - xs:
+              - fee
+              - fi
+              - fo
+              - fum
+
+        tasks:
+          task1:
+            with: <% ctx(xs) %>
+            action: core.echo message=<% item() %>
+        """
+
+        def get_status(task_id, item_id):
+            return statuses.FAILED if item_id == 1 else statuses.SUCCEEDED
+
+        conductor = self.assert_batch_equals_sequential(wf_def, get_status=get_status)
+
+        self.assertEqual(conductor.get_workflow_status(), statuses.FAILED)
+
+    def test_parallel_join(self):
+        wf_def = """
+        version: 1.0
+
+        tasks:
+          init:
+            action: core.noop
+            next:
+              - do: task1, task2, task3
+          task1:
+            action: core.noop
+            next:
+              - publish: x=1
+                do: join
+          task2:
+            action: core.noop
+            next:
+              - publish: y=2
+                do: join
+          task3:
+            action: core.noop
+            next:
+              - publish: z=3
+                do: join
+          join:
+            join: all
+            action: core.noop
+
+        output:
+          - total: <% ctx(x) + ctx(y) + ctx(z) %>
+        """
+
+        conductor = self.assert_batch_equals_sequential(wf_def)
+
+        self.assertEqual(conductor.get_workflow_status(), statuses.SUCCEEDED)
+        self.assertDictEqual(conductor.get_workflow_output(), {'total': 6})
+
+    def test_cycle(self):
+        wf_def = """
+        version: 1.0
+
+        vars:
+          - count: 0
+
+        tasks:
+          init:
+            action: core.noop
+            next:
+              - do: task1
+          task1:
+            action: core.noop
+            next:
+              - publish: count=<% ctx(count) + 1 %>
+                do: task2
+          task2:
+            action: core.noop
+            next:
+              - when: <% ctx(count) < 3 %>
+                do: task1
+
+        output:
+          - count: <% ctx(count) %>
+        """
+
+        conductor = self.assert_batch_equals_sequential(wf_def)
+
+        self.assertEqual(conductor.get_workflow_status(), statuses.SUCCEEDED)
+        self.assertDictEqual(conductor.get_workflow_output(), {'count': 3})
+
+    def test_remediation_and_fail(self):
+        wf_def = """
+        version: 1.0
+
+        tasks:
+          task1:
+            action: core.noop
+            next:
+              - when: <% failed() %>
+                do: cleanup, fail
+          cleanup:
+            action: core.noop
+        """
+
+        def get_status(task_id, item_id):
+            return statuses.FAILED if task_id == 'task1' else statuses.SUCCEEDED
+
+        conductor = self.assert_batch_equals_sequential(wf_def, get_status=get_status)
+
+        self.assertEqual(conductor.get_workflow_status(), statuses.FAILED)
+
+    def test_invalid_events_not_applied(self):
+        wf_def = """
+        version: 1.0
+
+        tasks:
+          task1:
+            action: core.noop
+        """
+
+        spec = native_specs.WorkflowSpec(wf_def)
+        conductor = conducting.WorkflowConductor(spec)
+        conductor.request_workflow_status(statuses.RUNNING)
+        conductor.get_next_tasks()
+        expected = conductor.serialize()
+
+        task_events = [
+            ('task1', 0, events.ActionExecutionEvent(statuses.RUNNING)),
+            ('task2', 0, events.ActionExecutionEvent(statuses.SUCCEEDED))
+        ]
+
+        self.assertRaises(exc.InvalidTask, conductor.update_task_states, task_events)
+        self.assertDictEqual(conductor.serialize(), expected)
+
+        task_events = [
+            ('task1', 0, events.ActionExecutionEvent(statuses.RUNNING)),
+            ('task1', 0, statuses.SUCCEEDED)
+        ]
+
+        self.assertRaises(TypeError, conductor.update_task_states, task_events)
+        self.assertDictEqual(conductor.serialize(), expected)
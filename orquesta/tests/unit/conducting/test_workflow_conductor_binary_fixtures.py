@@ -0,0 +1,134 @@
+# Copyright 2019 Extreme Networks, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import os
+
+from orquesta import conducting
+from orquesta import events
+from orquesta import statuses
+from orquesta.tests.fixtures import loader as fixture_loader
+from orquesta.tests.unit.conducting.native import base
+
+
+FIXTURE_INPUTS = {
+    'decision': {'which': 'a'},
+    'sequential': {'name': 'Stanley'},
+    'with-items': {'members': ['Lakshmi', 'Lindsay', 'Tomaz', 'Matt']},
+    'with-items-concurrency': {'members': ['Lakshmi', 'Lindsay', 'Tomaz', 'Matt']},
+    'with-multi-items': {
+        'members': ['Lakshmi', 'Lindsay', 'Tomaz', 'Matt'],
+        'messages': ['hello', 'hi', 'hey', 'yo']
+    },
+    'with-multi-items-concurrency': {
+        'members': ['Lakshmi', 'Lindsay', 'Tomaz', 'Matt'],
+        'messages': ['hello', 'hi', 'hey', 'yo']
+    }
+}
+
+# The action input of these workflows cannot be rendered so the workflows fail on the first
+# call to get the next tasks.
+FIXTURE_FAILURES = [
+    'with-multi-items',
+    'with-multi-items-concurrency'
+]
+
+
+class WorkflowConductorBinaryFixturesTest(base.OrchestraWorkflowConductorTest):
+
+    def get_wf_names(self):
+        fixtures_path = os.path.join(
+            fixture_loader.get_workflow_fixtures_base_path(),
+            self.spec_module_name
+        )
+
+        return sorted([
+            os.path.splitext(file_name)[0]
+            for file_name in os.listdir(fixtures_path)
+            if file_name.endswith('.yaml')
+        ])
+
+    def run_next_tasks(self, conductor, next_tasks):
+        for task in next_tasks:
+            task_id = task['id']
+            task_route = task['route']
+
+            # The items of the with items task are run in the order of the item id.
+            if 'items_count' in task:
+                for action in task['actions']:
+                    ctx = {'item_id': action['item_id']}
+                    result = action['input']
+
+                    for status in [statuses.RUNNING, statuses.SUCCEEDED]:
+                        ac_ex_event = events.ActionExecutionEvent(
+                            status,
+                            result=result if status == statuses.SUCCEEDED else None,
+                            context=ctx
+                        )
+
+                        conductor.update_task_state(task_id, task_route, ac_ex_event)
+
+                continue
+
+            for status in [statuses.RUNNING, statuses.SUCCEEDED]:
+                ac_ex_event = events.ActionExecutionEvent(status)
+                conductor.update_task_state(task_id, task_route, ac_ex_event)
+
+    def assert_binary_round_trips(self, wf_name):
+        wf_def = self.get_wf_def(wf_name)
+        wf_spec = self.spec_module.instantiate(wf_def)
+        inputs = FIXTURE_INPUTS.get(wf_name)
+        msg = 'The binary format of the "%s" workflow does not round trip.' % wf_name
+
+        conductor = conducting.WorkflowConductor(wf_spec, inputs=inputs)
+        conductor.request_workflow_status(statuses.RUNNING)
+
+        # The conductor restored from the dict format is the reference for each step.
+        data = conductor.serialize()
+        binary_data = conductor.serialize_binary()
+
+        for i in range(0, 100):
+            conductor = conducting.WorkflowConductor.deserialize(data)
+            binary_conductor = conducting.WorkflowConductor.deserialize_binary(binary_data)
+            self.assertDictEqual(binary_conductor.serialize(), data, msg)
+
+            next_tasks = conductor.get_next_tasks()
+            self.assertListEqual(binary_conductor.get_next_tasks(), next_tasks, msg)
+
+            # Check the workflow failed by rendering the tasks is also the same.
+            if not next_tasks:
+                data = conductor.serialize()
+                self.assertDictEqual(binary_conductor.serialize(), data, msg)
+                binary_conductor = conducting.WorkflowConductor.deserialize_binary(
+                    binary_conductor.serialize_binary()
+                )
+                self.assertDictEqual(binary_conductor.serialize(), data, msg)
+                break
+
+            self.run_next_tasks(conductor, next_tasks)
+            self.run_next_tasks(binary_conductor, next_tasks)
+
+            # Conducting the restored conductors is the same for both formats.
+            data = conductor.serialize()
+            self.assertDictEqual(binary_conductor.serialize(), data, msg)
+            binary_data = binary_conductor.serialize_binary()
+
+        expected_status = statuses.FAILED if wf_name in FIXTURE_FAILURES else statuses.SUCCEEDED
+        self.assertEqual(conductor.get_workflow_status(), expected_status, msg)
+
+    def test_fixtures_round_trip(self):
+        wf_names = self.get_wf_names()
+        self.assertIn('sequential', wf_names)
+
+        for wf_name in wf_names:
+            self.assert_binary_round_trips(wf_name)
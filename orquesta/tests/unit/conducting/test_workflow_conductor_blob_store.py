@@ -0,0 +1,255 @@
+# Copyright 2019 Extreme Networks, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+import json
+import mock
+
+from orquesta.blobstores import base as blob_base
+from orquesta.blobstores import memory as memory_blobs
+from orquesta import conducting
+from orquesta import events
+from orquesta.specs import native as native_specs
+from orquesta import statuses
+from orquesta.tests.unit import base as test_base
+
+
+class WorkflowConductorBlobStoreTest(test_base.WorkflowConductorTest):
+
+    def setUp(self):
+        super(WorkflowConductorBlobStoreTest, self).setUp()
+        self.store = memory_blobs.MemoryBlobStore()
+        blob_base.set_blob_store(self.store, threshold=1024)
+
+    def tearDown(self):
+        blob_base.set_blob_store(None)
+        super(WorkflowConductorBlobStoreTest, self).tearDown()
+
+    def test_large_input_offloaded(self):
+        wf_def = """
+        version: 1.0
+
+        input:
+          - data
+          - name
+
+        tasks:
+          task1:
+            action: core.echo message=<% ctx(name) %>
+            next:
+              - do: task2
+          task2:
+            action: core.echo message=<% ctx(data).substring(0, 3) %>
+        """
+
+        data = 'x' * 1000000
+        spec = native_specs.WorkflowSpec(wf_def)
+        conductor = conducting.WorkflowConductor(spec, inputs={'data': data, 'name': 'fubar'})
+        conductor.request_workflow_status(statuses.RUNNING)
+
+        # The input is stored once in the blob store and referenced by the input and the
+        # initial context.
+        self.assertEqual(len(self.store._blobs), 1)
+        self.assertTrue(blob_base.is_ref(conductor._inputs['data']))
+        self.assertTrue(blob_base.is_ref(conductor.workflow_state.contexts[0]['data']))
+        self.assertEqual(conductor._inputs['name'], 'fubar')
+        self.assertLess(len(json.dumps(conductor.serialize())), 100000)
+
+        # The references are resolved when the values are returned.
+        self.assertEqual(conductor.get_workflow_input()['data'], data)
+        self.assertEqual(conductor.get_workflow_initial_context()['data'], data)
+
+        # The reference is not resolved if not dereferenced by an expression.
+        with mock.patch.object(self.store, 'get', wraps=self.store.get) as mock_get:
+            next_tasks = conductor.get_next_tasks()
+            self.assertEqual(next_tasks[0]['actions'][0]['input'], {'message': 'fubar'})
+            mock_get.assert_not_called()
+
+        self.forward_task_statuses(conductor, 'task1', [statuses.RUNNING, statuses.SUCCEEDED])
+
+        # The reference is resolved when the expression dereferences the value.
+        conductor = conducting.WorkflowConductor.deserialize(conductor.serialize())
+
+        with mock.patch.object(self.store, 'get', wraps=self.store.get) as mock_get:
+            next_tasks = conductor.get_next_tasks()
+            self.assertEqual(next_tasks[0]['actions'][0]['input'], {'message': 'xxx'})
+            self.assertEqual(mock_get.call_count, 1)
+
+    def test_large_results_and_published_vars_offloaded(self):
+        wf_def = """
+        version: 1.0
+
+        tasks:
+          task1:
+            with: <% range(3) %>
+            action: core.echo message=<% item() %>
+            next:
+              - publish:
+                  - items: <% result() %>
+                  - count: <% len(result()) %>
+                do: task2
+          task2:
+            action: core.noop
+
+        output:
+          - items: <% ctx(items) %>
+          - count: <% ctx(count) %>
+        """
+
+        spec = native_specs.WorkflowSpec(wf_def)
+        self.assertDictEqual(spec.inspect(), {})
+
+        conductor = conducting.WorkflowConductor(spec)
+        conductor.request_workflow_status(statuses.RUNNING)
+
+        results = [['result %s-%s' % (i, j) for j in range(100)] for i in range(3)]
+
+        for task in conductor.get_next_tasks():
+            for action in task['actions']:
+                ac_ex_event = events.ActionExecutionEvent(statuses.RUNNING)
+                ac_ex_event.context = {'item_id': action['item_id']}
+                conductor.update_task_state('task1', 0, ac_ex_event)
+
+        for i in range(3):
+            ac_ex_event = events.ActionExecutionEvent(statuses.SUCCEEDED, result=results[i])
+            ac_ex_event.context = {'item_id': i}
+            conductor.update_task_state('task1', 0, ac_ex_event)
+
+            # The result of each item is stored in the blob store.
+            staged_task = conductor.workflow_state.get_staged_task('task1', 0)
+
+            if staged_task:
+                self.assertTrue(blob_base.is_ref(staged_task['items'][i]['result']))
+
+        # The published variables larger than the threshold are stored in the blob store.
+        published_ctx = conductor.workflow_state.contexts[-1]
+        self.assertTrue(blob_base.is_ref(published_ctx['items']))
+        self.assertEqual(published_ctx['count'], 3)
+        self.assertEqual(len(self.store._blobs), 4)
+
+        expected_ctx = {'items': results, 'count': 3}
+        self.assertDictEqual(conductor.get_task_initial_context('task2', 0), expected_ctx)
+
+        self.forward_task_statuses(conductor, 'task2', [statuses.RUNNING, statuses.SUCCEEDED])
+        self.assertEqual(conductor.get_workflow_status(), statuses.SUCCEEDED)
+        self.assertDictEqual(conductor.get_workflow_output(), expected_ctx)
+        self.assertDictEqual(conductor.get_workflow_terminal_context(), expected_ctx)
+
+    def test_ctx_resolves_accessed_values(self):
+        wf_def = """
+        version: 1.0
+
+        input:
+          - data
+          - other
+          - name
+
+        tasks:
+          task1:
+            action: core.echo message=<% ctx().name %>
+            next:
+              - do: task2
+          task2:
+            action: core.echo message=<% ctx().data.substring(0, 3) %>
+            next:
+              - do: task3
+          task3:
+            action: core.echo message="{{ ctx().other[0:3] }}"
+            next:
+              - publish:
+                  - all: <% ctx() %>
+                  - jinja: "{{ ctx() }}"
+
+        output:
+          - all: <% ctx(all) %>
+          - jinja: <% ctx(jinja) %>
+        """
+
+        data = 'x' * 1000000
+        other = 'y' * 1000000
+        inputs = {'data': data, 'other': other, 'name': 'fubar'}
+        spec = native_specs.WorkflowSpec(wf_def)
+        conductor = conducting.WorkflowConductor(spec, inputs=inputs)
+        conductor.request_workflow_status(statuses.RUNNING)
+        self.assertEqual(len(self.store._blobs), 2)
+
+        # Only the values accessed from the context returned by ctx() are resolved.
+        expected_messages = [('task1', 'fubar', 0), ('task2', 'xxx', 1), ('task3', 'yyy', 1)]
+
+        for task_id, message, call_count in expected_messages:
+            with mock.patch.object(self.store, 'get', wraps=self.store.get) as mock_get:
+                next_tasks = conductor.get_next_tasks()
+                self.assertEqual(next_tasks[0]['id'], task_id)
+                self.assertEqual(next_tasks[0]['actions'][0]['input'], {'message': message})
+                self.assertEqual(mock_get.call_count, call_count)
+
+            statuses_seq = [statuses.RUNNING, statuses.SUCCEEDED]
+            self.forward_task_statuses(conductor, task_id, statuses_seq)
+
+        # The values are resolved when the whole context is used.
+        self.assertEqual(conductor.get_workflow_status(), statuses.SUCCEEDED)
+        output = conductor.get_workflow_output()
+        self.assertDictEqual(output['all'], inputs)
+        self.assertDictEqual(output['jinja'], dict(inputs, all=inputs))
+
+    def test_user_values_with_reserved_keys(self):
+        wf_def = """
+        version: 1.0
+
+        input:
+          - data
+
+        tasks:
+          task1:
+            action: core.noop
+            next:
+              - publish:
+                  - result: <% result() %>
+                  - items: <% list(ctx(data), result()) %>
+
+        output:
+          - data: <% ctx(data) %>
+          - result: <% ctx(result) %>
+          - items: <% ctx(items) %>
+        """
+
+        data = {blob_base.BLOB_REF_KEY: 'abc', 'size': 3}
+        result = {blob_base.BLOB_ESCAPE_KEY: 'xyz'}
+
+        for store in [None, self.store]:
+            blob_base.set_blob_store(store, threshold=1024)
+            spec = native_specs.WorkflowSpec(wf_def)
+            conductor = conducting.WorkflowConductor(spec, inputs={'data': data})
+            conductor.request_workflow_status(statuses.RUNNING)
+
+            # The user values are not taken as references and are returned unchanged.
+            self.assertDictEqual(conductor.get_workflow_input(), {'data': data})
+            self.assertDictEqual(conductor.get_workflow_initial_context(), {'data': data})
+
+            statuses_seq = [statuses.RUNNING, statuses.SUCCEEDED]
+            results = [None, result]
+            self.forward_task_statuses(conductor, 'task1', statuses_seq, results=results)
+            self.assertEqual(conductor.get_workflow_status(), statuses.SUCCEEDED)
+
+            # The values are returned unchanged including from the restored conductor.
+            expected_output = {'data': data, 'result': result, 'items': [data, result]}
+            self.assertDictEqual(conductor.get_workflow_output(), expected_output)
+
+            restored = conducting.WorkflowConductor.deserialize(
+                json.loads(json.dumps(conductor.serialize()))
+            )
+
+            expected_ctx = {'data': data, 'result': result, 'items': [data, result]}
+            self.assertDictEqual(restored.get_workflow_terminal_context(), expected_ctx)
+            self.assertEqual(len(self.store._blobs), 0)
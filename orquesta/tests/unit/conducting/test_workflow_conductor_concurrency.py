@@ -0,0 +1,211 @@
+# Copyright 2019 Extreme Networks, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import threading
+
+from orquesta import conducting
+from orquesta import events
+from orquesta.specs import native as native_specs
+from orquesta import statuses
+from orquesta.tests.unit import base as test_base
+
+
+class WorkflowConductorConcurrencyTest(test_base.WorkflowConductorTest):
+
+    wf_def = """
+    version: 1.0
+
+    vars:
+      - xs: <% range(50).select(str($)) %>
+
+    tasks:
+      task1:
+        with: <% ctx(xs) %>
+        action: core.echo message=<% item() %>
+        next:
+          - publish:
+              - items: <% result() %>
+
+    output:
+      - items: <% ctx(items) %>
+    """
+
+    def test_enable_lock(self):
+        spec = native_specs.WorkflowSpec(self.wf_def)
+        conductor = conducting.WorkflowConductor(spec)
+        self.assertFalse(conductor.is_lock_enabled())
+
+        conductor.enable_lock()
+        self.assertTrue(conductor.is_lock_enabled())
+
+        # The lock is reentrant and the lock is not part of the serialized conductor.
+        conductor.request_workflow_status(statuses.RUNNING)
+        data = conductor.serialize()
+        self.assertNotIn('lock', data)
+
+        conductor = conducting.WorkflowConductor.deserialize(data)
+        self.assertFalse(conductor.is_lock_enabled())
+
+    def test_update_task_states_from_threads(self):
+        spec = native_specs.WorkflowSpec(self.wf_def)
+        conductor = conducting.WorkflowConductor(spec)
+        conductor.enable_lock()
+        conductor.request_workflow_status(statuses.RUNNING)
+
+        next_tasks = conductor.get_next_tasks()
+        self.assertEqual(len(next_tasks), 1)
+
+        task_id = next_tasks[0]['id']
+        task_route = next_tasks[0]['route']
+        actions = next_tasks[0]['actions']
+        self.assertEqual(len(actions), 50)
+
+        for action in actions:
+            ctx = {'item_id': action['item_id']}
+            event = events.ActionExecutionEvent(statuses.RUNNING, context=ctx)
+            conductor.update_task_state(task_id, task_route, event)
+
+        # Complete the items from multiple threads.
+        errors = []
+
+        def complete(action):
+            try:
+                ctx = {'item_id': action['item_id']}
+                result = action['input']['message']
+                event = events.ActionExecutionEvent(statuses.SUCCEEDED, result, ctx)
+                conductor.update_task_state(task_id, task_route, event)
+            except Exception as e:
+                errors.append(e)
+
+        threads = [threading.Thread(target=complete, args=(action,)) for action in actions]
+
+        for thread in threads:
+            thread.start()
+
+        for thread in threads:
+            thread.join()
+
+        self.assertListEqual(errors, [])
+        self.assertEqual(conductor.get_workflow_status(), statuses.SUCCEEDED)
+
+        expected_output = {'items': [str(i) for i in range(50)]}
+        self.assertDictEqual(conductor.get_workflow_output(), expected_output)
+
+        # The task is completed exactly once.
+        task_state_entries = [
+            entry for entry in conductor.workflow_state.sequence if entry['id'] == task_id
+        ]
+
+        self.assertEqual(len(task_state_entries), 1)
+        self.assertEqual(task_state_entries[0]['status'], statuses.SUCCEEDED)
+
+    def test_calls_wait_for_lock(self):
+        spec = native_specs.WorkflowSpec(self.wf_def)
+        conductor = conducting.WorkflowConductor(spec)
+        conductor.enable_lock()
+        conductor.request_workflow_status(statuses.RUNNING)
+
+        next_tasks = conductor.get_next_tasks()
+        task_id = next_tasks[0]['id']
+        task_route = next_tasks[0]['route']
+
+        calls = [
+            (conductor.serialize_binary, ()),
+            (conductor.get_task, (task_id, task_route)),
+            (conductor.get_task_context, ([0],)),
+            (conductor.get_task_initial_context, (task_id, task_route)),
+            (conductor.get_workflow_initial_context, ()),
+            (conductor.get_workflow_output, ())
+        ]
+
+        for func, args in calls:
+            done = threading.Event()
+
+            def call():
+                func(*args)
+                done.set()
+
+            # The call does not return while the lock is held by another thread.
+            with conductor._lock:
+                thread = threading.Thread(target=call)
+                thread.start()
+                self.assertFalse(done.wait(0.05), func.__name__)
+
+            thread.join()
+            self.assertTrue(done.is_set(), func.__name__)
+
+    def test_serialize_binary_from_threads(self):
+        spec = native_specs.WorkflowSpec(self.wf_def)
+        conductor = conducting.WorkflowConductor(spec)
+        conductor.enable_lock()
+        conductor.request_workflow_status(statuses.RUNNING)
+
+        next_tasks = conductor.get_next_tasks()
+        task_id = next_tasks[0]['id']
+        task_route = next_tasks[0]['route']
+        actions = next_tasks[0]['actions']
+
+        for action in actions:
+            ctx = {'item_id': action['item_id']}
+            event = events.ActionExecutionEvent(statuses.RUNNING, context=ctx)
+            conductor.update_task_state(task_id, task_route, event)
+
+        # Serialize the conductor and read the task contexts while the items are completed.
+        errors = []
+        snapshots = []
+
+        def complete(action):
+            try:
+                ctx = {'item_id': action['item_id']}
+                result = action['input']['message']
+                event = events.ActionExecutionEvent(statuses.SUCCEEDED, result, ctx)
+                conductor.update_task_state(task_id, task_route, event)
+            except Exception as e:
+                errors.append(e)
+
+        def snapshot():
+            try:
+                snapshots.append(conductor.serialize_binary())
+                conductor.get_task_initial_context(task_id, task_route)
+                conductor.get_task(task_id, task_route)
+            except Exception as e:
+                errors.append(e)
+
+        threads = []
+
+        for action in actions:
+            threads.append(threading.Thread(target=complete, args=(action,)))
+            threads.append(threading.Thread(target=snapshot))
+
+        for thread in threads:
+            thread.start()
+
+        for thread in threads:
+            thread.join()
+
+        self.assertListEqual(errors, [])
+        self.assertEqual(len(snapshots), 50)
+        self.assertEqual(conductor.get_workflow_status(), statuses.SUCCEEDED)
+
+        # Each snapshot is a consistent state of the conductor with the items completed so far.
+        for data in snapshots:
+            restored = conducting.WorkflowConductor.deserialize_binary(data)
+            staged_task = restored.workflow_state.get_staged_task(task_id, task_route)
+            task_state_entry = restored.get_task_state_entry(task_id, task_route)
+            self.assertIsNotNone(task_state_entry)
+
+            if staged_task:
+                self.assertEqual(task_state_entry['status'], statuses.RUNNING)
+            else:
+                self.assertEqual(task_state_entry['status'], statuses.SUCCEEDED)
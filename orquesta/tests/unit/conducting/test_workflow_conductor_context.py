@@ -291,3 +291,57 @@ class WorkflowConductorContextTest(test_base.WorkflowConductorTest):
         self.assertEqual(conductor.get_workflow_status(), statuses.SUCCEEDED)
         self.assertListEqual(conductor.errors, expected_errors)
         self.assertDictEqual(conductor.get_workflow_output(), expected_output)
+
+    def test_ctx_nested_dict_published(self):
+        wf_def = """
+        version: 1.0
+
+        input:
+          - data:
+              a: 1
+
+        output:
+          - data: <% ctx().data %>
+
+        tasks:
+          task1:
+            action: core.noop
+            next:
+              - when: <% succeeded() %>
+                publish:
+                  - data:
+                      b: 2
+                do: task2
+          task2:
+            action: core.noop
+            next:
+              - when: <% succeeded() %>
+                do: task3
+          task3:
+            action: core.noop
+        """
+
+        spec = native_specs.WorkflowSpec(wf_def)
+        self.assertDictEqual(spec.inspect(), {})
+
+        # Run the workflow.
+        conductor = conducting.WorkflowConductor(spec)
+        conductor.request_workflow_status(statuses.RUNNING)
+
+        for task_name in ['task1', 'task2', 'task3']:
+            self.forward_task_statuses(conductor, task_name, [statuses.RUNNING, statuses.SUCCEEDED])
+
+        # The nested dict published by task1 is merged into the context of the next tasks.
+        self.assertDictEqual(
+            conductor.get_task_initial_context('task3', 0),
+            {'data': {'a': 1, 'b': 2}}
+        )
+
+        # Ensure resolving the task contexts does not alter the contexts in the workflow state.
+        self.assertListEqual(
+            conductor.workflow_state.contexts,
+            [{'data': {'a': 1}}, {'data': {'b': 2}}]
+        )
+
+        self.assertEqual(conductor.get_workflow_status(), statuses.SUCCEEDED)
+        self.assertDictEqual(conductor.get_workflow_output(), {'data': {'a': 1, 'b': 2}})
@@ -13,10 +13,14 @@
 # limitations under the License.
 
 
+import copy
+import json
+
 from orquesta import conducting
 from orquesta.specs import native as native_specs
 from orquesta import statuses
 from orquesta.tests.unit import base as test_base
+from orquesta.utils import binary as binary_util
 
 
 class WorkflowConductorExtendedTest(test_base.WorkflowConductorTest):
@@ -83,3 +87,138 @@ class WorkflowConductorExtendedTest(test_base.WorkflowConductorTest):
         expected_term_ctx = {'loop': False}
         self.assertDictEqual(conductor.get_workflow_terminal_context(), expected_term_ctx)
         self.assertEqual(conductor.get_workflow_status(), statuses.SUCCEEDED)
+
+    def test_cycle_contexts_share_published_values(self):
+        wf_def = """
+        version: 1.0
+
+        description: A basic workflow with cycle that publishes the same result.
+
+        vars:
+          - count: 0
+
+        tasks:
+          init:
+            action: core.noop
+            next:
+              - do: task1
+          task1:
+            action: core.noop
+            next:
+              - when: <% ctx(count) < 10 %>
+                publish:
+                  - count: <% ctx(count) + 1 %>
+                  - payload: <% result() %>
+                do: task1
+        """
+
+        spec = native_specs.WorkflowSpec(wf_def)
+        conductor = conducting.WorkflowConductor(spec)
+        conductor.request_workflow_status(statuses.RUNNING)
+
+        payload = {'data': [{'key': i, 'value': list(range(i, i + 10))} for i in range(50)]}
+
+        self.forward_task_statuses(conductor, 'init', [statuses.RUNNING, statuses.SUCCEEDED])
+
+        # Each iteration of the task returns a result that is equal but not the same object.
+        for i in range(0, 11):
+            results = [None, copy.deepcopy(payload)]
+            statuses_seq = [statuses.RUNNING, statuses.SUCCEEDED]
+            self.forward_task_statuses(conductor, 'task1', statuses_seq, results=results)
+
+        self.assertEqual(conductor.get_workflow_status(), statuses.SUCCEEDED)
+
+        # The contexts store the published payload once.
+        contexts = conductor.workflow_state.contexts
+        self.assertEqual(len(contexts), 11)
+
+        for ctx in contexts[1:]:
+            self.assertDictEqual(ctx['payload'], payload)
+            self.assertIs(ctx['payload'], contexts[1]['payload'])
+
+        # The shared values are written once in the binary format and remain shared when the
+        # conductor is restored. The dict format is unchanged.
+        data = conductor.serialize()
+        binary_data = conductor.serialize_binary()
+        copied_data = json.loads(json.dumps(data))
+
+        self.assertLess(len(binary_data) * 3, len(binary_util.dumps(copied_data)))
+
+        restored = conducting.WorkflowConductor.deserialize_binary(binary_data)
+        restored_contexts = restored.workflow_state.contexts
+        self.assertDictEqual(restored.serialize(), data)
+        self.assertIs(restored_contexts[10]['payload'], restored_contexts[1]['payload'])
+
+        # The contexts of a conductor restored from the dict format are stored by content
+        # when a new context is added.
+        restored = conducting.WorkflowConductor.deserialize(copied_data)
+        restored_contexts = restored.workflow_state.contexts
+        self.assertIsNot(restored_contexts[10]['payload'], restored_contexts[1]['payload'])
+
+        new_ctx_idx = restored.workflow_state.add_context({'payload': copy.deepcopy(payload)})
+        restored_contexts = restored.workflow_state.contexts
+        self.assertIs(restored_contexts[10]['payload'], restored_contexts[1]['payload'])
+        self.assertIs(restored_contexts[new_ctx_idx]['payload'], restored_contexts[1]['payload'])
+
+    def test_cycle_context_getters_return_copies(self):
+        wf_def = """
+        version: 1.0
+
+        description: A basic workflow with cycle that publishes the same result.
+
+        vars:
+          - count: 0
+
+        tasks:
+          init:
+            action: core.noop
+            next:
+              - do: task1
+          task1:
+            action: core.noop
+            next:
+              - when: <% ctx(count) < 2 %>
+                publish:
+                  - count: <% ctx(count) + 1 %>
+                  - payload: <% result() %>
+                do: task1
+        """
+
+        spec = native_specs.WorkflowSpec(wf_def)
+        conductor = conducting.WorkflowConductor(spec)
+        conductor.request_workflow_status(statuses.RUNNING)
+
+        payload = {'data': [{'key': i, 'value': list(range(i, i + 10))} for i in range(5)]}
+
+        self.forward_task_statuses(conductor, 'init', [statuses.RUNNING, statuses.SUCCEEDED])
+
+        for i in range(0, 3):
+            results = [None, copy.deepcopy(payload)]
+            statuses_seq = [statuses.RUNNING, statuses.SUCCEEDED]
+            self.forward_task_statuses(conductor, 'task1', statuses_seq, results=results)
+
+        self.assertEqual(conductor.get_workflow_status(), statuses.SUCCEEDED)
+
+        # Mutate the values returned by the getters.
+        contexts = conductor.workflow_state.contexts
+        self.assertIs(contexts[2]['payload'], contexts[1]['payload'])
+
+        term_ctx = conductor.get_workflow_terminal_context()
+        term_ctx['payload']['data'][0]['value'].append('foobar')
+
+        task_ctx = conductor.get_task_initial_context('task1', 0)
+        task_ctx['payload']['data'].pop()
+
+        for ctx in conductor.get_task_transition_contexts('task1', 0).values():
+            ctx['payload']['data'] = []
+
+        ctx = conductor.get_task_context([1, 2])
+        ctx['payload']['data'].append({'key': 'foobar'})
+
+        # The values shared by the contexts in the workflow state are unchanged.
+        for ctx in contexts[1:]:
+            self.assertDictEqual(ctx['payload'], payload)
+
+        self.assertDictEqual(conductor.get_workflow_terminal_context()['payload'], payload)
+        self.assertDictEqual(conductor.get_task_initial_context('task1', 0)['payload'], payload)
+        self.assertDictEqual(conductor.get_task_context([1, 2])['payload'], payload)
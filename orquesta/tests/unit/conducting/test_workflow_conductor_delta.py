@@ -0,0 +1,250 @@
+# Copyright 2019 Extreme Networks, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import copy
+
+from six.moves import queue
+
+from orquesta import conducting
+from orquesta import events
+from orquesta import exceptions as exc
+from orquesta import statuses
+from orquesta.tests.unit import base as test_base
+
+
+class WorkflowConductorDeltaTest(test_base.WorkflowConductorTest):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.spec_module_name = 'native'
+        super(WorkflowConductorDeltaTest, cls).setUpClass()
+
+    def _prep_conductor(self, wf_name, inputs=None):
+        wf_def = self.get_wf_def(wf_name)
+        wf_spec = self.spec_module.instantiate(wf_def)
+        conductor = conducting.WorkflowConductor(wf_spec, inputs=inputs)
+        conductor.request_workflow_status(statuses.RUNNING)
+
+        return conductor
+
+    def assert_conducting_with_deltas(self, wf_name, inputs=None, mock_statuses=None,
+                                      expected_workflow_status=None):
+        conductor = self._prep_conductor(wf_name, inputs=inputs)
+
+        run_q = queue.Queue()
+        status_q = queue.Queue()
+
+        for item in (mock_statuses or []):
+            status_q.put(item)
+
+        for task in conductor.get_next_tasks():
+            run_q.put(task)
+
+        # Persist the full document once and then only the deltas after each step.
+        data = conductor.serialize()
+        deltas = []
+
+        while not run_q.empty():
+            # Restore the conductor from the base document with the deltas applied.
+            conductor = conducting.WorkflowConductor.deserialize(copy.deepcopy(data))
+
+            while not run_q.empty():
+                current_task = run_q.get()
+                current_task_id = current_task['id']
+                current_task_route = current_task['route']
+
+                ac_ex_event = events.ActionExecutionEvent(statuses.RUNNING)
+                conductor.update_task_state(current_task_id, current_task_route, ac_ex_event)
+
+                status = status_q.get() if not status_q.empty() else statuses.SUCCEEDED
+                ac_ex_event = events.ActionExecutionEvent(status)
+                conductor.update_task_state(current_task_id, current_task_route, ac_ex_event)
+
+                delta = conductor.serialize_delta()
+                deltas.append(delta)
+                conducting.WorkflowConductor.apply_delta(data, delta)
+
+            for next_task in conductor.get_next_tasks():
+                run_q.put(next_task)
+
+            delta = conductor.serialize_delta()
+            deltas.append(delta)
+            conducting.WorkflowConductor.apply_delta(data, delta)
+
+            self.assertDictEqual(data, conductor.serialize())
+
+        if expected_workflow_status is None:
+            expected_workflow_status = statuses.SUCCEEDED
+
+        self.assertEqual(data['state']['status'], expected_workflow_status)
+
+        return conductor, data, deltas
+
+    def test_sequential(self):
+        inputs = {'name': 'Stanley'}
+        self.assert_conducting_with_deltas('sequential', inputs=inputs)
+
+    def test_cycle(self):
+        conductor, data, deltas = self.assert_conducting_with_deltas('cycle')
+
+        # The deltas only carry the contexts appended since the previous checkpoint.
+        self.assertEqual(
+            sum([len(delta['state']['contexts']) for delta in deltas]) + 1,
+            len(data['state']['contexts'])
+        )
+
+    def test_splits(self):
+        self.assert_conducting_with_deltas('splits')
+
+    def test_join(self):
+        self.assert_conducting_with_deltas('join')
+
+    def test_error_handling(self):
+        mock_statuses = [statuses.FAILED]
+        self.assert_conducting_with_deltas('error-handling', mock_statuses=mock_statuses)
+
+    def test_error_log_fail(self):
+        mock_statuses = [statuses.FAILED]
+
+        conductor, data, deltas = self.assert_conducting_with_deltas(
+            'error-log-fail',
+            mock_statuses=mock_statuses,
+            expected_workflow_status=statuses.FAILED
+        )
+
+        self.assertGreater(len(data['errors']), 0)
+
+    def test_delta_includes_updated_task_state_entries_only(self):
+        conductor = self._prep_conductor('sequential', inputs={'name': 'Stanley'})
+        data = conductor.serialize()
+
+        self.forward_task_statuses(conductor, 'task1', [statuses.RUNNING])
+        delta = conductor.serialize_delta(since=data['checkpoint'])
+        self.assertListEqual([entry[0] for entry in delta['state']['sequence']], [0])
+
+        self.forward_task_statuses(conductor, 'task1', [statuses.SUCCEEDED])
+        delta = conductor.serialize_delta()
+        self.assertListEqual([entry[0] for entry in delta['state']['sequence']], [0])
+        self.assertEqual(len(delta['state']['contexts']), 1)
+
+        self.forward_task_statuses(conductor, 'task2', [statuses.RUNNING])
+        delta = conductor.serialize_delta()
+        self.assertListEqual([entry[0] for entry in delta['state']['sequence']], [1])
+        self.assertListEqual(delta['state']['contexts'], [])
+
+    def test_delta_on_workflow_status_change(self):
+        conductor = self._prep_conductor('sequential', inputs={'name': 'Stanley'})
+        self.forward_task_statuses(conductor, 'task1', [statuses.RUNNING])
+        data = conductor.serialize()
+
+        conductor.request_workflow_status(statuses.PAUSING)
+        delta = conductor.serialize_delta(since=data['checkpoint'])
+        self.assertListEqual([entry[0] for entry in delta['state']['sequence']], [0])
+        self.assertEqual(delta['state']['status'], statuses.PAUSING)
+
+        conducting.WorkflowConductor.apply_delta(data, delta)
+        self.assertDictEqual(data, conductor.serialize())
+
+        self.forward_task_statuses(conductor, 'task1', [statuses.SUCCEEDED])
+        delta = conductor.serialize_delta()
+        self.assertEqual(delta['state']['status'], statuses.PAUSED)
+
+        conducting.WorkflowConductor.apply_delta(data, delta)
+        self.assertDictEqual(data, conductor.serialize())
+
+    def test_delta_with_explicit_checkpoint(self):
+        conductor = self._prep_conductor('sequential', inputs={'name': 'Stanley'})
+        data = conductor.serialize()
+        checkpoint = conductor.get_checkpoint()
+        self.assertDictEqual(data['checkpoint'], checkpoint)
+
+        self.forward_task_statuses(conductor, 'task1', [statuses.RUNNING])
+        conductor.serialize_delta(since=checkpoint)
+        self.forward_task_statuses(conductor, 'task1', [statuses.SUCCEEDED])
+
+        # A delta since an earlier checkpoint includes all the changes since then.
+        delta = conductor.serialize_delta(since=checkpoint)
+        conducting.WorkflowConductor.apply_delta(data, delta)
+        self.assertDictEqual(data, conductor.serialize())
+
+    def test_apply_delta_out_of_order(self):
+        conductor = self._prep_conductor('sequential', inputs={'name': 'Stanley'})
+        data = conductor.serialize()
+
+        self.forward_task_statuses(conductor, 'task1', [statuses.RUNNING, statuses.SUCCEEDED])
+        delta1 = conductor.serialize_delta(since=data['checkpoint'])
+
+        self.forward_task_statuses(conductor, 'task2', [statuses.RUNNING, statuses.SUCCEEDED])
+        delta2 = conductor.serialize_delta()
+
+        self.assertRaises(
+            exc.WorkflowDeltaError,
+            conducting.WorkflowConductor.apply_delta,
+            copy.deepcopy(data),
+            delta2
+        )
+
+        conducting.WorkflowConductor.apply_delta(data, delta1)
+        conducting.WorkflowConductor.apply_delta(data, delta2)
+        self.assertDictEqual(data, conductor.serialize())
+
+    def test_serialize_delta_without_checkpoint(self):
+        conductor = self._prep_conductor('sequential', inputs={'name': 'Stanley'})
+
+        self.assertRaises(exc.WorkflowDeltaError, conductor.serialize_delta)
+
+    def test_serialize_does_not_move_checkpoint(self):
+        conductor = self._prep_conductor('sequential', inputs={'name': 'Stanley'})
+        data = conductor.serialize()
+        conductor = conducting.WorkflowConductor.deserialize(copy.deepcopy(data))
+
+        # The conductor is serialized between the deltas, such as for a snapshot.
+        self.forward_task_statuses(conductor, 'task1', [statuses.RUNNING])
+        snapshot = conductor.serialize()
+        conductor.serialize_binary()
+        self.forward_task_statuses(conductor, 'task1', [statuses.SUCCEEDED])
+        conductor.serialize()
+
+        # The delta is since the checkpoint of the restored conductor and includes the
+        # task state entry updated in place.
+        delta = conductor.serialize_delta()
+        self.assertDictEqual(delta['since'], data['checkpoint'])
+        self.assertListEqual([entry[0] for entry in delta['state']['sequence']], [0])
+
+        # The delta is rejected by the serialized conductor with a different checkpoint.
+        self.assertRaises(
+            exc.WorkflowDeltaError,
+            conducting.WorkflowConductor.apply_delta,
+            snapshot,
+            delta
+        )
+
+        conducting.WorkflowConductor.apply_delta(data, delta)
+        self.assertEqual(data['state']['sequence'][0]['status'], statuses.SUCCEEDED)
+        self.assertDictEqual(data, conductor.serialize())
+
+    def test_apply_delta_without_checkpoint(self):
+        conductor = self._prep_conductor('sequential', inputs={'name': 'Stanley'})
+        data = conductor.serialize()
+
+        self.forward_task_statuses(conductor, 'task1', [statuses.RUNNING])
+        delta = conductor.serialize_delta(since=data['checkpoint'])
+        data.pop('checkpoint')
+
+        self.assertRaises(
+            exc.WorkflowDeltaError,
+            conducting.WorkflowConductor.apply_delta,
+            data,
+            delta
+        )
@@ -12,6 +12,9 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import copy
+import json
+import mock
 import random
 import string
 
@@ -66,6 +69,58 @@ class WorkflowConductorStressTest(test_base.WorkflowConductorTest):
 
         self.assertEqual(conductor.get_workflow_status(), statuses.SUCCEEDED)
 
+    def test_runtime_per_step_function_of_sequence_size(self):
+        num_tasks = 200
+
+        # Each task renders an expression that queries the workflow state.
+        wf_def = self._prep_wf_def(num_tasks)
+
+        for i in range(2, num_tasks + 1):
+            task_spec = wf_def['tasks']['t' + str(i)]
+            task_spec['action'] = 'core.echo'
+            task_spec['input'] = {'message': '<%% task_status(t%s) %%>' % str(i - 1)}
+
+        conductor = conducting.WorkflowConductor(native_specs.WorkflowSpec(wf_def))
+        conductor.request_workflow_status(statuses.RUNNING)
+
+        # The workflow state must not be copied to evaluate expressions on each task
+        # rendering and task completion so the cost per step does not grow with the
+        # size of the task sequence. The work per step is measured by the number of
+        # objects deep copied which grows with the sequence if the state is copied.
+        copies = []
+        deepcopy = copy.deepcopy
+
+        def count_deepcopy(value, memo=None):
+            memo = {} if memo is None else memo
+            result = deepcopy(value, memo)
+            copies[-1] += len(memo)
+
+            return result
+
+        with mock.patch.object(conducting.WorkflowState, 'serialize') as mock_serialize:
+            for i in range(1, num_tasks + 1):
+                task_name = 't' + str(i)
+                copies.append(0)
+
+                with mock.patch.object(copy, 'deepcopy', side_effect=count_deepcopy):
+                    next_tasks = conductor.get_next_tasks()
+                    statuses_seq = [statuses.RUNNING, statuses.SUCCEEDED]
+                    self.forward_task_statuses(conductor, task_name, statuses_seq)
+
+                self.assertEqual(next_tasks[0]['id'], task_name)
+
+                if i > 1:
+                    expected_input = {'message': statuses.SUCCEEDED}
+                    self.assertDictEqual(next_tasks[0]['actions'][0]['input'], expected_input)
+
+            mock_serialize.assert_not_called()
+
+        self.assertEqual(conductor.get_workflow_status(), statuses.SUCCEEDED)
+
+        # The last task has no next task to stage so only the steps before it are compared.
+        self.assertEqual(len(set(copies[1:-1])), 1)
+        self.assertLessEqual(max(copies), copies[1])
+
     def test_serialization_function_of_graph_size(self):
         num_tasks = 100
         conductor = self._prep_conductor(num_tasks, status=statuses.RUNNING)
@@ -78,6 +133,59 @@ class WorkflowConductorStressTest(test_base.WorkflowConductorTest):
         conductor = self._prep_conductor(1, inputs={'data': data}, status=statuses.RUNNING)
         conductor.deserialize(conductor.serialize())
 
+    def _benchmark_serialization(self, conductor):
+        # Compare the size and the number of deep copies to encode and decode the conductor
+        # using the dict and JSON path against the binary format.
+        with mock.patch.object(copy, 'deepcopy', side_effect=copy.deepcopy) as mock_deepcopy:
+            json_data = json.dumps(conductor.serialize())
+            conducting.WorkflowConductor.deserialize(json.loads(json_data))
+            json_copies = mock_deepcopy.call_count
+
+        with mock.patch.object(copy, 'deepcopy', side_effect=copy.deepcopy) as mock_deepcopy:
+            binary_data = conductor.serialize_binary()
+            restored = conducting.WorkflowConductor.deserialize_binary(binary_data)
+            binary_copies = mock_deepcopy.call_count
+
+        self.assertDictEqual(restored.serialize(), conductor.serialize())
+
+        return len(json_data), json_copies, len(binary_data), binary_copies
+
+    def test_binary_serialization_function_of_graph_size(self):
+        num_tasks = 100
+        conductor = self._prep_conductor(num_tasks, status=statuses.RUNNING)
+
+        for i in range(1, num_tasks + 1):
+            task_name = 't' + str(i)
+            self.forward_task_statuses(conductor, task_name, [statuses.RUNNING, statuses.SUCCEEDED])
+
+        json_size, json_copies, binary_size, binary_copies = (
+            self._benchmark_serialization(conductor)
+        )
+
+        # The task ids, routes, and statuses are written once in the binary format and the
+        # conductor is encoded and restored without the deep copies.
+        self.assertLess(binary_size, json_size / 2)
+        self.assertGreater(json_copies, 0)
+        self.assertEqual(binary_copies, 0)
+
+        compressed_size = len(conductor.serialize_binary(compress=True))
+        self.assertLess(compressed_size, binary_size / 2)
+
+    def test_binary_serialization_function_of_data_size(self):
+        data_length = 1000000
+        data = ''.join(random.choice(string.ascii_lowercase) for _ in range(data_length))
+        conductor = self._prep_conductor(1, inputs={'data': data}, status=statuses.RUNNING)
+
+        json_size, json_copies, binary_size, binary_copies = (
+            self._benchmark_serialization(conductor)
+        )
+
+        # The input is written once although it is in both the input and the initial context.
+        self.assertLess(binary_size, data_length * 1.1)
+        self.assertGreater(json_size, data_length * 2)
+        self.assertGreater(json_copies, 0)
+        self.assertEqual(binary_copies, 0)
+
 
 class WorkflowConductorWithItemsStressTest(test_base.WorkflowConductorWithItemsTest):
 
@@ -0,0 +1,223 @@
+# Copyright 2019 Extreme Networks, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import json
+import mock
+import os
+import six
+import unittest
+
+from orquesta import statuses
+from orquesta.tests.fixtures import loader as fixture_loader
+from orquesta import throughput
+
+
+class WorkflowConductorThroughputTest(unittest.TestCase):
+
+    def setUp(self):
+        super(WorkflowConductorThroughputTest, self).setUp()
+        self.fixtures_path = fixture_loader.get_workflow_fixtures_base_path()
+
+    def get_workflows(self, *names):
+        paths = [os.path.join(self.fixtures_path, name) for name in names]
+
+        return throughput.load_workflows(paths)
+
+    def get_spec(self, name):
+        return throughput.instantiate(self.get_workflows(name)[0])
+
+    def test_get_workflow_catalog(self):
+        path = os.path.join(self.fixtures_path, 'mistral', 'sequential.yaml')
+        self.assertEqual(throughput.get_workflow_catalog(path), 'mistral')
+
+        path = os.path.join(self.fixtures_path, 'native', 'sequential.yaml')
+        self.assertEqual(throughput.get_workflow_catalog(path), 'native')
+
+        path = os.path.join(self.fixtures_path, 'sequential.yaml')
+        self.assertEqual(throughput.get_workflow_catalog(path), 'native')
+
+    def test_load_workflows(self):
+        workflows = self.get_workflows('native', 'mistral/sequential.yaml')
+
+        names = [os.path.relpath(wf['name'], self.fixtures_path) for wf in workflows]
+        self.assertIn('native/sequential.yaml', names)
+        self.assertIn('native/with-items.yaml', names)
+        self.assertEqual(names[-1], 'mistral/sequential.yaml')
+        self.assertEqual(workflows[-1]['catalog'], 'mistral')
+
+        workflows = throughput.load_workflows(
+            [os.path.join(self.fixtures_path, 'mistral')],
+            catalog='native'
+        )
+
+        self.assertTrue(all(wf['catalog'] == 'native' for wf in workflows))
+
+    def test_load_workflows_skip_unsupported(self):
+        skipped = {}
+        paths = [os.path.join(self.fixtures_path, name) for name in ['mock', 'stackstorm']]
+        paths.append(os.path.join(self.fixtures_path, 'native', 'sequential.yaml'))
+
+        workflows = throughput.load_workflows(paths, skipped=skipped)
+
+        names = [os.path.relpath(wf['name'], self.fixtures_path) for wf in workflows]
+        self.assertListEqual(names, ['native/sequential.yaml'])
+
+        skipped_names = sorted([os.path.relpath(k, self.fixtures_path) for k in skipped])
+        self.assertListEqual(skipped_names, ['mock/basic.yaml', 'stackstorm/sequential.yaml'])
+
+        for name, message in skipped.items():
+            self.assertIn('The workflow definition is not supported by the', message)
+            self.assertNotIn('\n', message)
+
+        # The unsupported workflows are also skipped if the skipped workflows are not returned.
+        self.assertEqual(len(throughput.load_workflows(paths)), 1)
+
+    def test_run_workflow(self):
+        spec = self.get_spec('native/sequential.yaml')
+        latencies = []
+
+        for serialization in throughput.SERIALIZATION_MODES:
+            status, event_count = throughput.run_workflow(
+                spec,
+                inputs={'name': 'Stanley'},
+                serialization=serialization,
+                latencies=latencies
+            )
+
+            self.assertEqual(status, statuses.SUCCEEDED)
+            self.assertEqual(event_count, 6)
+
+        self.assertEqual(len(latencies), 18)
+
+        self.assertRaises(
+            ValueError,
+            throughput.run_workflow,
+            spec,
+            serialization='foobar'
+        )
+
+    def test_run_workflow_with_items(self):
+        spec = self.get_spec('native/with-items-concurrency.yaml')
+        inputs = {'members': ['Lakshmi', 'Lindsay', 'Tomaz', 'Matt', 'Drew']}
+
+        status, event_count = throughput.run_workflow(spec, inputs=inputs)
+
+        self.assertEqual(status, statuses.SUCCEEDED)
+        self.assertEqual(event_count, 10)
+
+    def test_run_workflow_failed(self):
+        spec = self.get_spec('native/sequential.yaml')
+        executor = throughput.SimulatedActionExecutor(failure_rate=1.0)
+
+        status, event_count = throughput.run_workflow(spec, executor=executor)
+
+        self.assertEqual(status, statuses.FAILED)
+        self.assertEqual(event_count, 2)
+
+        self.assertRaises(ValueError, throughput.SimulatedActionExecutor, failure_rate=2.0)
+
+    def test_run_workflow_max_events(self):
+        spec = self.get_spec('native/sequential.yaml')
+
+        self.assertRaises(RuntimeError, throughput.run_workflow, spec, max_events=3)
+
+    def test_get_percentile(self):
+        values = list(range(1, 101))
+
+        self.assertIsNone(throughput.get_percentile([], 50))
+        self.assertEqual(throughput.get_percentile(values, 0), 1)
+        self.assertEqual(throughput.get_percentile(values, 50), 50)
+        self.assertEqual(throughput.get_percentile(values, 99), 99)
+        self.assertEqual(throughput.get_percentile(values, 100), 100)
+
+    def test_run(self):
+        workflows = self.get_workflows('native/sequential.yaml', 'native/parallel.yaml')
+
+        report = throughput.run(workflows, executions=10, processes=0, chunk_size=3)
+
+        self.assertEqual(report['workflows'], 2)
+        self.assertEqual(report['executions'], 10)
+        self.assertDictEqual(report['statuses'], {statuses.SUCCEEDED: 10})
+        self.assertDictEqual(report['errors'], {})
+        self.assertGreater(report['events'], 0)
+        self.assertGreater(report['executions_per_sec'], 0)
+        self.assertLessEqual(report['latency_p50'], report['latency_p99'])
+
+    def test_run_with_process_pool(self):
+        workflows = self.get_workflows('native/sequential.yaml')
+
+        # The workflow that fails to run is counted as an error.
+        workflows.append({'name': 'foobar', 'catalog': 'native', 'definition': 'foobar'})
+
+        report = throughput.run(workflows, executions=4, processes=2)
+
+        self.assertEqual(report['processes'], 2)
+        self.assertEqual(report['executions'], 4)
+        self.assertDictEqual(report['statuses'], {statuses.SUCCEEDED: 2, 'error': 2})
+        self.assertListEqual(list(report['errors'].keys()), [workflows[1]['name']])
+
+    def test_run_without_workflows(self):
+        self.assertRaises(ValueError, throughput.run, [])
+
+        workflows = self.get_workflows('native/sequential.yaml')
+        self.assertRaises(ValueError, throughput.run, workflows, executions=0)
+        self.assertRaises(ValueError, throughput.run, workflows, processes=-1)
+
+    @mock.patch('sys.stdout', new_callable=six.StringIO)
+    def test_main(self, mock_stdout):
+        path = os.path.join(self.fixtures_path, 'native', 'sequential.yaml')
+        argv = [path, '-n', '2', '-p', '0', '--input', '{"name": "Stanley"}', '--json']
+
+        self.assertEqual(throughput.main(argv), 0)
+
+        report = json.loads(mock_stdout.getvalue())
+        self.assertEqual(report['executions'], 2)
+        self.assertDictEqual(report['statuses'], {statuses.SUCCEEDED: 2})
+
+    @mock.patch('sys.stdout', new_callable=six.StringIO)
+    def test_main_report(self, mock_stdout):
+        path = os.path.join(self.fixtures_path, 'native', 'sequential.yaml')
+
+        self.assertEqual(throughput.main([path, '-n', '2', '-p', '0']), 0)
+
+        output = mock_stdout.getvalue()
+        self.assertIn('executions: 2', output)
+        self.assertIn('executions/sec: ', output)
+        self.assertIn('event latency p50: ', output)
+        self.assertIn('event latency p99: ', output)
+        self.assertIn('peak rss: ', output)
+
+    @mock.patch('sys.stdout', new_callable=six.StringIO)
+    def test_main_skip_unsupported(self, mock_stdout):
+        paths = [
+            os.path.join(self.fixtures_path, 'native', 'sequential.yaml'),
+            os.path.join(self.fixtures_path, 'stackstorm', 'sequential.yaml')
+        ]
+
+        self.assertEqual(throughput.main(paths + ['-n', '2', '-p', '0', '--json']), 0)
+
+        report = json.loads(mock_stdout.getvalue())
+        self.assertEqual(report['executions'], 2)
+        self.assertDictEqual(report['errors'], {})
+        self.assertListEqual(list(report['skipped'].keys()), [paths[1]])
+
+    @mock.patch('sys.stderr', new_callable=six.StringIO)
+    def test_main_without_supported_workflows(self, mock_stderr):
+        path = os.path.join(self.fixtures_path, 'stackstorm', 'sequential.yaml')
+
+        self.assertEqual(throughput.main([path, '-n', '2', '-p', '0']), 1)
+
+        output = mock_stderr.getvalue()
+        self.assertIn('skipped %s: ' % path, output)
+        self.assertIn('There are no supported workflows to run.', output)
@@ -12,6 +12,8 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import mock
+
 from orquesta import conducting
 from orquesta.specs import native as native_specs
 from orquesta import statuses
@@ -1013,3 +1015,137 @@ class WorkflowConductorWithItemsTest(test_base.WorkflowConductorWithItemsTest):
 
         # Assert the workflow succeeded.
         self.assertEqual(conductor.get_workflow_status(), statuses.SUCCEEDED)
+
+    def test_items_rendered_within_concurrency(self):
+        wf_def = """
+        version: 1.0
+
+        vars:
+          - xs: <% range(0, 100).select(str($)) %>
+
+        tasks:
+          task1:
+            with:
+              items: <% ctx(xs) %>
+              concurrency: 10
+            action: core.echo message=<% item() %>
+        """
+
+        spec = native_specs.WorkflowSpec(wf_def)
+        self.assertDictEqual(spec.inspect(), {})
+
+        conductor = conducting.WorkflowConductor(spec)
+        conductor.request_workflow_status(statuses.RUNNING)
+
+        task_route = 0
+        task_name = 'task1'
+
+        with mock.patch.object(
+                native_specs.TaskSpec, 'get_items',
+                autospec=True, side_effect=native_specs.TaskSpec.get_items) as mock_get_items:
+
+            # Assert only the items within the concurrency are rendered.
+            next_tasks = conductor.get_next_tasks()
+            self.assertEqual(len(next_tasks), 1)
+            self.assertEqual(next_tasks[0]['items_count'], 100)
+            item_ids = [a['item_id'] for a in next_tasks[0]['actions']]
+            self.assertListEqual(item_ids, list(range(0, 10)))
+
+            for i in range(0, 10):
+                ctxs = [{'item_id': i}]
+                self.forward_task_statuses(conductor, task_name, [statuses.RUNNING], ctxs=ctxs)
+
+            self.assertListEqual(conductor.get_next_tasks(), [])
+
+            # Assert the items that are not run are rendered as items complete.
+            for i in range(0, 2):
+                ctxs = [{'item_id': i}]
+                self.forward_task_statuses(conductor, task_name, [statuses.SUCCEEDED], ctxs=ctxs)
+
+            next_tasks = conductor.get_next_tasks()
+            self.assertListEqual([a['item_id'] for a in next_tasks[0]['actions']], [10, 11])
+            self.assertDictEqual(next_tasks[0]['actions'][0]['input'], {'message': '10'})
+
+            # Assert the items are evaluated once for the task.
+            self.assertEqual(mock_get_items.call_count, 1)
+
+        # Assert the cached items are removed when the task is completed.
+        for i in range(2, 100):
+            ctxs = [{'item_id': i}] * 2
+            statuses_list = [statuses.RUNNING, statuses.SUCCEEDED]
+            self.forward_task_statuses(conductor, task_name, statuses_list, ctxs=ctxs)
+
+        self.assertIsNone(conductor.workflow_state.get_staged_task(task_name, task_route))
+        self.assertEqual(conductor.get_workflow_status(), statuses.SUCCEEDED)
+        self.assertDictEqual(conductor._task_items, {})
+
+    def test_items_not_staged_on_rendering_error(self):
+        wf_def = """
+        version: 1.0
+
+        input:
+          - members
+          - messages
+
+        tasks:
+          task1:
+            with: member, message in <% zip(ctx(members), ctx(messages)) %>
+            action: core.echo message=<% item(member) + item(foobar) %>
+        """
+
+        spec = native_specs.WorkflowSpec(wf_def)
+        self.assertDictEqual(spec.inspect(), {})
+
+        inputs = {'members': ['Lakshmi', 'Lindsay'], 'messages': ['hello', 'hi']}
+        conductor = conducting.WorkflowConductor(spec, inputs=inputs)
+        conductor.request_workflow_status(statuses.RUNNING)
+
+        task_route = 0
+        task_name = 'task1'
+
+        # Assert the workflow failed on rendering the items.
+        self.assertListEqual(conductor.get_next_tasks(), [])
+        self.assertEqual(conductor.get_workflow_status(), statuses.FAILED)
+        self.assertEqual(len(conductor.errors), 1)
+
+        # Assert the items of the staged task are not staged and the cached items are removed.
+        staged_task = conductor.workflow_state.get_staged_task(task_name, task_route)
+        self.assertIsNotNone(staged_task)
+        self.assertNotIn('items', staged_task)
+        self.assertDictEqual(conductor._task_items, {})
+
+    def test_cached_items_removed_on_workflow_completion(self):
+        wf_def = """
+        version: 1.0
+
+        vars:
+          - xs: <% range(0, 10).select(str($)) %>
+
+        tasks:
+          task1:
+            with:
+              items: <% ctx(xs) %>
+              concurrency: 2
+            action: core.echo message=<% item() %>
+        """
+
+        spec = native_specs.WorkflowSpec(wf_def)
+        self.assertDictEqual(spec.inspect(), {})
+
+        conductor = conducting.WorkflowConductor(spec)
+        conductor.request_workflow_status(statuses.RUNNING)
+
+        task_route = 0
+        task_name = 'task1'
+
+        # Assert the items are cached when the task is rendered.
+        next_tasks = conductor.get_next_tasks()
+        self.assertListEqual([a['item_id'] for a in next_tasks[0]['actions']], [0, 1])
+        self.assertIn((task_name, task_route), conductor._task_items)
+
+        # Assert the cached items are removed when the workflow is canceled before the
+        # items are run even though the task remains staged.
+        conductor.request_workflow_status(statuses.CANCELED)
+        self.assertEqual(conductor.get_workflow_status(), statuses.CANCELED)
+        self.assertIsNotNone(conductor.workflow_state.get_staged_task(task_name, task_route))
+        self.assertDictEqual(conductor._task_items, {})
@@ -0,0 +1,221 @@
+# Copyright 2019 Extreme Networks, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import unittest
+
+from orquesta import conducting
+from orquesta import statuses
+
+
+class WorkflowStateStagingTest(unittest.TestCase):
+
+    def test_add_and_get_staged_task(self):
+        state = conducting.WorkflowState()
+        entry = state.add_staged_task('t1', 0)
+
+        self.assertIs(state.get_staged_task('t1', 0), entry)
+        self.assertIsNone(state.get_staged_task('t1', 1))
+        self.assertIsNone(state.get_staged_task('t2', 0))
+        self.assertListEqual(state.staged, [entry])
+
+    def test_get_staged_tasks_that_are_ready(self):
+        state = conducting.WorkflowState()
+        t1 = state.add_staged_task('t1', 0)
+        t2 = state.add_staged_task('t2', 0, ready=False)
+        t3 = state.add_staged_task('t3', 1)
+
+        self.assertTrue(state.has_staged_tasks)
+        self.assertListEqual(state.get_staged_tasks(), [t1, t3])
+
+        # The order of the staged tasks is preserved when a task is ready later.
+        state.set_staged_task_ready('t2', 0, True)
+        self.assertTrue(t2['ready'])
+        self.assertListEqual(state.get_staged_tasks(), [t1, t2, t3])
+
+        state.set_staged_task_ready('t1', 0, False)
+        self.assertFalse(t1['ready'])
+        self.assertListEqual(state.get_staged_tasks(), [t2, t3])
+
+    def test_remove_staged_task(self):
+        state = conducting.WorkflowState()
+        t1 = state.add_staged_task('t1', 0)
+        state.add_staged_task('t2', 0)
+
+        state.remove_staged_task('t2', 0)
+        self.assertIsNone(state.get_staged_task('t2', 0))
+        self.assertListEqual(state.staged, [t1])
+        self.assertListEqual(state.get_staged_tasks(), [t1])
+
+        state.remove_staged_task('t1', 0)
+        self.assertListEqual(state.staged, [])
+        self.assertFalse(state.has_staged_tasks)
+
+        # Removing a task that is not staged is ignored.
+        state.remove_staged_task('t1', 0)
+
+    def test_remove_staged_task_with_items_running(self):
+        state = conducting.WorkflowState()
+        t1 = state.add_staged_task('t1', 0)
+        t1['items'] = [{'status': statuses.SUCCEEDED}, {'status': statuses.RUNNING}]
+
+        state.remove_staged_task('t1', 0)
+        self.assertIs(state.get_staged_task('t1', 0), t1)
+
+    def test_staged_index_on_deserialize(self):
+        state = conducting.WorkflowState()
+        state.add_staged_task('t1', 0)
+        state.add_staged_task('t2', 0, ready=False)
+        state.add_staged_task('t3', 0)
+        state.remove_staged_task('t1', 0)
+
+        data = state.serialize()
+        self.assertListEqual([e['id'] for e in data['staged']], ['t2', 't3'])
+
+        state = conducting.WorkflowState.deserialize(data)
+        self.assertListEqual(state.serialize()['staged'], data['staged'])
+        self.assertEqual(state.get_staged_task('t2', 0), data['staged'][0])
+        self.assertListEqual(state.get_staged_tasks(), [data['staged'][1]])
+
+        state.set_staged_task_ready('t2', 0, True)
+        self.assertListEqual([e['id'] for e in state.get_staged_tasks()], ['t2', 't3'])
+
+    def test_staged_index_on_assignment(self):
+        state = conducting.WorkflowState()
+        state.staged = [
+            {'id': 't1', 'route': 0, 'ctxs': {'in': [0]}, 'prev': {}, 'ready': False},
+            {'id': 't2', 'route': 0, 'ctxs': {'in': [0]}, 'prev': {}, 'ready': True}
+        ]
+
+        self.assertEqual(state.get_staged_task('t1', 0), state.staged[0])
+        self.assertListEqual(state.get_staged_tasks(), [state.staged[1]])
+
+
+class WorkflowStateTaskStatusTest(unittest.TestCase):
+
+    def test_set_task_status(self):
+        state = conducting.WorkflowState()
+        t1 = {'id': 't1', 'route': 0}
+        t2 = {'id': 't2', 'route': 0}
+        state.sequence.extend([t1, t2])
+
+        self.assertFalse(state.has_active_tasks)
+
+        state.set_task_status(t1, statuses.RUNNING)
+        state.set_task_status(t2, statuses.PAUSING)
+        self.assertEqual(t1['status'], statuses.RUNNING)
+        self.assertTrue(state.has_active_tasks)
+        self.assertTrue(state.has_pausing_tasks)
+        self.assertFalse(state.has_paused_tasks)
+        self.assertEqual(state.get_task_status_count(statuses.ACTIVE_STATUSES), 2)
+
+        state.set_task_status(t2, statuses.PAUSED)
+        self.assertFalse(state.has_pausing_tasks)
+        self.assertTrue(state.has_paused_tasks)
+        self.assertEqual(state.get_task_status_count(statuses.ACTIVE_STATUSES), 1)
+
+        state.set_task_status(t1, statuses.CANCELING)
+        self.assertTrue(state.has_canceling_tasks)
+        state.set_task_status(t1, statuses.CANCELED)
+        self.assertFalse(state.has_canceling_tasks)
+        self.assertTrue(state.has_canceled_tasks)
+        self.assertFalse(state.has_active_tasks)
+        self.assertListEqual(state.get_tasks_by_status([statuses.CANCELED]), [t1])
+        self.assertListEqual(state.get_tasks_by_status([statuses.RUNNING]), [])
+
+    def test_task_status_counts_on_deserialize(self):
+        state = conducting.WorkflowState()
+
+        for i, status in enumerate([statuses.SUCCEEDED, statuses.RUNNING, statuses.PENDING]):
+            task_state = {'id': 't%s' % i, 'route': 0}
+            state.sequence.append(task_state)
+            state.set_task_status(task_state, status)
+
+        state = conducting.WorkflowState.deserialize(state.serialize())
+        self.assertTrue(state.has_active_tasks)
+        self.assertTrue(state.has_paused_tasks)
+        self.assertFalse(state.has_canceled_tasks)
+        self.assertEqual(state.get_task_status_count([statuses.SUCCEEDED]), 1)
+
+        state.set_task_status(state.sequence[1], statuses.SUCCEEDED)
+        self.assertFalse(state.has_active_tasks)
+        self.assertEqual(state.get_task_status_count([statuses.SUCCEEDED]), 2)
+
+
+class WorkflowStateStagedItemsTest(unittest.TestCase):
+
+    def test_set_staged_task_items(self):
+        state = conducting.WorkflowState()
+        state.add_staged_task('t1', 0)
+        items = state.set_staged_task_items('t1', 0, 3)
+
+        self.assertListEqual(items, [{'status': statuses.UNSET}] * 3)
+        self.assertIsNot(items[0], items[1])
+        self.assertEqual(state.get_staged_task_items_count('t1', 0), 3)
+        self.assertEqual(state.get_staged_task_items_count('t1', 0, [statuses.UNSET]), 3)
+        self.assertListEqual(state.get_staged_task_notrun_item_ids('t1', 0), [0, 1, 2])
+
+    def test_update_staged_task_item(self):
+        state = conducting.WorkflowState()
+        staged_task = state.add_staged_task('t1', 0)
+        state.set_staged_task_items('t1', 0, 4)
+
+        state.update_staged_task_item('t1', 0, 0, statuses.RUNNING)
+        state.update_staged_task_item('t1', 0, 2, statuses.RUNNING)
+        self.assertEqual(state.get_staged_task_items_count('t1', 0, statuses.ACTIVE_STATUSES), 2)
+        self.assertListEqual(state.get_staged_task_notrun_item_ids('t1', 0), [1, 3])
+        self.assertListEqual(state.get_staged_task_notrun_item_ids('t1', 0, limit=1), [1])
+
+        state.update_staged_task_item('t1', 0, 0, statuses.SUCCEEDED, result='foobar')
+        expected_item = {'status': statuses.SUCCEEDED, 'result': 'foobar'}
+        self.assertDictEqual(staged_task['items'][0], expected_item)
+        self.assertEqual(state.get_staged_task_items_count('t1', 0, statuses.ACTIVE_STATUSES), 1)
+        self.assertEqual(state.get_staged_task_items_count('t1', 0, [statuses.SUCCEEDED]), 1)
+
+        # The count excludes the given item if the item is in one of the statuses.
+        count = state.get_staged_task_items_count(
+            't1', 0, statuses.ACTIVE_STATUSES, exclude_item_id=2
+        )
+
+        self.assertEqual(count, 0)
+        self.assertEqual(state.get_staged_task_items_count('t1', 0, exclude_item_id=2), 3)
+
+    def test_staged_task_items_on_deserialize(self):
+        state = conducting.WorkflowState()
+        state.add_staged_task('t1', 0)
+        state.set_staged_task_items('t1', 0, 3)
+        state.update_staged_task_item('t1', 0, 0, statuses.SUCCEEDED)
+        state.update_staged_task_item('t1', 0, 1, statuses.RUNNING)
+
+        data = state.serialize()
+
+        expected_items = [
+            {'status': statuses.SUCCEEDED, 'result': None},
+            {'status': statuses.RUNNING, 'result': None},
+            {'status': statuses.UNSET}
+        ]
+
+        self.assertListEqual(data['staged'][0]['items'], expected_items)
+
+        state = conducting.WorkflowState.deserialize(data)
+        self.assertEqual(state.get_staged_task_items_count('t1', 0, statuses.ACTIVE_STATUSES), 1)
+        self.assertListEqual(state.get_staged_task_notrun_item_ids('t1', 0), [2])
+
+        # The task is not removed from staging while there are items running.
+        state.remove_staged_task('t1', 0)
+        self.assertIsNotNone(state.get_staged_task('t1', 0))
+
+        state.update_staged_task_item('t1', 0, 1, statuses.SUCCEEDED)
+        state.remove_staged_task('t1', 0)
+        self.assertIsNone(state.get_staged_task('t1', 0))
+        self.assertEqual(state.get_staged_task_items_count('t1', 0), 0)
@@ -0,0 +1,126 @@
+# Copyright 2019 Extreme Networks, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import copy
+import json
+import unittest
+
+from orquesta import conducting
+from orquesta.expressions.functions import workflow as funcs
+from orquesta.specs import native as native_specs
+from orquesta import statuses
+
+
+class WorkflowStateViewTest(unittest.TestCase):
+
+    def _prep_workflow_state(self):
+        state = conducting.WorkflowState()
+        state.status = statuses.RUNNING
+        state.contexts.append({'foo': {'bar': 'fubar'}})
+        state.routes.append([])
+        state.sequence.append({'id': 't1', 'route': 0, 'status': statuses.RUNNING})
+        state.tasks['t1__r0'] = 0
+        state.add_staged_task('t2', 0, ready=False)
+
+        return state
+
+    def test_view_equals_serialized_state(self):
+        state = self._prep_workflow_state()
+        view = state.get_view()
+
+        self.assertEqual(view, state.serialize())
+        self.assertEqual(state.serialize(), view)
+        self.assertDictEqual(view.serialize(), state.serialize())
+        self.assertListEqual(sorted(view.keys()), sorted(state.serialize().keys()))
+
+    def test_view_reflects_state_changes(self):
+        state = self._prep_workflow_state()
+        view = state.get_view()
+
+        self.assertEqual(view['sequence'][0]['status'], statuses.RUNNING)
+
+        state.sequence[0]['status'] = statuses.SUCCEEDED
+        state.sequence.append({'id': 't2', 'route': 0, 'status': statuses.RUNNING})
+        state.tasks['t2__r0'] = 1
+
+        self.assertEqual(view['sequence'][0]['status'], statuses.SUCCEEDED)
+        self.assertEqual(len(view['sequence']), 2)
+        self.assertEqual(view['tasks']['t2__r0'], 1)
+
+    def test_view_is_read_only(self):
+        state = self._prep_workflow_state()
+        view = state.get_view()
+
+        with self.assertRaises(TypeError):
+            view['status'] = statuses.FAILED
+
+        with self.assertRaises(TypeError):
+            view['sequence'][0] = {}
+
+        with self.assertRaises(TypeError):
+            view['sequence'][0]['status'] = statuses.FAILED
+
+        with self.assertRaises(TypeError):
+            del view['contexts'][0]['foo']
+
+        self.assertRaises(KeyError, view.__getitem__, 'conductor')
+        self.assertEqual(state.sequence[0]['status'], statuses.RUNNING)
+
+    def test_view_copy_is_not_materialized(self):
+        state = self._prep_workflow_state()
+        view = state.get_view()
+        ctx = {'foo': 'bar', '__state': view}
+
+        ctx_copy = copy.deepcopy(ctx)
+
+        self.assertIs(ctx_copy['__state'], view)
+
+        sequence = view['sequence']
+        self.assertIs(copy.copy(sequence), sequence)
+        self.assertIs(copy.deepcopy(sequence), sequence)
+
+    def test_task_status_with_view(self):
+        state = self._prep_workflow_state()
+        context = {'__state': state.get_view()}
+
+        self.assertEqual(funcs.task_status_(context, 't1', 0), statuses.RUNNING)
+        self.assertEqual(funcs.task_status_(context, 't2', 0), statuses.UNSET)
+
+        state.sequence[0]['status'] = statuses.SUCCEEDED
+
+        self.assertEqual(funcs.task_status_(context, 't1', 0), statuses.SUCCEEDED)
+
+    def test_task_context_excludes_state(self):
+        wf_def = """
+        version: 1.0
+
+        tasks:
+          task1:
+            action: core.echo message=<% task_status(task1) %>
+            next:
+              - do: task2
+          task2:
+            action: core.noop
+        """
+
+        spec = native_specs.WorkflowSpec(wf_def)
+        conductor = conducting.WorkflowConductor(spec)
+        conductor.request_workflow_status(statuses.RUNNING)
+
+        # The workflow state is only for evaluating the expressions of the task and is not
+        # copied into the context returned with the task.
+        task = conductor.get_next_tasks()[0]
+        self.assertEqual(task['actions'][0]['input'], {'message': statuses.UNSET})
+        self.assertNotIn('__state', task['ctx'])
+        self.assertIsInstance(json.dumps(task['ctx']), str)
@@ -12,12 +12,16 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import mock
+import threading
 import unittest
 
 from orquesta.expressions import base as expr_base
+from orquesta.expressions.functions import base as func_base
 from orquesta.expressions.functions import common as core_funcs
 from orquesta.expressions import jinja as jinja_expr
 from orquesta.expressions import yql as yaql_expr
+from orquesta.utils import context as ctx_util
 
 
 class ExpressionEvaluatorTest(unittest.TestCase):
@@ -52,8 +56,51 @@ class ExpressionEvaluatorTest(unittest.TestCase):
 
         self.assertDictEqual(expr_base.get_statement_regexes(), expected_data)
 
+    def _load_concurrently(self, func):
+        results = []
+        threads = [threading.Thread(target=lambda: results.append(func())) for i in range(10)]
+
+        for thread in threads:
+            thread.start()
+
+        for thread in threads:
+            thread.join()
+
+        return results
+
+    @mock.patch.object(expr_base, '_EXP_EVALUATORS', None)
+    def test_get_evaluators_concurrently(self):
+        with mock.patch.object(
+                expr_base, 'get_evaluator', wraps=expr_base.get_evaluator) as mocked:
+            results = self._load_concurrently(expr_base.get_evaluators)
+
+        # The evaluators are loaded once and shared by the threads.
+        self.assertEqual(mocked.call_count, 2)
+        self.assertListEqual(sorted(results[0].keys()), ['jinja', 'yaql'])
+        self.assertTrue(all(result is results[0] for result in results))
+
+    @mock.patch.object(func_base, '_EXP_FUNC_CATALOG', None)
+    def test_load_functions_concurrently(self):
+        results = self._load_concurrently(func_base.load)
+
+        self.assertIn('ctx', results[0])
+        self.assertTrue(all(result is results[0] for result in results))
+
     def test_has_expressions(self):
         self.assertTrue(expr_base.has_expressions('<% ctx().foo %> and {{ ctx().foo }}'))
         self.assertTrue(expr_base.has_expressions('foo <% ctx().foo %> bar'))
         self.assertTrue(expr_base.has_expressions('foo {{ ctx().foo }} bar'))
         self.assertFalse(expr_base.has_expressions('foobar'))
+
+    def test_evaluate_context_overlay(self):
+        data = {'foo': 'bar', 'items': [1, 2]}
+        context = ctx_util.set_current_task(data, {'id': 't1', 'route': 0})
+        context = ctx_util.set_current_item(context, 'fu')
+
+        self.assertEqual(expr_base.evaluate('<% ctx().foo %>', context), 'bar')
+        self.assertEqual(expr_base.evaluate('<% item() %>', context), 'fu')
+        self.assertEqual(expr_base.evaluate('<% ctx(items) %>', context), [1, 2])
+        self.assertEqual(expr_base.evaluate('{{ ctx().foo }}', context), 'bar')
+        self.assertEqual(expr_base.evaluate('{{ item() }}', context), 'fu')
+        self.assertEqual(expr_base.evaluate('{{ ctx("items") }}', context), [1, 2])
+        self.assertDictEqual(data, {'foo': 'bar', 'items': [1, 2]})
@@ -0,0 +1,75 @@
+# Copyright 2019 Extreme Networks, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import mock
+import unittest
+
+from orquesta.expressions import base as expr_base
+from orquesta.expressions import yql as yaql_expr
+
+
+class EvaluationPlanTest(unittest.TestCase):
+
+    def test_literal(self):
+        statement = {'foo': 'bar', 'fu': [1, {'a': 'b'}], 'x': None}
+        plan = expr_base.EvaluationPlan(statement)
+
+        self.assertFalse(plan.has_expressions)
+        self.assertIs(plan.evaluate({'foo': 'baz'}), statement)
+
+    def test_evaluate(self):
+        statement = {
+            'foo': '<% ctx().foo %>',
+            '<% ctx().key %>': 'value',
+            'literal': {'a': [1, 2]},
+            'items': ['fu', '{{ ctx().foo }}', {'x': 'y'}]
+        }
+
+        plan = expr_base.EvaluationPlan(statement)
+        self.assertTrue(plan.has_expressions)
+
+        data = {'foo': 'bar', 'key': 'k'}
+
+        expected = {
+            'foo': 'bar',
+            'k': 'value',
+            'literal': {'a': [1, 2]},
+            'items': ['fu', 'bar', {'x': 'y'}]
+        }
+
+        result = plan.evaluate(data)
+        self.assertDictEqual(result, expected)
+        self.assertDictEqual(result, expr_base.evaluate(statement, data))
+
+        # The parts without expressions are shared with the statement.
+        self.assertIs(result['literal'], statement['literal'])
+        self.assertIs(result['items'][2], statement['items'][2])
+
+    def test_evaluate_only_dynamic_leaves(self):
+        statement = {'foo': '<% ctx().foo %>', 'bar': ['a', 'b', 'c']}
+        plan = expr_base.EvaluationPlan(statement)
+
+        with mock.patch.object(expr_base, 'scan') as mock_scan:
+            with mock.patch.object(yaql_expr.YAQLEvaluator, 'evaluate',
+                                   return_value='bar') as mock_evaluate:
+                for i in range(0, 3):
+                    self.assertDictEqual(plan.evaluate({}), {'foo': 'bar', 'bar': ['a', 'b', 'c']})
+
+                mock_scan.assert_not_called()
+                self.assertEqual(mock_evaluate.call_count, 3)
+
+    def test_evaluate_string(self):
+        self.assertEqual(expr_base.EvaluationPlan('<% ctx().x %>').evaluate({'x': 1}), 1)
+        self.assertEqual(expr_base.EvaluationPlan('foobar').evaluate({'x': 1}), 'foobar')
+        self.assertEqual(expr_base.EvaluationPlan(123).evaluate(), 123)
@@ -0,0 +1,104 @@
+# Copyright 2019 Extreme Networks, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import mock
+import unittest
+
+from orquesta.expressions import base as expr_base
+from orquesta.expressions import jinja as jinja_expr
+from orquesta.expressions import yql as yaql_expr
+
+
+class ExpressionScanTest(unittest.TestCase):
+
+    def setUp(self):
+        super(ExpressionScanTest, self).setUp()
+        expr_base._SCAN_CACHE.clear()
+
+    def test_classify(self):
+        self.assertEqual(expr_base.classify('foobar'), expr_base.LITERAL)
+        self.assertEqual(expr_base.classify('<% ctx().foo %>'), expr_base.EXPRESSION)
+        self.assertEqual(expr_base.classify('{{ ctx().foo }}'), expr_base.EXPRESSION)
+        self.assertEqual(expr_base.classify('foo <% ctx().foo %>'), expr_base.TEMPLATE)
+        self.assertEqual(expr_base.classify('<% ctx().a %><% ctx().b %>'), expr_base.TEMPLATE)
+        self.assertEqual(expr_base.classify('{{ ctx().a }} {{ ctx().b }}'), expr_base.TEMPLATE)
+        self.assertEqual(expr_base.classify('{% if true %}foo{% endif %}'), expr_base.BLOCK)
+        self.assertEqual(expr_base.classify('{% raw %}{{ foo }}{% endraw %}'), expr_base.BLOCK)
+        self.assertEqual(expr_base.classify('<% ctx().a %> {{ ctx().b }}'), expr_base.MIXED)
+
+    def test_scan(self):
+        scans = expr_base.scan('foo <% ctx().a %> <% ctx().b %>')
+
+        self.assertListEqual(list(scans.keys()), ['yaql'])
+        self.assertEqual(scans['yaql'].kind, expr_base.TEMPLATE)
+        self.assertListEqual(scans['yaql'].exprs, ['<% ctx().a %>', '<% ctx().b %>'])
+
+        scans = expr_base.scan('{% for i in ctx().a %}{{ i }}{% endfor %}')
+
+        self.assertListEqual(list(scans.keys()), ['jinja'])
+        self.assertEqual(scans['jinja'].kind, expr_base.BLOCK)
+        self.assertListEqual(scans['jinja'].exprs, ['{{ i }}'])
+        self.assertEqual(len(scans['jinja'].block_exprs), 2)
+
+    def test_scan_cached(self):
+        expr = '<% ctx().foo %>'
+
+        with mock.patch.object(yaql_expr.YAQLEvaluator, 'scan',
+                               wraps=yaql_expr.YAQLEvaluator.scan) as mock_scan:
+            # The string is cached when validated such as when the spec is inspected.
+            self.assertListEqual(expr_base.validate(expr)['errors'], [])
+
+            for i in range(0, 3):
+                self.assertEqual(expr_base.evaluate(expr, data={'foo': i}), i)
+                self.assertListEqual(expr_base.validate(expr)['errors'], [])
+                self.assertEqual(len(expr_base.extract_vars(expr)), 1)
+                self.assertTrue(expr_base.has_expressions(expr))
+
+            mock_scan.assert_called_once_with(expr)
+
+        self.assertEqual(expr_base.get_scan_cache_stats()['count'], 1)
+
+    def test_scan_not_cached_for_runtime_evaluation(self):
+        data = 'x' * 100000
+
+        self.assertEqual(expr_base.evaluate(data), data)
+        self.assertFalse(expr_base.has_expressions(data))
+        self.assertEqual(expr_base.classify(data), expr_base.LITERAL)
+        statement = {'foo': data, 'bar': [data]}
+        self.assertEqual(expr_base.evaluate(statement), statement)
+        self.assertEqual(expr_base.evaluate('<% ctx().foo %>', data={'foo': data}), data)
+        self.assertEqual(len(expr_base._SCAN_CACHE), 0)
+
+        # The strings are cached when the expressions are compiled.
+        expr_base.EvaluationPlan({'foo': '<% ctx().foo %>', 'bar': 'fubar'})
+        self.assertIn('<% ctx().foo %>', expr_base._SCAN_CACHE)
+        self.assertIn('fubar', expr_base._SCAN_CACHE)
+
+    def test_scan_not_cached_for_recursive_evaluation(self):
+        data = {'foo': '<% ctx().bar %>', 'bar': 'fubar'}
+
+        self.assertEqual(expr_base.evaluate('<% ctx().foo %>', data=data), 'fubar')
+        self.assertNotIn('<% ctx().bar %>', expr_base._SCAN_CACHE)
+
+        data = {'foo': '{{ ctx().bar }}', 'bar': 'fubar'}
+
+        self.assertEqual(expr_base.evaluate('{{ ctx().foo }}', data=data), 'fubar')
+        self.assertNotIn('{{ ctx().bar }}', expr_base._SCAN_CACHE)
+
+    def test_evaluator_scan_without_facade(self):
+        scan = jinja_expr.JinjaEvaluator.get_scan('foo {{ ctx().foo }}')
+
+        self.assertEqual(scan.kind, expr_base.TEMPLATE)
+        self.assertEqual(len(expr_base._SCAN_CACHE), 0)
+        self.assertIsNone(yaql_expr.YAQLEvaluator.get_scan('foo {{ ctx().foo }}'))
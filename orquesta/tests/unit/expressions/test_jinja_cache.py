@@ -0,0 +1,104 @@
+# Copyright 2019 Extreme Networks, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from orquesta.expressions import base as expr_base
+from orquesta.specs import native as native_specs
+from orquesta.tests.unit import base as test_base
+
+
+class JinjaCacheTest(test_base.ExpressionEvaluatorTest):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.language = 'jinja'
+        super(JinjaCacheTest, cls).setUpClass()
+
+    def setUp(self):
+        super(JinjaCacheTest, self).setUp()
+        self.evaluator.clear_cache()
+
+    def tearDown(self):
+        self.evaluator.set_cache_size(expr_base.DEFAULT_CACHE_SIZE)
+        super(JinjaCacheTest, self).tearDown()
+
+    def test_evaluate_inline_expressions_with_cache(self):
+        data = {'foo': 'bar', 'x': 1}
+
+        self.assertEqual(self.evaluator.evaluate('{{ ctx("foo") }}', data), 'bar')
+        self.assertEqual(self.evaluator.evaluate('{{ ctx("foo") }}', data), 'bar')
+        expr = '{{ ctx("x") + 1 }} {{ ctx("foo") }}'
+        self.assertEqual(self.evaluator.evaluate(expr, data), '2 bar')
+
+        expected = {
+            'size': expr_base.DEFAULT_CACHE_SIZE,
+            'count': 2,
+            'hits': 2,
+            'misses': 2,
+            'evictions': 0
+        }
+
+        self.assertDictEqual(self.evaluator.get_cache_stats(), expected)
+
+    def test_evaluate_block_with_cache(self):
+        expr = '{% for i in ctx("xs") %}{{ i }}{% endfor %}'
+
+        self.assertEqual(self.evaluator.evaluate(expr, {'xs': [1, 2]}), '12')
+        self.assertEqual(self.evaluator.evaluate(expr, {'xs': [3, 4]}), '34')
+
+        expected = {
+            'size': expr_base.DEFAULT_CACHE_SIZE,
+            'count': 1,
+            'hits': 1,
+            'misses': 1,
+            'evictions': 0
+        }
+
+        self.assertDictEqual(self.evaluator.get_cache_stats(), expected)
+
+    def test_validate_with_cache(self):
+        self.assertListEqual([], self.evaluator.validate('{{ ctx("foo") }}'))
+        self.assertGreater(len(self.evaluator.validate('{{ {{ ctx("foo") }} }}')), 0)
+
+        # Expressions with syntax error are not cached.
+        self.assertEqual(self.evaluator.get_cache_stats()['count'], 1)
+        self.assertEqual(self.evaluator.evaluate('{{ ctx("foo") }}', {'foo': 'bar'}), 'bar')
+        self.assertEqual(self.evaluator.get_cache_stats()['hits'], 1)
+
+    def test_functions_bound_to_context(self):
+        ctx = self.evaluator.contextualize({'foo': 'bar'})
+
+        self.assertEqual(ctx['ctx']('foo'), 'bar')
+        self.assertIs(ctx['json'], self.evaluator._custom_functions['json'])
+
+    def test_warm_cache_from_workflow_spec(self):
+        wf_def = """
+            version: 1.0
+            input:
+              - xs: [1, 2]
+            vars:
+              - y: '{% for x in ctx("xs") %}{{ x }}{% endfor %}'
+            tasks:
+              task1:
+                action: core.echo message={{ ctx("y") }}
+                next:
+                  - when: '{{ succeeded() }}'
+        """
+
+        wf_spec = native_specs.WorkflowSpec(wf_def)
+        wf_spec.warm_expression_cache()
+
+        self.assertEqual(self.evaluator.get_cache_stats()['count'], 3)
+
+        self.assertEqual(self.evaluator.evaluate('{{ ctx("y") }}', {'y': 'foo'}), 'foo')
+        self.assertEqual(self.evaluator.get_cache_stats()['hits'], 1)
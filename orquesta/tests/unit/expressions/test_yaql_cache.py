@@ -0,0 +1,195 @@
+# Copyright 2019 Extreme Networks, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import threading
+import time
+import unittest
+
+from orquesta.expressions import base as expr_base
+from orquesta.specs import native as native_specs
+from orquesta.tests.unit import base as test_base
+
+
+class ExpressionCacheTest(unittest.TestCase):
+
+    def test_lru_eviction(self):
+        cache = expr_base.ExpressionCache(size=2)
+
+        self.assertEqual(cache.get('a', lambda x: x.upper()), 'A')
+        self.assertEqual(cache.get('b', lambda x: x.upper()), 'B')
+        self.assertEqual(cache.get('a', lambda x: 'mock'), 'A')
+        self.assertEqual(cache.get('c', lambda x: x.upper()), 'C')
+
+        # The least recently used entry is evicted.
+        self.assertIn('a', cache)
+        self.assertNotIn('b', cache)
+        self.assertIn('c', cache)
+
+        expected = {
+            'size': 2,
+            'count': 2,
+            'hits': 1,
+            'misses': 3,
+            'evictions': 1
+        }
+
+        self.assertDictEqual(cache.get_stats(), expected)
+
+    def test_resize(self):
+        cache = expr_base.ExpressionCache(size=3)
+
+        for key in ['a', 'b', 'c']:
+            cache.get(key, lambda x: x)
+
+        cache.resize(1)
+        self.assertEqual(len(cache), 1)
+        self.assertIn('c', cache)
+
+        # Caching is disabled if the size is zero.
+        cache.resize(0)
+        cache.get('d', lambda x: x)
+        self.assertEqual(len(cache), 0)
+        self.assertEqual(cache.misses, 4)
+
+        self.assertRaises(ValueError, cache.resize, -1)
+
+    def test_clear(self):
+        cache = expr_base.ExpressionCache()
+        cache.get('a', lambda x: x)
+        cache.get('a', lambda x: x)
+        cache.clear()
+
+        expected = {
+            'size': expr_base.DEFAULT_CACHE_SIZE,
+            'count': 0,
+            'hits': 0,
+            'misses': 0,
+            'evictions': 0
+        }
+
+        self.assertDictEqual(cache.get_stats(), expected)
+
+    def test_concurrent_load(self):
+        cache = expr_base.ExpressionCache()
+        results = []
+
+        def load(key):
+            # Give the other threads the chance to miss the same key.
+            time.sleep(0.01)
+            return [key]
+
+        def get():
+            results.append(cache.get('a', load))
+
+        threads = [threading.Thread(target=get) for i in range(10)]
+
+        for thread in threads:
+            thread.start()
+
+        for thread in threads:
+            thread.join()
+
+        # The callers share the value that is cached first.
+        self.assertEqual(len(results), 10)
+        self.assertTrue(all(result is cache.peek('a') for result in results))
+        self.assertEqual(cache.hits + cache.misses, 10)
+        self.assertEqual(len(cache), 1)
+
+
+class YAQLCacheTest(test_base.ExpressionEvaluatorTest):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.language = 'yaql'
+        super(YAQLCacheTest, cls).setUpClass()
+
+    def setUp(self):
+        super(YAQLCacheTest, self).setUp()
+        self.evaluator.clear_cache()
+
+    def tearDown(self):
+        self.evaluator.set_cache_size(expr_base.DEFAULT_CACHE_SIZE)
+        super(YAQLCacheTest, self).tearDown()
+
+    def test_evaluate_with_cache(self):
+        data = {'foo': 'bar', 'x': 1}
+
+        self.assertEqual(self.evaluator.evaluate('<% ctx(foo) %>', data), 'bar')
+        self.assertEqual(self.evaluator.evaluate('<% ctx(foo) %>', data), 'bar')
+        self.assertEqual(self.evaluator.evaluate('<% ctx(x) + 1 %> <% ctx(foo) %>', data), '2 bar')
+
+        # The cache is keyed by the expression text without the delimiter.
+        self.assertEqual(self.evaluator.evaluate('<%ctx(foo)%>', {'foo': 'fu'}), 'fu')
+
+        expected = {
+            'size': expr_base.DEFAULT_CACHE_SIZE,
+            'count': 2,
+            'hits': 3,
+            'misses': 2,
+            'evictions': 0
+        }
+
+        self.assertDictEqual(self.evaluator.get_cache_stats(), expected)
+
+    def test_validate_with_cache(self):
+        self.assertListEqual([], self.evaluator.validate('<% ctx(foo) %>'))
+        self.assertEqual(len(self.evaluator.validate('<% <% ctx().foo %> %>')), 1)
+
+        # Expressions with parse error are not cached.
+        self.assertEqual(self.evaluator.get_cache_stats()['count'], 1)
+        self.assertEqual(self.evaluator.evaluate('<% ctx(foo) %>', {'foo': 'bar'}), 'bar')
+        self.assertEqual(self.evaluator.get_cache_stats()['hits'], 1)
+
+    def test_set_cache_size(self):
+        self.evaluator.set_cache_size(1)
+        self.evaluator.evaluate('<% 1 %>')
+        self.evaluator.evaluate('<% 2 %>')
+        self.evaluator.evaluate('<% 1 %>')
+
+        expected = {
+            'size': 1,
+            'count': 1,
+            'hits': 0,
+            'misses': 3,
+            'evictions': 2
+        }
+
+        self.assertDictEqual(self.evaluator.get_cache_stats(), expected)
+
+    def test_warm_cache_from_workflow_spec(self):
+        wf_def = """
+            version: 1.0
+            input:
+              - x: <% 1 + 1 %>
+            tasks:
+              task1:
+                action: core.echo message=<% ctx(x) %>
+                next:
+                  - when: <% succeeded() %>
+                    publish: y=<% ctx(x) + 1 %>
+                    do: task2
+                  - when: <% failed() %>
+              task2:
+                action: core.noop
+            output:
+              - y: <% ctx(y) %>
+        """
+
+        wf_spec = native_specs.WorkflowSpec(wf_def)
+        wf_spec.warm_expression_cache()
+
+        self.assertEqual(self.evaluator.get_cache_stats()['count'], 6)
+        self.assertEqual(self.evaluator.get_cache_stats()['hits'], 0)
+
+        self.assertEqual(self.evaluator.evaluate('<% ctx(x) + 1 %>', {'x': 2}), 3)
+        self.assertEqual(self.evaluator.get_cache_stats()['hits'], 1)
@@ -361,3 +361,102 @@ class WorkflowGraphTest(test_base.WorkflowGraphTest):
             len(wf_graph.get_prev_transitions('task9')) > 1 and
             not wf_graph.has_barrier('task9')
         )
+
+    def test_in_cycle(self):
+        wf_graph = self._prep_graph()
+
+        self.assertSetEqual(wf_graph.get_cycle_members(), set())
+        self.assertFalse(wf_graph.in_cycle('task2'))
+
+        # Adding transition resets the cycle members.
+        wf_graph.add_transition('task5', 'task2')
+        self.assertSetEqual(wf_graph.get_cycle_members(), {'task2', 'task3', 'task5'})
+        self.assertTrue(wf_graph.in_cycle('task2'))
+        self.assertTrue(wf_graph.in_cycle('task5'))
+        self.assertFalse(wf_graph.in_cycle('task1'))
+        self.assertFalse(wf_graph.in_cycle('task4'))
+
+        wf_graph.add_transition('task9', 'task9')
+        self.assertTrue(wf_graph.in_cycle('task9'))
+        self.assertFalse(wf_graph.in_cycle('task8'))
+
+    def test_cycle_members_serialization(self):
+        wf_graph = self._prep_graph()
+        wf_graph.add_transition('task5', 'task2')
+
+        data = wf_graph.serialize()
+        self.assertListEqual(data['cycle_members'], ['task2', 'task3', 'task5'])
+
+        wf_graph = graphing.WorkflowGraph.deserialize(data)
+        self.assertSetEqual(wf_graph.get_cycle_members(), {'task2', 'task3', 'task5'})
+        self.assert_graph_equal(wf_graph, data)
+
+        # Graphs serialized without the cycle members identify them on first use.
+        del data['cycle_members']
+        wf_graph = graphing.WorkflowGraph.deserialize(data)
+        self.assertTrue(wf_graph.in_cycle('task3'))
+        self.assertFalse(wf_graph.in_cycle('task4'))
+
+    def test_transitions_cache_reset_on_change(self):
+        wf_graph = self._prep_graph()
+
+        self.assertListEqual(
+            [t[1] for t in wf_graph.get_next_transitions('task1')],
+            ['task2', 'task4', 'task7', 'task9']
+        )
+
+        self.assertListEqual(
+            [t[0] for t in wf_graph.get_prev_transitions('task9')],
+            ['task1', 'task8']
+        )
+
+        wf_graph.add_transition('task1', 'task3')
+        wf_graph.add_transition('task6', 'task9')
+
+        self.assertListEqual(
+            [t[1] for t in wf_graph.get_next_transitions('task1')],
+            ['task2', 'task3', 'task4', 'task7', 'task9']
+        )
+
+        self.assertListEqual(
+            [t[0] for t in wf_graph.get_prev_transitions('task9')],
+            ['task1', 'task8', 'task6']
+        )
+
+        wf_graph.update_transition('task1', 'task3', 0, attr1='fubar')
+        self.assertEqual(wf_graph.get_next_transitions('task1')[1][3], {'attr1': 'fubar'})
+        self.assertListEqual(
+            wf_graph.has_transition('task1', 'task3', attr1='fubar'),
+            [('task1', 'task3', 0, {'attr1': 'fubar'})]
+        )
+
+        # Changes to the list returned do not alter the cache.
+        wf_graph.get_next_transitions('task1').pop()
+        self.assertEqual(len(wf_graph.get_next_transitions('task1')), 5)
+        self.assertListEqual(wf_graph.get_next_transitions('task10'), [])
+        self.assertListEqual(wf_graph.has_transition('task10', 'task1'), [])
+
+    def test_read_only_graph(self):
+        wf_graph = self._prep_graph()
+        self.assertFalse(wf_graph.is_read_only())
+
+        wf_graph.set_read_only()
+        self.assertTrue(wf_graph.is_read_only())
+
+        self.assertRaises(exc.WorkflowGraphReadOnlyError, wf_graph.add_task, 'task11')
+        self.assertRaises(exc.WorkflowGraphReadOnlyError, wf_graph.update_task, 'task1', a=1)
+        self.assertRaises(exc.WorkflowGraphReadOnlyError, wf_graph.add_transition, 'a', 'b')
+
+        self.assertRaises(
+            exc.WorkflowGraphReadOnlyError,
+            wf_graph.update_transition,
+            'task1',
+            'task2',
+            0,
+            attr1='fubar'
+        )
+
+        # The graph can still be read.
+        self.assertTrue(wf_graph.has_task('task1'))
+        self.assertFalse(wf_graph.has_task('task11'))
+        self.assertIn('task3', wf_graph.get_next_transitions('task2')[0])
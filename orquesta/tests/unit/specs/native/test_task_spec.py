@@ -603,3 +603,122 @@ class TaskSpecTest(test_base.OrchestraWorkflowSpecTest):
         wf_spec = self.instantiate(wf_def)
 
         self.assertDictEqual(wf_spec.inspect(), expected_errors)
+
+    def test_render_with_literal_input(self):
+        wf_def = """
+            version: 1.0
+            description: A basic workflow with literal and dynamic task input.
+            tasks:
+              task1:
+                with: x in <% ctx(xs) %>
+                action: core.echo
+                input:
+                  message: <% item(x) %>
+                  options:
+                    verbose: true
+                    tags:
+                      - foo
+                      - bar
+        """
+
+        wf_spec = self.instantiate(wf_def)
+        task_spec = wf_spec.tasks.get_task('task1')
+        in_ctx = {'xs': ['fee', 'fie']}
+
+        task_spec, action_specs = task_spec.render(in_ctx)
+
+        expected_input = {'options': {'verbose': True, 'tags': ['foo', 'bar']}}
+
+        for i, action_spec in enumerate(action_specs):
+            expected_input['message'] = in_ctx['xs'][i]
+            self.assertEqual(action_spec['action'], 'core.echo')
+            self.assertDictEqual(action_spec['input'], expected_input)
+
+        # The literal parts of the input are not traversed on render.
+        self.assertIs(action_specs[0]['input']['options'], task_spec.input['options'])
+        self.assertIs(action_specs[1]['input']['options'], task_spec.input['options'])
+
+        # The evaluation plans are reused on subsequent render.
+        render_plans = task_spec.get_render_plans()
+        task_spec.render(in_ctx)
+        self.assertIs(task_spec.get_render_plans(), render_plans)
+
+    def test_render_with_items_does_not_copy_context(self):
+        wf_def = """
+            version: 1.0
+            description: A basic workflow with items referencing large context.
+            tasks:
+              task1:
+                with: x in <% ctx(xs) %>
+                action: core.echo
+                input:
+                  item: <% item(x) %>
+                  data: <% ctx(data) %>
+        """
+
+        wf_spec = self.instantiate(wf_def)
+        task_spec = wf_spec.tasks.get_task('task1')
+        in_ctx = {'xs': list(range(0, 100)), 'data': {'foo': ['bar'] * 1000}}
+
+        task_spec, action_specs = task_spec.render(in_ctx)
+
+        self.assertEqual(len(action_specs), 100)
+
+        for i, action_spec in enumerate(action_specs):
+            self.assertEqual(action_spec['input']['item'], i)
+            self.assertDictEqual(action_spec['input']['data'], in_ctx['data'])
+
+        # The current task and item are set on overlays instead of copies of the context.
+        self.assertListEqual(sorted(in_ctx.keys()), ['data', 'xs'])
+
+    def test_render_with_items_by_item_ids(self):
+        wf_def = """
+            version: 1.0
+            description: A basic workflow with items.
+            tasks:
+              task1:
+                with: x, y in <% zip(ctx(xs), ctx(ys)) %>
+                action: core.echo
+                input:
+                  message: <% item(x) + item(y) %>
+        """
+
+        wf_spec = self.instantiate(wf_def)
+        task_spec = wf_spec.tasks.get_task('task1')
+        in_ctx = {'xs': ['a', 'b', 'c'], 'ys': ['1', '2', '3']}
+
+        items = task_spec.get_items(in_ctx)
+        expected_items = [{'x': 'a', 'y': '1'}, {'x': 'b', 'y': '2'}, {'x': 'c', 'y': '3'}]
+        self.assertListEqual(items, expected_items)
+
+        task_spec, action_specs = task_spec.render(in_ctx, items=items, item_ids=[2, 0])
+
+        expected_action_specs = [
+            {'action': 'core.echo', 'input': {'message': 'c3'}, 'item_id': 2},
+            {'action': 'core.echo', 'input': {'message': 'a1'}, 'item_id': 0}
+        ]
+
+        self.assertListEqual(action_specs, expected_action_specs)
+
+    def test_task_spec_read_only(self):
+        wf_def = """
+            version: 1.0
+            description: A basic workflow.
+            tasks:
+              task1:
+                action: core.echo message=<% ctx(message) %>
+        """
+
+        wf_spec = self.instantiate(wf_def)
+        task_spec = wf_spec.tasks.get_task('task1')
+
+        self.assertTrue(task_spec.is_read_only())
+        self.assertEqual(task_spec.action, 'core.echo')
+        self.assertRaises(AttributeError, setattr, task_spec, 'action', 'core.noop')
+        self.assertRaises(AttributeError, setattr, task_spec, 'input', {})
+
+        # Rendering the task spec does not change the task spec.
+        rendered_task_spec, action_specs = task_spec.render({'message': 'foobar'})
+        self.assertIs(rendered_task_spec, task_spec)
+        self.assertDictEqual(action_specs[0]['input'], {'message': 'foobar'})
+        self.assertEqual(task_spec.input, {'message': '<% ctx(message) %>'})
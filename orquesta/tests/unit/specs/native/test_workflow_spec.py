@@ -12,7 +12,10 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import mock
+
 from orquesta.specs import native as native_specs
+from orquesta.specs.native.v1 import models as native_v1_models
 from orquesta.tests.unit.specs.native import base as test_base
 
 
@@ -200,3 +203,30 @@ class WorkflowSpecTest(test_base.OrchestraWorkflowSpecTest):
         self.assertTrue(wf_spec.tasks.in_cycle('task3'))
         self.assertTrue(wf_spec.tasks.in_cycle('task4'))
         self.assertTrue(wf_spec.tasks.in_cycle('task5'))
+
+    def test_task_transitions_traversed_once(self):
+        size = 50
+
+        # Each task transitions to all the tasks after it and the last task loops back.
+        tasks = {}
+
+        for i in range(0, size):
+            next_tasks = ['task%d' % j for j in range(i + 1, size)] or ['task0']
+            tasks['task%d' % i] = {'action': 'core.noop', 'next': [{'do': next_tasks}]}
+
+        wf_spec = native_specs.WorkflowSpec({'version': 1.0, 'tasks': tasks})
+
+        with mock.patch.object(
+                native_v1_models.TaskMappingSpec, 'get_next_tasks',
+                wraps=wf_spec.tasks.get_next_tasks) as mocked:
+            for i in range(0, size):
+                task_name = 'task%d' % i
+                self.assertEqual(wf_spec.tasks.is_split_task(task_name), i > 1)
+                self.assertTrue(wf_spec.tasks.in_cycle(task_name))
+                self.assertEqual(len(wf_spec.tasks.get_prev_tasks(task_name)), max(i, 1))
+
+            self.assertTrue(wf_spec.tasks.has_cycles())
+
+        # The transitions of each task are identified once for the inbound transitions and
+        # once for the cycles regardless of the number of calls.
+        self.assertEqual(mocked.call_count, size * 2)
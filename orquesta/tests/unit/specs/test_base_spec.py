@@ -17,6 +17,7 @@ import six
 import unittest
 
 from orquesta import exceptions as exc
+from orquesta.specs import base as spec_base
 from orquesta.specs import types as spec_types
 from orquesta.tests.unit.specs import base as test_specs
 
@@ -109,6 +110,30 @@ class SpecTest(unittest.TestCase):
 
         self.assertDictEqual(schema, test_specs.MockSpec.get_schema(includes=None))
 
+    def test_get_schema_cached(self):
+        schema = test_specs.MockSpec.get_schema()
+
+        # The schema is merged once and cached on the class.
+        self.assertIs(test_specs.MockSpec._get_schema(), test_specs.MockSpec._get_schema())
+        self.assertIn('_schema_cache', test_specs.MockSpec.__dict__)
+
+        # A copy of the cached schema is returned so changes to it are not cached.
+        schema['properties'].pop('attr1')
+        self.assertIn('attr1', test_specs.MockSpec.get_schema()['properties'])
+        meta_schema = test_specs.MockSpec.get_meta_schema()
+        self.assertIsNot(meta_schema, test_specs.MockSpec._get_meta_schema())
+
+        # The spec instances share the cached schema of the class.
+        spec_obj1 = test_specs.MockSpec({'attr1': 'foobar'})
+        spec_obj2 = test_specs.MockSpec({'attr1': 'fubar'})
+        self.assertIs(spec_obj1._schema, spec_obj2._schema)
+
+        # The cache is kept on each class and not shared with the base class.
+        self.assertIsNot(
+            test_specs.MockBaseSpec.__dict__['_schema_cache'],
+            test_specs.MockSpec.__dict__['_schema_cache']
+        )
+
     def test_instance_schema(self):
         schema = {
             'type': 'object',
@@ -131,6 +156,36 @@ class SpecTest(unittest.TestCase):
 
         self.assertDictEqual(schema, test_specs.MockSpec._schema)
 
+    def test_spec_attribute_dispatch(self):
+        spec = {
+            'attr1': 'foobar',
+            'attr1-1': 'fubar',
+            'attr5': {'attr1': {'attr1': 'wunderbar'}},
+            'attr6': {'task1': {'attr1': {'attr1': 'wunderbar'}}}
+        }
+
+        spec_obj = test_specs.MockSpec(spec)
+
+        # The schema properties are mapped to the spec on the class.
+        self.assertIsInstance(test_specs.MockSpec.__dict__['attr1'], spec_base.SpecProperty)
+        self.assertIsInstance(test_specs.MockSpec.__dict__['attr1_1'], spec_base.SpecProperty)
+        self.assertEqual(spec_obj.attr1, 'foobar')
+        self.assertEqual(spec_obj.attr1_1, 'fubar')
+        self.assertIsNone(spec_obj.attr2)
+        self.assertIsNone(spec_obj.description)
+
+        # The child spec set on the instance takes precedence over the spec property.
+        self.assertIsInstance(spec_obj.attr5, test_specs.MockJointSpec)
+
+        # The attributes that match the pattern properties are resolved once and mapped.
+        self.assertIsInstance(spec_obj.attr6.task1, test_specs.MockJointSpec)
+        self.assertIsNone(getattr(spec_obj.attr6, 'task2'))
+        self.assertEqual(test_specs.MockMappingSpec.__dict__['_attrs']['task2'], 'task2')
+
+        # The attributes that are not mapped to the spec are not found.
+        self.assertRaises(AttributeError, getattr, spec_obj, 'foo-bar')
+        self.assertIsNone(test_specs.MockSpec.__dict__['_attrs']['foo-bar'])
+
     def test_spec_init_arg_none_type(self):
         self.assertRaises(
             ValueError,
@@ -0,0 +1,94 @@
+# Copyright 2019 Extreme Networks, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import copy
+import unittest
+
+from orquesta import conducting
+from orquesta.specs import native as native_specs
+from orquesta.specs import registry as spec_registry
+from orquesta import statuses
+
+
+WF_DEF = """
+version: 1.0
+description: A basic sequential workflow.
+tasks:
+  task1:
+    action: core.noop
+    next:
+      - do: task2
+  task2:
+    action: core.noop
+"""
+
+
+class SpecRegistryTest(unittest.TestCase):
+
+    def setUp(self):
+        super(SpecRegistryTest, self).setUp()
+        spec_registry.clear()
+
+    def tearDown(self):
+        spec_registry.set_size(spec_registry.DEFAULT_REGISTRY_SIZE)
+        spec_registry.clear()
+        super(SpecRegistryTest, self).tearDown()
+
+    def test_deserialize(self):
+        data = native_specs.WorkflowSpec(WF_DEF).serialize()
+
+        spec1 = spec_registry.deserialize(data)
+        spec2 = spec_registry.deserialize(copy.deepcopy(data))
+
+        self.assertIsInstance(spec1, native_specs.WorkflowSpec)
+        self.assertIs(spec1, spec2)
+        self.assertTrue(spec1.is_read_only())
+        fingerprint = native_specs.WorkflowSpec(WF_DEF).get_fingerprint()
+        self.assertEqual(spec1.get_fingerprint(), fingerprint)
+
+        expected = {'size': 500, 'count': 1, 'hits': 1, 'misses': 1, 'evictions': 0}
+        self.assertDictEqual(spec_registry.get_stats(), expected)
+
+    def test_deserialize_does_not_share_data(self):
+        data = native_specs.WorkflowSpec(WF_DEF).serialize()
+        spec = spec_registry.deserialize(data)
+
+        # Changes to the data after deserialization do not alter the registered spec.
+        data['spec']['tasks']['task1']['action'] = 'core.echo'
+        self.assertEqual(spec.tasks.get_task('task1').action, 'core.noop')
+        self.assertIsNot(spec_registry.deserialize(data), spec)
+
+    def test_eviction(self):
+        spec_registry.set_size(1)
+
+        data1 = native_specs.WorkflowSpec(WF_DEF).serialize()
+        data2 = native_specs.WorkflowSpec(WF_DEF.replace('core.noop', 'core.echo')).serialize()
+
+        spec1 = spec_registry.deserialize(data1)
+        spec_registry.deserialize(data2)
+        self.assertIsNot(spec_registry.deserialize(data1), spec1)
+
+        expected = {'size': 1, 'count': 1, 'hits': 0, 'misses': 3, 'evictions': 2}
+        self.assertDictEqual(spec_registry.get_stats(), expected)
+
+    def test_conductor_deserialize(self):
+        conductor = conducting.WorkflowConductor(native_specs.WorkflowSpec(WF_DEF))
+        conductor.request_workflow_status(statuses.RUNNING)
+        data = conductor.serialize()
+
+        conductor1 = conducting.WorkflowConductor.deserialize(copy.deepcopy(data))
+        conductor2 = conducting.WorkflowConductor.deserialize(copy.deepcopy(data))
+
+        self.assertIs(conductor1.spec, conductor2.spec)
+        self.assertDictEqual(conductor1.serialize(), data)
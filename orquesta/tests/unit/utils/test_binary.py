@@ -0,0 +1,114 @@
+# Copyright 2019 Extreme Networks, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+import json
+import unittest
+
+from orquesta import exceptions as exc
+from orquesta.utils import binary as binary_util
+
+
+MOCK_DATA = {
+    'k1': 'abc',
+    'k2': 123,
+    'k3': False,
+    'k4': True,
+    'k5': None,
+    'k6': [1, -3, 5.5, -7.25, 2 ** 70, -2 ** 70],
+    'k7': {'a': 'abc', 'b': u'ünïcödé', 'c': {'d': []}},
+    'k8': [{'id': 'task1', 'route': 0}, {'id': 'task1', 'route': 1}]
+}
+
+
+class BinarySerializationTest(unittest.TestCase):
+
+    def test_dumps_and_loads(self):
+        data = binary_util.dumps(MOCK_DATA)
+
+        self.assertIsInstance(data, bytes)
+        self.assertTrue(data.startswith(binary_util.MAGIC))
+        self.assertDictEqual(binary_util.loads(data), MOCK_DATA)
+
+    def test_dumps_and_loads_compressed(self):
+        data = binary_util.dumps(MOCK_DATA, compress=True)
+
+        self.assertTrue(data.startswith(binary_util.MAGIC))
+        self.assertDictEqual(binary_util.loads(data), MOCK_DATA)
+
+    def test_dumps_tuple_and_non_string_keys(self):
+        value = {'a': (1, 2), 3: 'b'}
+
+        self.assertDictEqual(binary_util.loads(binary_util.dumps(value)), {'a': [1, 2], 3: 'b'})
+
+    def test_dumps_does_not_modify_value(self):
+        value = json.loads(json.dumps(MOCK_DATA))
+        binary_util.dumps(value)
+
+        self.assertDictEqual(value, json.loads(json.dumps(MOCK_DATA)))
+
+    def test_strings_interned(self):
+        value = [{'id': 'task' + str(i % 5), 'status': 'succeeded'} for i in range(100)]
+        data = binary_util.dumps(value)
+
+        self.assertListEqual(binary_util.loads(data), value)
+        self.assertEqual(data.count(b'succeeded'), 1)
+        self.assertEqual(data.count(b'task1'), 1)
+        self.assertLess(len(data), len(json.dumps(value)) / 3)
+
+    def test_dumps_unsupported_type(self):
+        self.assertRaises(TypeError, binary_util.dumps, {'k1': object()})
+
+    def test_loads_not_bytes(self):
+        self.assertRaises(TypeError, binary_util.loads, json.dumps(MOCK_DATA))
+
+    def test_loads_bad_header(self):
+        data = binary_util.dumps(MOCK_DATA)
+
+        self.assertRaises(exc.BinaryFormatError, binary_util.loads, b'')
+        self.assertRaises(exc.BinaryFormatError, binary_util.loads, b'XXXX' + data[4:])
+
+    def test_loads_unsupported_version(self):
+        data = bytearray(binary_util.dumps(MOCK_DATA))
+        data[len(binary_util.MAGIC)] = binary_util.FORMAT_VERSION + 1
+
+        self.assertRaises(exc.BinaryFormatError, binary_util.loads, bytes(data))
+
+    def test_loads_corrupted_data(self):
+        data = binary_util.dumps(MOCK_DATA)
+        compressed = binary_util.dumps(MOCK_DATA, compress=True)
+
+        self.assertRaises(exc.BinaryFormatError, binary_util.loads, data[:-1])
+        self.assertRaises(exc.BinaryFormatError, binary_util.loads, data + b'\x00')
+        self.assertRaises(exc.BinaryFormatError, binary_util.loads, compressed[:-1])
+        self.assertRaises(exc.BinaryFormatError, binary_util.loads, data[:6] + b'\xff')
+
+    def test_shared_values_written_once(self):
+        payload = {'data': list(range(1000, 2000))}
+        value = {'contexts': [{'i': i, 'payload': payload} for i in range(10)]}
+        data = binary_util.dumps(value)
+
+        copied = json.loads(json.dumps(value))
+        copied_data = binary_util.dumps(copied)
+
+        self.assertLess(len(data) * 5, len(copied_data))
+
+        # The decoded values are shared the same way.
+        decoded = binary_util.loads(data)
+        self.assertDictEqual(decoded, value)
+        self.assertIs(decoded['contexts'][0]['payload'], decoded['contexts'][9]['payload'])
+
+        decoded = binary_util.loads(copied_data)
+        self.assertDictEqual(decoded, copied)
+        self.assertIsNot(decoded['contexts'][0]['payload'], decoded['contexts'][9]['payload'])
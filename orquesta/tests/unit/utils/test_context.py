@@ -16,6 +16,7 @@ import copy
 import unittest
 
 from orquesta.utils import context as ctx_util
+from orquesta.utils import dictionary as dict_util
 
 
 class ContextUtilTest(unittest.TestCase):
@@ -27,7 +28,7 @@ class ContextUtilTest(unittest.TestCase):
         context = ctx_util.set_current_task(context, task)
         expected_context = dict([('__current_task', copy.deepcopy(task))] + list(context.items()))
 
-        self.assertDictEqual(context, expected_context)
+        self.assertDictEqual(context.flatten(), expected_context)
 
     def test_set_current_task_with_result(self):
         context = {'var1': 'foobar'}
@@ -36,7 +37,7 @@ class ContextUtilTest(unittest.TestCase):
         context = ctx_util.set_current_task(context, task)
         expected_context = dict([('__current_task', copy.deepcopy(task))] + list(context.items()))
 
-        self.assertDictEqual(context, expected_context)
+        self.assertDictEqual(context.flatten(), expected_context)
 
     def test_set_current_task_nonetype_context(self):
         task = {'id': 't1', 'route': 0}
@@ -44,7 +45,7 @@ class ContextUtilTest(unittest.TestCase):
         context = ctx_util.set_current_task(None, task)
         expected_context = {'__current_task': copy.deepcopy(task)}
 
-        self.assertDictEqual(context, expected_context)
+        self.assertDictEqual(context.flatten(), expected_context)
 
     def test_set_current_task_empty_context(self):
         task = {'id': 't1', 'route': 0}
@@ -52,7 +53,7 @@ class ContextUtilTest(unittest.TestCase):
         context = ctx_util.set_current_task(dict(), task)
         expected_context = {'__current_task': copy.deepcopy(task)}
 
-        self.assertDictEqual(context, expected_context)
+        self.assertDictEqual(context.flatten(), expected_context)
 
     def test_set_current_task_empty_task(self):
         context = {'var1': 'foobar'}
@@ -65,3 +66,212 @@ class ContextUtilTest(unittest.TestCase):
         self.assertRaises(TypeError, ctx_util.set_current_task, 'foobar', task)
 
         self.assertRaises(TypeError, ctx_util.set_current_task, dict(), 'foobar')
+
+    def test_set_current_task_with_layered_context(self):
+        layers = [{'var1': 'foobar', 'var2': {'a': 1}}, {'var2': {'b': 2}}]
+        context = ctx_util.LayeredContext(layers)
+        task = {'id': 't1', 'route': 0}
+
+        context = ctx_util.set_current_task(context, task)
+
+        expected_context = {
+            'var1': 'foobar',
+            'var2': {'a': 1, 'b': 2},
+            '__current_task': task
+        }
+
+        self.assertDictEqual(context.flatten(), expected_context)
+
+        # Ensure the layers are not modified.
+        context['var2']['c'] = 3
+        self.assertDictEqual(layers[0], {'var1': 'foobar', 'var2': {'a': 1}})
+        self.assertDictEqual(layers[1], {'var2': {'b': 2}})
+
+
+class LayeredContextTest(unittest.TestCase):
+
+    def test_resolve(self):
+        layers = [
+            {'a': 1, 'b': {'x': 1, 'y': {'p': 1}}, 'c': {'x': 1}, 'd': [1]},
+            {'b': {'y': {'q': 2}}, 'c': 'foobar', 'e': None},
+            {'a': 3, 'c': {'y': 3}}
+        ]
+
+        ctx = ctx_util.LayeredContext(layers)
+
+        self.assertEqual(ctx['a'], 3)
+        self.assertEqual(ctx['b'], {'x': 1, 'y': {'p': 1, 'q': 2}})
+        self.assertEqual(ctx['c'], {'y': 3})
+        self.assertIs(ctx['c'], layers[2]['c'])
+        self.assertIs(ctx['d'], layers[0]['d'])
+        self.assertIsNone(ctx['e'])
+        self.assertIn('e', ctx)
+        self.assertNotIn('f', ctx)
+        self.assertRaises(KeyError, ctx.__getitem__, 'f')
+        self.assertIsNone(ctx.get('f'))
+        self.assertListEqual(list(ctx.keys()), ['a', 'b', 'c', 'd', 'e'])
+        self.assertEqual(len(ctx), 5)
+
+    def test_flatten_same_as_merge_dicts(self):
+        layers = [
+            {'a': 1, 'b': {'x': 1, 'y': {'p': 1}}, 'c': {'x': 1}, 'd': [1]},
+            {'b': {'y': {'q': 2}}, 'c': 'foobar', 'e': None},
+            {'a': 3, 'c': {'y': 3}}
+        ]
+
+        expected = {}
+
+        for layer in copy.deepcopy(layers):
+            expected = dict_util.merge_dicts(expected, layer, overwrite=True)
+
+        original = copy.deepcopy(layers)
+        ctx = ctx_util.LayeredContext(layers).flatten()
+
+        self.assertDictEqual(ctx, expected)
+        self.assertListEqual(layers, original)
+
+        # The dicts merged from multiple layers are new.
+        ctx['b']['y']['r'] = 3
+        self.assertListEqual(layers, original)
+
+    def test_nested_layers(self):
+        ctx = ctx_util.LayeredContext([
+            ctx_util.LayeredContext([{'a': {'x': 1}}, {'a': {'y': 2}}]),
+            ctx_util.LayeredContext([{'a': {'z': 3}}])
+        ])
+
+        self.assertDictEqual(ctx.flatten(), {'a': {'x': 1, 'y': 2, 'z': 3}})
+        self.assertEqual(ctx['a'], {'x': 1, 'y': 2, 'z': 3})
+
+    def test_empty(self):
+        ctx = ctx_util.LayeredContext()
+
+        self.assertEqual(len(ctx), 0)
+        self.assertDictEqual(ctx.flatten(), {})
+
+
+class ContextOverlayTest(unittest.TestCase):
+
+    def test_overlay(self):
+        base = {'var1': 'foobar', 'var2': {'a': 1}}
+        ctx = ctx_util.ContextOverlay(base, {'__current_item': 'fu'})
+
+        self.assertEqual(ctx['var1'], 'foobar')
+        self.assertEqual(ctx['__current_item'], 'fu')
+        self.assertIs(ctx['var2'], base['var2'])
+        self.assertIn('var2', ctx)
+        self.assertNotIn('var3', ctx)
+        self.assertListEqual(list(ctx.keys()), ['var1', 'var2', '__current_item'])
+        self.assertEqual(len(ctx), 3)
+
+        ctx['var1'] = 'fubar'
+        ctx['var3'] = 'foo'
+        self.assertEqual(ctx['var1'], 'fubar')
+        self.assertEqual(len(ctx), 4)
+
+        del ctx['var3']
+        self.assertNotIn('var3', ctx)
+        self.assertRaises(TypeError, ctx.__delitem__, 'var2')
+
+        # Ensure the base is not modified.
+        self.assertDictEqual(base, {'var1': 'foobar', 'var2': {'a': 1}})
+
+        expected = {'var1': 'fubar', 'var2': {'a': 1}, '__current_item': 'fu'}
+        self.assertDictEqual(ctx.flatten(), expected)
+        self.assertEqual(ctx, expected)
+
+    def test_set_current_item_does_not_copy(self):
+        context = ctx_util.set_current_task({'var1': {'a': 1}}, {'id': 't1', 'route': 0})
+
+        items = [ctx_util.set_current_item(context, i) for i in range(0, 3)]
+
+        for i, item_ctx in enumerate(items):
+            self.assertEqual(item_ctx['__current_item'], i)
+            self.assertEqual(item_ctx['__current_task'], {'id': 't1', 'route': 0})
+            self.assertIs(item_ctx['var1'], context['var1'])
+
+        self.assertNotIn('__current_item', context)
+        self.assertRaises(TypeError, ctx_util.set_current_item, 'foobar', 'fu')
+
+
+class ValueStoreTest(unittest.TestCase):
+
+    def test_intern(self):
+        store = ctx_util.ValueStore()
+
+        value1 = {'a': {'b': [1, 2, {'c': 'foobar'}]}, 'd': 'fubar'}
+        value2 = {'a': {'b': [1, 2, {'c': 'foobar'}]}, 'd': 'fubar'}
+        value3 = {'a': {'b': [1, 2, {'c': 'foobar'}]}, 'd': 'foobar'}
+
+        stored1 = store.intern(value1)
+        stored2 = store.intern(value2)
+        stored3 = store.intern(value3)
+
+        self.assertIs(stored1, value1)
+        self.assertIs(stored2, stored1)
+        self.assertIsNot(stored3, stored1)
+        self.assertDictEqual(stored3, value3)
+
+        # The nested values that are equal are shared.
+        self.assertIs(stored3['a'], stored1['a'])
+        self.assertIs(store.intern({'c': 'foobar'}), stored1['a']['b'][2])
+
+    def test_intern_does_not_modify_value(self):
+        store = ctx_util.ValueStore()
+        store.intern({'a': [1, 2, 3]})
+
+        value = {'a': [1, 2, 3], 'b': 'foobar'}
+        stored = store.intern(value)
+
+        self.assertIsNot(stored, value)
+        self.assertIsNot(value['a'], stored['a'])
+        self.assertDictEqual(stored, value)
+
+    def test_intern_distinguish_types(self):
+        store = ctx_util.ValueStore()
+
+        values = [{'a': True}, {'a': 1}, {'a': 1.0}, {'a': '1'}, {'a': [1]}, {'a': None}]
+
+        for value in values:
+            self.assertIs(store.intern(value), value)
+
+        for value in values:
+            stored = store.intern(dict(value))
+            self.assertIs(stored, value)
+            self.assertIs(type(stored['a']), type(value['a']))
+
+    def test_clear(self):
+        store = ctx_util.ValueStore()
+        store.intern({'a': 'b'})
+        self.assertGreater(len(store), 0)
+
+        store.clear()
+        self.assertEqual(len(store), 0)
+
+    def test_size_bound(self):
+        store = ctx_util.ValueStore(size=3)
+        self.assertEqual(store.size, 3)
+
+        value1 = {'a': 'foo'}
+        value2 = {'b': 'bar'}
+
+        self.assertIs(store.intern(value1), value1)
+        self.assertIs(store.intern(value2), value2)
+        self.assertEqual(len(store), 3)
+
+        # The values interned least recently are evicted and are no longer shared.
+        self.assertIs(store.intern(dict(value2)), value2)
+        self.assertEqual(len(store), 3)
+
+        stored = store.intern(dict(value1))
+        self.assertIsNot(stored, value1)
+        self.assertDictEqual(stored, value1)
+
+        # The values are not stored if the size is zero.
+        store = ctx_util.ValueStore(size=0)
+        value = {'a': 'foo'}
+        self.assertIs(store.intern(value), value)
+        self.assertIsNot(store.intern(dict(value)), value)
+        self.assertEqual(len(store), 0)
+
+        self.assertRaises(ValueError, ctx_util.ValueStore, size=-1)
@@ -0,0 +1,508 @@
+# Copyright 2019 Extreme Networks, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import argparse
+import copy
+import json
+import logging
+import math
+import multiprocessing
+import os
+import random
+import sys
+import timeit
+
+import six
+import yaml
+
+from orquesta import conducting
+from orquesta import events
+from orquesta.specs import loader as spec_loader
+from orquesta import statuses
+
+try:
+    import resource
+except ImportError:
+    resource = None
+
+
+LOG = logging.getLogger(__name__)
+
+DEFAULT_CATALOG = 'native'
+DEFAULT_EXECUTIONS = 100
+DEFAULT_MAX_EVENTS = 10000
+
+SERIALIZATION_NONE = 'none'
+SERIALIZATION_DICT = 'dict'
+SERIALIZATION_BINARY = 'binary'
+
+SERIALIZATION_MODES = [
+    SERIALIZATION_NONE,
+    SERIALIZATION_DICT,
+    SERIALIZATION_BINARY
+]
+
+WORKFLOW_FILE_EXTS = ['.yaml', '.yml']
+
+
+class SimulatedActionExecutor(object):
+
+    def __init__(self, failure_rate=0.0, seed=None):
+        if failure_rate < 0.0 or failure_rate > 1.0:
+            raise ValueError('The failure rate must be between 0 and 1.')
+
+        self.failure_rate = failure_rate
+        self._random = random.Random(seed)
+
+    def execute(self, task_id, route, action):
+        # The action is not run. The action execution fails at the given rate and the
+        # result is the rendered input of the action so the expressions in the workflow
+        # that reference the result have a value.
+        failed = self.failure_rate > 0.0 and self._random.random() < self.failure_rate
+        status = statuses.FAILED if failed else statuses.SUCCEEDED
+
+        return status, action.get('input')
+
+
+def get_workflow_catalog(path, default=DEFAULT_CATALOG):
+    # The catalog is identified by the name of the directory of the workflow definition,
+    # such as in the test fixtures, and defaults to the native catalog.
+    name = os.path.basename(os.path.dirname(os.path.abspath(path)))
+
+    try:
+        spec_loader.get_spec_module(name)
+    except ImportError:
+        return default
+
+    return name
+
+
+def find_workflows(paths):
+    files = []
+
+    for path in paths:
+        if not os.path.isdir(path):
+            files.append(path)
+            continue
+
+        for root, dirs, names in os.walk(path):
+            dirs.sort()
+
+            for name in sorted(names):
+                if os.path.splitext(name)[1] in WORKFLOW_FILE_EXTS:
+                    files.append(os.path.join(root, name))
+
+    return files
+
+
+def load_workflows(paths, catalog=None, skipped=None):
+    workflows = []
+
+    for path in find_workflows(paths):
+        with open(path, 'r') as f:
+            wf_def = f.read()
+
+        workflow = {
+            'name': path,
+            'catalog': catalog or get_workflow_catalog(path),
+            'definition': wf_def
+        }
+
+        # The workflow definitions that cannot be instantiated for the catalog, such as the
+        # definitions in other formats under the test fixtures, are skipped and not run.
+        try:
+            instantiate(workflow)
+        except Exception as e:
+            message = 'The workflow definition is not supported by the "%s" catalog. %s' % (
+                workflow['catalog'],
+                ' '.join(str(e).split())
+            )
+
+            LOG.info('Skipping workflow "%s". %s', path, message)
+
+            if skipped is not None:
+                skipped[path] = message
+
+            continue
+
+        workflows.append(workflow)
+
+    return workflows
+
+
+def instantiate(workflow):
+    spec_module = spec_loader.get_spec_module(workflow['catalog'])
+    wf_def = workflow['definition']
+
+    # The definition is parsed here since the spec modules of some catalogs only take the
+    # definition as dict. The parsed definition may be modified by the spec module.
+    if isinstance(wf_def, six.string_types):
+        wf_def = yaml.safe_load(wf_def)
+
+    return spec_module.instantiate(copy.deepcopy(wf_def))
+
+
+def _restore(conductor, serialization):
+    # Mock the async execution of the actions by restoring the conductor from the
+    # serialized conductor like an engine that persists the conductor between events.
+    if serialization == SERIALIZATION_DICT:
+        return conducting.WorkflowConductor.deserialize(conductor.serialize())
+
+    if serialization == SERIALIZATION_BINARY:
+        return conducting.WorkflowConductor.deserialize_binary(conductor.serialize_binary())
+
+    return conductor
+
+
+def run_workflow(spec, executor=None, inputs=None, serialization=SERIALIZATION_NONE,
+                 max_events=DEFAULT_MAX_EVENTS, latencies=None):
+    if serialization not in SERIALIZATION_MODES:
+        raise ValueError('The serialization mode "%s" is not supported.' % serialization)
+
+    executor = executor or SimulatedActionExecutor()
+    timer = timeit.default_timer
+    event_count = 0
+
+    conductor = conducting.WorkflowConductor(spec, inputs=inputs)
+    conductor.request_workflow_status(statuses.RUNNING)
+    next_tasks = conductor.get_next_tasks()
+
+    while next_tasks:
+        conductor = _restore(conductor, serialization)
+        task_events = []
+
+        for task in next_tasks:
+            task_id = task['id']
+            route = task['route']
+            actions = task['actions']
+
+            # The task without action and the with items task with empty items are
+            # completed without running any action.
+            if not actions:
+                task_events.append((task_id, route, statuses.RUNNING, None, None))
+                task_events.append((task_id, route, statuses.SUCCEEDED, None, None))
+                continue
+
+            # The actions for the task or the items of the task are all running
+            # before any of the actions completes.
+            for action in actions:
+                ctx = {'item_id': action['item_id']} if 'item_id' in action else None
+                task_events.append((task_id, route, statuses.RUNNING, None, ctx))
+
+            for action in actions:
+                ctx = {'item_id': action['item_id']} if 'item_id' in action else None
+                status, result = executor.execute(task_id, route, action)
+                task_events.append((task_id, route, status, result, ctx))
+
+        for task_id, route, status, result, ctx in task_events:
+            if event_count >= max_events:
+                raise RuntimeError(
+                    'The workflow execution exceeded the maximum of %s events.' % max_events
+                )
+
+            ac_ex_event = events.ActionExecutionEvent(status, result=result, context=ctx)
+
+            start = timer()
+            conductor.update_task_state(task_id, route, ac_ex_event)
+
+            if latencies is not None:
+                latencies.append(timer() - start)
+
+            event_count += 1
+
+        next_tasks = conductor.get_next_tasks()
+
+    return conductor.get_workflow_status(), event_count
+
+
+def get_peak_rss():
+    # Return the peak resident set size of the process in bytes if supported.
+    if resource is None:
+        return None
+
+    peak_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+    # The peak resident set size is in kilobytes on Linux and in bytes on macOS.
+    return peak_rss if sys.platform == 'darwin' else peak_rss * 1024
+
+
+def _run_job(job):
+    workflows, start, count, options = job
+    specs = {}
+    seed = options.get('seed')
+
+    executor = SimulatedActionExecutor(
+        failure_rate=options.get('failure_rate', 0.0),
+        seed=(seed + start) if seed is not None else None
+    )
+
+    result = {
+        'executions': 0,
+        'events': 0,
+        'statuses': {},
+        'errors': {},
+        'latencies': [],
+        'peak_rss': None
+    }
+
+    # The executions are distributed to the workflows in round robin.
+    for i in range(start, start + count):
+        workflow = workflows[i % len(workflows)]
+
+        try:
+            # The spec is instantiated once per workflow for the job.
+            if workflow['name'] not in specs:
+                specs[workflow['name']] = instantiate(workflow)
+
+            status, event_count = run_workflow(
+                specs[workflow['name']],
+                executor=executor,
+                inputs=options.get('inputs'),
+                serialization=options.get('serialization', SERIALIZATION_NONE),
+                max_events=options.get('max_events', DEFAULT_MAX_EVENTS),
+                latencies=result['latencies']
+            )
+        except Exception as e:
+            status, event_count = 'error', 0
+            result['errors'][workflow['name']] = str(e)
+
+        result['executions'] += 1
+        result['events'] += event_count
+        result['statuses'][status] = result['statuses'].get(status, 0) + 1
+
+    result['peak_rss'] = get_peak_rss()
+
+    return result
+
+
+def get_percentile(values, percentile):
+    # Return the percentile of the sorted values using the nearest rank method.
+    if not values:
+        return None
+
+    rank = int(math.ceil(percentile / 100.0 * len(values)))
+
+    return values[max(rank, 1) - 1]
+
+
+def run(workflows, executions=DEFAULT_EXECUTIONS, processes=None, chunk_size=None,
+        failure_rate=0.0, seed=None, inputs=None, serialization=SERIALIZATION_NONE,
+        max_events=DEFAULT_MAX_EVENTS):
+
+    if not workflows:
+        raise ValueError('There are no workflows to run.')
+
+    if executions < 1:
+        raise ValueError('The number of executions must be greater than zero.')
+
+    if processes is None:
+        processes = multiprocessing.cpu_count()
+
+    if processes < 0:
+        raise ValueError('The number of processes cannot be negative.')
+
+    if not chunk_size:
+        chunk_size = int(math.ceil(float(executions) / (max(processes, 1) * 4)))
+
+    options = {
+        'failure_rate': failure_rate,
+        'seed': seed,
+        'inputs': inputs,
+        'serialization': serialization,
+        'max_events': max_events
+    }
+
+    jobs = [
+        (workflows, start, min(chunk_size, executions - start), options)
+        for start in range(0, executions, chunk_size)
+    ]
+
+    timer = timeit.default_timer
+    start = timer()
+
+    # If the number of processes is zero, then the jobs are run in this process.
+    if processes == 0:
+        results = [_run_job(job) for job in jobs]
+    else:
+        pool = multiprocessing.Pool(processes)
+
+        try:
+            results = pool.map(_run_job, jobs)
+        finally:
+            pool.close()
+            pool.join()
+
+    elapsed = timer() - start
+
+    report = {
+        'workflows': len(workflows),
+        'processes': processes,
+        'executions': 0,
+        'events': 0,
+        'elapsed': elapsed,
+        'statuses': {},
+        'errors': {},
+        'peak_rss': None
+    }
+
+    latencies = []
+
+    for result in results:
+        report['executions'] += result['executions']
+        report['events'] += result['events']
+        report['errors'].update(result['errors'])
+        latencies.extend(result['latencies'])
+
+        for status, count in six.iteritems(result['statuses']):
+            report['statuses'][status] = report['statuses'].get(status, 0) + count
+
+        if result['peak_rss'] is not None:
+            report['peak_rss'] = max(report['peak_rss'] or 0, result['peak_rss'])
+
+    latencies.sort()
+
+    report['executions_per_sec'] = report['executions'] / elapsed if elapsed else None
+    report['events_per_sec'] = report['events'] / elapsed if elapsed else None
+    report['latency_p50'] = get_percentile(latencies, 50)
+    report['latency_p99'] = get_percentile(latencies, 99)
+
+    return report
+
+
+def format_report(report):
+    def format_value(value, fmt, scale=1):
+        return fmt % (value * scale) if value is not None else 'n/a'
+
+    lines = [
+        'workflows: %s' % report['workflows'],
+        'processes: %s' % report['processes'],
+        'executions: %s' % report['executions'],
+        'events: %s' % report['events'],
+        'elapsed: %s' % format_value(report['elapsed'], '%.3f s'),
+        'executions/sec: %s' % format_value(report['executions_per_sec'], '%.2f'),
+        'events/sec: %s' % format_value(report['events_per_sec'], '%.2f'),
+        'event latency p50: %s' % format_value(report['latency_p50'], '%.3f ms', 1000),
+        'event latency p99: %s' % format_value(report['latency_p99'], '%.3f ms', 1000),
+        'peak rss: %s' % format_value(report['peak_rss'], '%.1f MB', 1.0 / (1024 * 1024))
+    ]
+
+    for status, count in sorted(report['statuses'].items()):
+        lines.append('status %s: %s' % (status, count))
+
+    for name, error in sorted(report['errors'].items()):
+        lines.append('error %s: %s' % (name, error))
+
+    for name, message in sorted(report.get('skipped', {}).items()):
+        lines.append('skipped %s: %s' % (name, message))
+
+    return '\n'.join(lines)
+
+
+def get_parser():
+    parser = argparse.ArgumentParser(
+        description='Measure the throughput of conducting workflow executions.'
+    )
+
+    parser.add_argument(
+        'paths', nargs='+',
+        help='Workflow definition files or directories of workflow definition files.'
+    )
+
+    parser.add_argument(
+        '--catalog', default=None,
+        help='Catalog of the workflow definitions. Identified by the directory if not set.'
+    )
+
+    parser.add_argument(
+        '-n', '--executions', type=int, default=DEFAULT_EXECUTIONS,
+        help='Number of workflow executions to run. (default: %(default)s)'
+    )
+
+    parser.add_argument(
+        '-p', '--processes', type=int, default=None,
+        help='Number of worker processes. Zero runs in this process. (default: number of CPUs)'
+    )
+
+    parser.add_argument(
+        '--chunk-size', type=int, default=None,
+        help='Number of workflow executions that are sent to a worker process at a time.'
+    )
+
+    parser.add_argument(
+        '--failure-rate', type=float, default=0.0,
+        help='Rate between 0 and 1 of the simulated action executions that fail.'
+    )
+
+    parser.add_argument(
+        '--seed', type=int, default=None,
+        help='Seed for the simulated action execution failures.'
+    )
+
+    parser.add_argument(
+        '--input', dest='inputs', default=None,
+        help='Workflow input as a JSON object.'
+    )
+
+    parser.add_argument(
+        '--serialization', choices=SERIALIZATION_MODES, default=SERIALIZATION_NONE,
+        help='Serialize and restore the conductor between tasks. (default: %(default)s)'
+    )
+
+    parser.add_argument(
+        '--max-events', type=int, default=DEFAULT_MAX_EVENTS,
+        help='Maximum number of events for a workflow execution. (default: %(default)s)'
+    )
+
+    parser.add_argument(
+        '--json', action='store_true',
+        help='Print the report as JSON.'
+    )
+
+    return parser
+
+
+def main(argv=None):
+    args = get_parser().parse_args(argv)
+    skipped = {}
+    workflows = load_workflows(args.paths, catalog=args.catalog, skipped=skipped)
+
+    if not workflows:
+        for name, message in sorted(skipped.items()):
+            sys.stderr.write('skipped %s: %s\n' % (name, message))
+
+        sys.stderr.write('There are no supported workflows to run.\n')
+
+        return 1
+
+    report = run(
+        workflows,
+        executions=args.executions,
+        processes=args.processes,
+        chunk_size=args.chunk_size,
+        failure_rate=args.failure_rate,
+        seed=args.seed,
+        inputs=json.loads(args.inputs) if args.inputs else None,
+        serialization=args.serialization,
+        max_events=args.max_events
+    )
+
+    report['skipped'] = skipped
+
+    print(json.dumps(report, indent=4, sort_keys=True) if args.json else format_report(report))
+
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,299 @@
+# Copyright 2019 Extreme Networks, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+import collections
+import logging
+import struct
+import zlib
+
+import six
+
+from orquesta import exceptions as exc
+
+
+LOG = logging.getLogger(__name__)
+
+# The binary format starts with a header that identifies the format, the version of the
+# format, and the flags for the encoding of the payload. The payload is the encoded value.
+MAGIC = b'ORQB'
+FORMAT_VERSION = 1
+HEADER_SIZE = len(MAGIC) + 2
+
+FLAG_COMPRESSED = 0x01
+
+# The type tags of the encoded values.
+TAG_NONE = 0x00
+TAG_TRUE = 0x01
+TAG_FALSE = 0x02
+TAG_INT = 0x03
+TAG_NEG_INT = 0x04
+TAG_FLOAT = 0x05
+TAG_STR = 0x06
+TAG_STR_REF = 0x07
+TAG_LIST = 0x08
+TAG_DICT = 0x09
+TAG_REF = 0x0a
+
+_FLOAT_STRUCT = struct.Struct('>d')
+
+
+_TEXT_TYPE = six.text_type
+_INT_TYPES = six.integer_types
+
+
+def dumps(value, compress=False):
+    # The value is read as is and not copied. It must contain only dicts, lists, tuples,
+    # strings, numbers, booleans, and None. The encoder uses local functions and checks the
+    # exact type first for the common types since the workflow state has many small values.
+    buf = bytearray(MAGIC)
+    buf.append(FORMAT_VERSION)
+    buf.append(FLAG_COMPRESSED if compress else 0)
+    append = buf.append
+
+    # The strings such as task ids, routes, and statuses are repeated throughout the
+    # workflow state. Each distinct string is written once and then referenced by the
+    # index in the order the strings are first written.
+    strings = {}
+
+    # The dicts and lists that are shared such as the values in the contexts of the
+    # workflow state are written once and then referenced by the index in the order the
+    # dicts and lists are first written. The decoded dicts and lists are shared the same
+    # way. The temporary values converted from other types are kept so the identities are
+    # not reused while encoding.
+    objects = {}
+    temporaries = []
+
+    def write_uint(n):
+        while n > 0x7f:
+            append((n & 0x7f) | 0x80)
+            n >>= 7
+
+        append(n)
+
+    def encode_str(value):
+        idx = strings.get(value)
+
+        if idx is not None:
+            append(TAG_STR_REF)
+            write_uint(idx)
+            return
+
+        strings[value] = len(strings)
+        data = value.encode('utf-8') if type(value) is _TEXT_TYPE else value
+        append(TAG_STR)
+        write_uint(len(data))
+        buf.extend(data)
+
+    def encode_ref(value):
+        idx = objects.get(id(value))
+
+        if idx is not None:
+            append(TAG_REF)
+            write_uint(idx)
+            return True
+
+        objects[id(value)] = len(objects)
+
+        return False
+
+    def encode(value):
+        value_type = type(value)
+
+        if value_type is dict:
+            if encode_ref(value):
+                return
+
+            append(TAG_DICT)
+            write_uint(len(value))
+
+            for k, v in value.items():
+                if type(k) is _TEXT_TYPE:
+                    encode_str(k)
+                else:
+                    encode(k)
+
+                encode(v)
+        elif value_type is _TEXT_TYPE:
+            encode_str(value)
+        elif value_type is list or value_type is tuple:
+            if encode_ref(value):
+                return
+
+            append(TAG_LIST)
+            write_uint(len(value))
+
+            for v in value:
+                encode(v)
+        elif value is None:
+            append(TAG_NONE)
+        elif value is True:
+            append(TAG_TRUE)
+        elif value is False:
+            append(TAG_FALSE)
+        elif isinstance(value, _INT_TYPES):
+            if value >= 0:
+                append(TAG_INT)
+                write_uint(value)
+            else:
+                append(TAG_NEG_INT)
+                write_uint(-value - 1)
+        elif isinstance(value, float):
+            append(TAG_FLOAT)
+            buf.extend(_FLOAT_STRUCT.pack(value))
+        elif isinstance(value, six.string_types):
+            encode_str(value)
+        elif isinstance(value, collections.Mapping):
+            temporaries.append(dict(value))
+            encode(temporaries[-1])
+        elif isinstance(value, (list, tuple)):
+            temporaries.append(list(value))
+            encode(temporaries[-1])
+        else:
+            raise TypeError('The value of type "%s" is not supported.' % value_type.__name__)
+
+    encode(value)
+
+    if not compress:
+        return bytes(buf)
+
+    return bytes(buf[:HEADER_SIZE]) + zlib.compress(bytes(buf[HEADER_SIZE:]))
+
+
+def loads(data):
+    if not isinstance(data, (six.binary_type, bytearray)):
+        raise TypeError('The data is not type of bytes.')
+
+    if len(data) < HEADER_SIZE or data[:len(MAGIC)] != MAGIC:
+        raise exc.BinaryFormatError('The data is not in the binary format.')
+
+    header = bytearray(data[:HEADER_SIZE])
+    version, flags = header[len(MAGIC)], header[len(MAGIC) + 1]
+
+    if version != FORMAT_VERSION:
+        msg = 'The version "%s" of the binary format is not supported.'
+        raise exc.BinaryFormatError(msg % version)
+
+    payload = data[HEADER_SIZE:]
+
+    if flags & FLAG_COMPRESSED:
+        try:
+            payload = zlib.decompress(payload)
+        except zlib.error as e:
+            raise exc.BinaryFormatError('Unable to decompress the data. %s' % str(e))
+
+    buf = bytearray(payload)
+    strings = []
+    objects = []
+
+    # The position is passed along and returned with the value instead of kept in an
+    # object since the local functions cannot rebind variables of the enclosing function
+    # on python 2.
+    def read_uint(pos):
+        n = buf[pos]
+        pos += 1
+
+        if n < 0x80:
+            return n, pos
+
+        n &= 0x7f
+        shift = 7
+
+        while True:
+            b = buf[pos]
+            pos += 1
+            n |= (b & 0x7f) << shift
+
+            if b < 0x80:
+                return n, pos
+
+            shift += 7
+
+    def decode(pos):
+        tag = buf[pos]
+        pos += 1
+
+        if tag == TAG_STR_REF:
+            idx, pos = read_uint(pos)
+            return strings[idx], pos
+
+        if tag == TAG_STR:
+            length, pos = read_uint(pos)
+            end = pos + length
+
+            if end > len(buf):
+                raise exc.BinaryFormatError('The string exceeds the end of the data.')
+
+            value = buf[pos:end].decode('utf-8')
+            strings.append(value)
+
+            return value, end
+
+        if tag == TAG_REF:
+            idx, pos = read_uint(pos)
+            return objects[idx], pos
+
+        if tag == TAG_DICT:
+            length, pos = read_uint(pos)
+            value = {}
+            objects.append(value)
+
+            for _ in range(length):
+                k, pos = decode(pos)
+                value[k], pos = decode(pos)
+
+            return value, pos
+
+        if tag == TAG_LIST:
+            length, pos = read_uint(pos)
+            value = []
+            objects.append(value)
+
+            for _ in range(length):
+                v, pos = decode(pos)
+                value.append(v)
+
+            return value, pos
+
+        if tag == TAG_INT:
+            return read_uint(pos)
+
+        if tag == TAG_NEG_INT:
+            n, pos = read_uint(pos)
+            return -n - 1, pos
+
+        if tag == TAG_NONE:
+            return None, pos
+
+        if tag == TAG_TRUE:
+            return True, pos
+
+        if tag == TAG_FALSE:
+            return False, pos
+
+        if tag == TAG_FLOAT:
+            end = pos + _FLOAT_STRUCT.size
+            return _FLOAT_STRUCT.unpack(bytes(buf[pos:end]))[0], end
+
+        raise exc.BinaryFormatError('The type tag "%s" is not supported.' % tag)
+
+    try:
+        value, pos = decode(0)
+    except (IndexError, struct.error):
+        raise exc.BinaryFormatError('The data is truncated.')
+
+    if pos != len(buf):
+        raise exc.BinaryFormatError('The data has unexpected bytes after the value.')
+
+    return value
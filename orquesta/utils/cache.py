@@ -0,0 +1,106 @@
+# Copyright 2019 Extreme Networks, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import collections
+import logging
+import threading
+
+
+LOG = logging.getLogger(__name__)
+
+
+class LRUCache(object):
+
+    def __init__(self, size):
+        # The entries are kept in the order of last use so the least recently used
+        # entry is evicted first when the cache is full. A cache size of zero disables
+        # caching. The cache is shared by the threads in the process and the entries
+        # are read and changed while holding the lock.
+        self._entries = collections.OrderedDict()
+        self._lock = threading.RLock()
+        self._size = size
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def __len__(self):
+        return len(self._entries)
+
+    def __contains__(self, key):
+        return key in self._entries
+
+    def peek(self, key):
+        # Return the entry if cached without affecting the order of use and the stats.
+        return self._entries.get(key)
+
+    @property
+    def size(self):
+        return self._size
+
+    def resize(self, size):
+        if size < 0:
+            raise ValueError('The size of the cache cannot be negative.')
+
+        with self._lock:
+            self._size = size
+            self._evict()
+
+    def _evict(self):
+        while len(self._entries) > self._size:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+
+    def get(self, key, load_func):
+        with self._lock:
+            if key in self._entries:
+                value = self._entries.pop(key)
+                self._entries[key] = value
+                self.hits += 1
+
+                return value
+
+        # The value is loaded without holding the lock so a slow load does not block the
+        # other threads and the load can use other caches.
+        value = load_func(key)
+
+        with self._lock:
+            self.misses += 1
+
+            # If another thread loaded the same key in the meantime, then return the cached
+            # value so the callers share the same value.
+            if key in self._entries:
+                value = self._entries.pop(key)
+
+            if self._size > 0:
+                self._entries[key] = value
+                self._evict()
+
+        return value
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+            self.evictions = 0
+
+    def get_stats(self):
+        with self._lock:
+            return {
+                'size': self._size,
+                'count': len(self._entries),
+                'hits': self.hits,
+                'misses': self.misses,
+                'evictions': self.evictions
+            }
@@ -12,15 +12,224 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-import copy
+import collections
 import logging
 
+import six
+
 
 LOG = logging.getLogger(__name__)
 
+DEFAULT_VALUE_STORE_SIZE = 10000
+
+
+class LayeredContext(collections.Mapping):
+
+    def __init__(self, layers=None):
+        # The layers are in the order of precedence from lowest to highest. A key resolves
+        # to the value from the highest layer. If the value is a mapping, then it is merged
+        # with the mappings for the same key in the layers below until a layer where the
+        # value is not a mapping. This is the same result as merging the layers in order
+        # using merge_dicts but without copying or modifying the layers.
+        self.layers = layers or []
+
+    def __getitem__(self, key):
+        values = []
+
+        for layer in reversed(self.layers):
+            if key not in layer:
+                continue
+
+            value = layer[key]
+
+            if not isinstance(value, collections.Mapping):
+                if not values:
+                    return value
+
+                break
+
+            values.append(value)
+
+        if not values:
+            raise KeyError(key)
+
+        if len(values) == 1:
+            return values[0]
+
+        return LayeredContext(list(reversed(values)))
+
+    def __contains__(self, key):
+        return any(key in layer for layer in self.layers)
+
+    def __iter__(self):
+        keys = set()
+
+        for layer in self.layers:
+            for key in layer:
+                if key not in keys:
+                    keys.add(key)
+                    yield key
+
+    def __len__(self):
+        return len(set(key for layer in self.layers for key in layer))
+
+    def __repr__(self):
+        return repr(self.flatten())
+
+    def flatten(self):
+        # Only the mappings that are merged from multiple layers are new dicts. Other values
+        # are shared with the layers.
+        ctx = {}
+
+        for key in self:
+            value = self[key]
+            ctx[key] = value.flatten() if isinstance(value, LayeredContext) else value
+
+        return ctx
+
+
+class ContextOverlay(collections.MutableMapping):
+
+    def __init__(self, base=None, overlay=None):
+        # The base context is shared and not modified. Keys that are set on this context,
+        # such as the reserved keys for the current task and item, are kept in the overlay
+        # and take precedence over the keys in the base context.
+        self.base = base if base is not None else {}
+        self.overlay = overlay or {}
+
+    def __getitem__(self, key):
+        if key in self.overlay:
+            return self.overlay[key]
+
+        return self.base[key]
+
+    def __setitem__(self, key, value):
+        self.overlay[key] = value
+
+    def __delitem__(self, key):
+        if key in self.base:
+            raise TypeError('The key "%s" in the base context cannot be deleted.' % key)
+
+        del self.overlay[key]
+
+    def __contains__(self, key):
+        return key in self.overlay or key in self.base
+
+    def __iter__(self):
+        for key in self.base:
+            yield key
+
+        for key in self.overlay:
+            if key not in self.base:
+                yield key
+
+    def __len__(self):
+        return len(self.base) + len([k for k in self.overlay if k not in self.base])
+
+    def __repr__(self):
+        return repr(self.flatten())
+
+    def flatten(self):
+        ctx = self.base.flatten() if hasattr(self.base, 'flatten') else dict(self.base)
+        ctx.update(self.overlay)
+
+        return ctx
+
+
+class ValueStore(object):
+
+    def __init__(self, size=DEFAULT_VALUE_STORE_SIZE):
+        # The values are stored by content. A value that is equal to a stored value is
+        # replaced with the stored value so the contexts that publish the same values share
+        # the values instead of holding copies. The dicts and lists are identified by their
+        # items and the identity of the stored values of the items. The stored values must
+        # not be modified.
+        #
+        # The number of stored values is bounded and the least recently interned value is
+        # evicted first. An evicted value is not shared with the values interned after it
+        # is evicted. The key of a stored value only refers to the identity of the values
+        # it contains so the key is never matched by a value that is not equal.
+        if size < 0:
+            raise ValueError('The size of the value store cannot be negative.')
+
+        self._size = size
+        self._values = collections.OrderedDict()
+
+    def __len__(self):
+        return len(self._values)
+
+    @property
+    def size(self):
+        return self._size
+
+    def _store(self, key, value):
+        if key in self._values:
+            stored = self._values.pop(key)
+        else:
+            stored = value
+
+        if self._size > 0:
+            self._values[key] = stored
+
+            while len(self._values) > self._size:
+                self._values.popitem(last=False)
+
+        return stored
+
+    def _intern(self, value):
+        value_type = type(value)
+
+        if value_type is dict:
+            items = {}
+            keys = []
+            changed = False
+
+            for k, v in six.iteritems(value):
+                stored_v, v_key = self._intern(v)
+                items[k] = stored_v
+                keys.append((k, v_key))
+                changed = changed or stored_v is not v
+
+            key = (dict, frozenset(keys))
+            value = items if changed else value
+        elif value_type is list:
+            items = []
+            keys = []
+            changed = False
+
+            for v in value:
+                stored_v, v_key = self._intern(v)
+                items.append(stored_v)
+                keys.append(v_key)
+                changed = changed or stored_v is not v
+
+            key = (list, tuple(keys))
+            value = items if changed else value
+        elif value_type in (six.text_type, six.binary_type):
+            key = (value_type, value)
+        elif value is None or value_type in (bool, float) or value_type in six.integer_types:
+            # The scalars other than strings are small and not stored. The type is part of
+            # the key since values such as True, 1, and 1.0 are equal.
+            return value, (value_type, value)
+        else:
+            # Other types are stored by identity.
+            key = (object, id(value))
+
+        stored = self._store(key, value)
+
+        # The stored value is referred to by identity in the keys of the dicts and lists
+        # that contain the value.
+        return stored, (id, id(stored))
+
+    def intern(self, value):
+        return self._intern(value)[0]
+
+    def clear(self):
+        self._values.clear()
+
 
 def set_current_task(context, task):
-    if context and not isinstance(context, dict):
+    if context and not isinstance(context, collections.Mapping):
         raise TypeError('The context is not type of dict.')
 
     if not task:
@@ -29,24 +238,24 @@ def set_current_task(context, task):
     if not isinstance(task, dict):
         raise TypeError('The task is not type of dict.')
 
-    ctx = copy.deepcopy(context) if context else dict()
+    # Nested mappings in a layered context are merged from multiple layers on access
+    # and so the context is flattened for the expressions to resolve plain dicts.
+    if isinstance(context, LayeredContext):
+        context = context.flatten()
 
-    ctx['__current_task'] = {
+    current_task = {
         'id': task.get('id'),
         'route': task.get('route')
     }
 
     if 'result' in task:
-        ctx['__current_task']['result'] = task.get('result')
+        current_task['result'] = task.get('result')
 
-    return ctx
+    return ContextOverlay(context, {'__current_task': current_task})
 
 
 def set_current_item(context, item):
-    if context and not isinstance(context, dict):
+    if context and not isinstance(context, collections.Mapping):
         raise TypeError('The context is not type of dict.')
 
-    ctx = copy.deepcopy(context) if context else dict()
-    ctx['__current_item'] = item
-
-    return ctx
+    return ContextOverlay(context, {'__current_item': item})
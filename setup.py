@@ -65,6 +65,13 @@ setup(
         'Programming Language :: Python :: 3.6'
     ],
     entry_points={
+        'console_scripts': [
+            'orquesta-throughput = orquesta.throughput:main'
+        ],
+        'orquesta.blobstores': [
+            'local = orquesta.blobstores.local:LocalDirectoryBlobStore',
+            'memory = orquesta.blobstores.memory:MemoryBlobStore'
+        ],
         'orquesta.composers': [
             'native = orquesta.composers.native:WorkflowComposer',
             'mistral = orquesta.composers.mistral:WorkflowComposer',